@@ -22,14 +22,79 @@ which are essential for running the GH action.
 import logging
 import os
 
+from typing import NamedTuple
+
 from living_doc_utilities.github.utils import get_action_input
 from living_doc_utilities.inputs.action_inputs import BaseActionInputs
 
-from utils.constants import REPORT_PAGE, RELEASE, SOURCE, VERBOSE_LOGGING, STRUCTURED_OUTPUT
+from utils.constants import (
+    REPORT_PAGE,
+    REPORT_JSON,
+    RELEASE,
+    SOURCE,
+    VERBOSE_LOGGING,
+    STRUCTURED_OUTPUT,
+    PARALLEL_MODE,
+    PARALLEL_WORKERS,
+    PARALLEL_MODE_OFF,
+    INCREMENTAL,
+    STREAMING,
+    SUPPORTED_PARALLEL_MODES,
+    PROFILING,
+    PROFILING_MODE_OFF,
+    SUPPORTED_PROFILING_MODES,
+    ARCHIVE,
+    ARCHIVE_FORMAT_OFF,
+    SUPPORTED_ARCHIVE_FORMATS,
+    SHARD_INDEX,
+    SHARD_COUNT,
+    SHARD_MERGE,
+    INDEX_SORT,
+    INDEX_PAGE_SIZE,
+    SUPPORTED_INDEX_SORT_COLUMNS,
+    SEARCH_INDEX,
+    RELEASE_LABELS,
+    ISSUE_FILTER,
+)
+from utils.filter_expression import compile_filter_expression
 
 logger = logging.getLogger(__name__)
 
 
+class ActionConfiguration(NamedTuple):
+    """
+    An immutable snapshot of the action inputs. It is resolved once per run, so the generation
+    code does not read the environment again.
+    """
+
+    source: str = ""
+    release_filtering_enabled: bool = False
+    release_labels: tuple[str, ...] = ()
+    structured_output_enabled: bool = False
+    report_page_enabled: bool = False
+    report_json_enabled: bool = False
+    incremental_generation_enabled: bool = False
+    streaming_enabled: bool = False
+    parallel_mode: str = PARALLEL_MODE_OFF
+    parallel_workers: int = 0
+    profiling_mode: str = PROFILING_MODE_OFF
+    archive_format: str = ARCHIVE_FORMAT_OFF
+    shard_index: int = 0
+    shard_count: int = 1
+    shard_merge_enabled: bool = False
+    index_sort_columns: tuple[str, ...] = ()
+    index_page_size: int = 0
+    search_index_enabled: bool = False
+    issue_filter: str = ""
+    verbose_logging: bool = False
+
+    @property
+    def is_shard_run(self) -> bool:
+        """Getter of the flag telling whether the run generates only the issue pages of a single shard."""
+        return self.shard_count > 1 and not self.shard_merge_enabled
+
+
+# pylint: disable=too-many-public-methods
 class ActionInputs(BaseActionInputs):
     """
     A class representing all the action inputs. It is responsible for loading and managing
@@ -44,6 +109,14 @@ class ActionInputs(BaseActionInputs):
         """
         return get_action_input(REPORT_PAGE, "false").lower() == "true"
 
+    @staticmethod
+    def is_report_json_generation_enabled() -> bool:
+        """
+        Getter of the machine-readable report switch. False by default.
+        @return: True if report.json is enabled, False otherwise.
+        """
+        return get_action_input(REPORT_JSON, "false").lower() == "true"
+
     @staticmethod
     def is_release_filtering_enabled() -> bool:
         """
@@ -52,6 +125,15 @@ class ActionInputs(BaseActionInputs):
         """
         return get_action_input(RELEASE, "false").lower() == "true"
 
+    @staticmethod
+    def get_release_labels() -> tuple[str, ...]:
+        """
+        Getter of the labels of the issues kept by the release filtering. No labels (all closed issues) by default.
+        @return: The release labels.
+        """
+        release_labels: str = get_action_input(RELEASE_LABELS, "")
+        return tuple(label.strip() for label in release_labels.split(",") if label.strip())
+
     @staticmethod
     def get_verbose_logging() -> bool:
         """
@@ -78,6 +160,144 @@ class ActionInputs(BaseActionInputs):
         """
         return get_action_input(STRUCTURED_OUTPUT, "false").lower() == "true"
 
+    @staticmethod
+    def get_parallel_mode() -> str:
+        """
+        Getter of the parallel page generation mode. "off" by default.
+        @return: The parallel mode - off, threads or processes.
+        """
+        return get_action_input(PARALLEL_MODE, PARALLEL_MODE_OFF).strip().lower()
+
+    @staticmethod
+    def get_parallel_workers() -> int:
+        """
+        Getter of the parallel workers count. 0 (the executor's default) by default.
+        @return: The number of parallel workers, -1 if the input is not a non-negative integer.
+        """
+        parallel_workers: str = get_action_input(PARALLEL_WORKERS, "0").strip()
+        return int(parallel_workers) if parallel_workers.isdigit() else -1
+
+    @staticmethod
+    def is_incremental_generation_enabled() -> bool:
+        """
+        Getter of the incremental generation switch. False by default.
+        @return: True if incremental generation is enabled, False otherwise.
+        """
+        return get_action_input(INCREMENTAL, "false").lower() == "true"
+
+    @staticmethod
+    def is_streaming_enabled() -> bool:
+        """
+        Getter of the source streaming switch. False by default.
+        @return: True if the source issues are streamed one by one, False if loaded at once.
+        """
+        return get_action_input(STREAMING, "false").lower() == "true"
+
+    @staticmethod
+    def get_profiling_mode() -> str:
+        """
+        Getter of the profiling mode. "off" by default.
+        @return: The profiling mode - off, cpu (cProfile) or full (cProfile and tracemalloc).
+        """
+        return get_action_input(PROFILING, PROFILING_MODE_OFF).strip().lower()
+
+    @staticmethod
+    def get_archive_format() -> str:
+        """
+        Getter of the archive output format. "off" by default.
+        @return: The archive format - off (output directory), tar.gz or zip.
+        """
+        return get_action_input(ARCHIVE, ARCHIVE_FORMAT_OFF).strip().lower()
+
+    @staticmethod
+    def get_shard_index() -> int:
+        """
+        Getter of the index of the shard generated by this run. 0 by default.
+        @return: The shard index, -1 if the input is not a non-negative integer.
+        """
+        shard_index: str = get_action_input(SHARD_INDEX, "0").strip()
+        return int(shard_index) if shard_index.isdigit() else -1
+
+    @staticmethod
+    def get_shard_count() -> int:
+        """
+        Getter of the number of shards. 1 (no sharding) by default.
+        @return: The number of shards, -1 if the input is not a non-negative integer.
+        """
+        shard_count: str = get_action_input(SHARD_COUNT, "1").strip()
+        return int(shard_count) if shard_count.isdigit() else -1
+
+    @staticmethod
+    def is_shard_merge_enabled() -> bool:
+        """
+        Getter of the shard merge switch. False by default.
+        @return: True if the run merges the outputs of all shards, False otherwise.
+        """
+        return get_action_input(SHARD_MERGE, "false").lower() == "true"
+
+    @staticmethod
+    def get_index_sort_columns() -> tuple[str, ...]:
+        """
+        Getter of the columns the index page tables are sorted by. No sorting (the source order) by default.
+        @return: The sort columns in their priority order.
+        """
+        index_sort: str = get_action_input(INDEX_SORT, "")
+        return tuple(column.strip().lower() for column in index_sort.split(",") if column.strip())
+
+    @staticmethod
+    def get_index_page_size() -> int:
+        """
+        Getter of the maximum number of rows of an index page table. 0 (no limit) by default.
+        @return: The index page size, -1 if the input is not a non-negative integer.
+        """
+        index_page_size: str = get_action_input(INDEX_PAGE_SIZE, "0").strip()
+        return int(index_page_size) if index_page_size.isdigit() else -1
+
+    @staticmethod
+    def is_search_index_enabled() -> bool:
+        """
+        Getter of the search index switch. False by default.
+        @return: True if the search index is enabled, False otherwise.
+        """
+        return get_action_input(SEARCH_INDEX, "false").lower() == "true"
+
+    @staticmethod
+    def get_issue_filter() -> str:
+        """
+        Getter of the issue filter expression. No expression (all issues kept) by default.
+        @return: The issue filter expression.
+        """
+        return get_action_input(ISSUE_FILTER, "").strip()
+
+    @staticmethod
+    def get_configuration() -> ActionConfiguration:
+        """
+        Resolve all action inputs into an immutable configuration snapshot.
+        @return: The configuration of the run.
+        """
+        return ActionConfiguration(
+            source=ActionInputs.get_source(),
+            release_filtering_enabled=ActionInputs.is_release_filtering_enabled(),
+            release_labels=ActionInputs.get_release_labels(),
+            structured_output_enabled=ActionInputs.is_structured_output_enabled(),
+            report_page_enabled=ActionInputs.is_report_page_generation_enabled(),
+            report_json_enabled=ActionInputs.is_report_json_generation_enabled(),
+            incremental_generation_enabled=ActionInputs.is_incremental_generation_enabled(),
+            streaming_enabled=ActionInputs.is_streaming_enabled(),
+            parallel_mode=ActionInputs.get_parallel_mode(),
+            parallel_workers=ActionInputs.get_parallel_workers(),
+            profiling_mode=ActionInputs.get_profiling_mode(),
+            archive_format=ActionInputs.get_archive_format(),
+            shard_index=ActionInputs.get_shard_index(),
+            shard_count=ActionInputs.get_shard_count(),
+            shard_merge_enabled=ActionInputs.is_shard_merge_enabled(),
+            index_sort_columns=ActionInputs.get_index_sort_columns(),
+            index_page_size=ActionInputs.get_index_page_size(),
+            search_index_enabled=ActionInputs.is_search_index_enabled(),
+            issue_filter=ActionInputs.get_issue_filter(),
+            verbose_logging=ActionInputs.get_verbose_logging(),
+        )
+
     def _validate(self) -> int:
         err_counter = 0
 
@@ -91,6 +311,63 @@ class ActionInputs(BaseActionInputs):
                 logger.error("Source file not found at received path: '%s'.", source)
                 err_counter += 1
 
+        # Validate parallel page generation inputs
+        parallel_mode: str = self.get_parallel_mode()
+        if parallel_mode not in SUPPORTED_PARALLEL_MODES:
+            logger.error(
+                "Parallel mode '%s' is not supported. Supported modes: %s.",
+                parallel_mode,
+                ", ".join(SUPPORTED_PARALLEL_MODES),
+            )
+            err_counter += 1
+
+        if self.get_parallel_workers() < 0:
+            logger.error("Parallel workers input must be a non-negative integer.")
+            err_counter += 1
+
+        # Validate profiling input
+        profiling_mode: str = self.get_profiling_mode()
+        if profiling_mode not in SUPPORTED_PROFILING_MODES:
+            logger.error(
+                "Profiling mode '%s' is not supported. Supported modes: %s.",
+                profiling_mode,
+                ", ".join(SUPPORTED_PROFILING_MODES),
+            )
+            err_counter += 1
+
+        # Validate archive input
+        archive_format: str = self.get_archive_format()
+        if archive_format not in SUPPORTED_ARCHIVE_FORMATS:
+            logger.error(
+                "Archive format '%s' is not supported. Supported formats: %s.",
+                archive_format,
+                ", ".join(SUPPORTED_ARCHIVE_FORMATS),
+            )
+            err_counter += 1
+        elif archive_format != ARCHIVE_FORMAT_OFF and self.is_incremental_generation_enabled():
+            logger.error("Incremental generation cannot be combined with the archive output.")
+            err_counter += 1
+
+        # Validate sharding inputs
+        err_counter += self._validate_sharding()
+
+        # Validate index page inputs
+        unsupported_columns = [c for c in self.get_index_sort_columns() if c not in SUPPORTED_INDEX_SORT_COLUMNS]
+        if unsupported_columns:
+            logger.error(
+                "Index sort columns '%s' are not supported. Supported columns: %s.",
+                ", ".join(unsupported_columns),
+                ", ".join(SUPPORTED_INDEX_SORT_COLUMNS),
+            )
+            err_counter += 1
+
+        if self.get_index_page_size() < 0:
+            logger.error("Index page size input must be a non-negative integer.")
+            err_counter += 1
+
+        # Validate issue filter input
+        err_counter += self._validate_issue_filter()
+
         if err_counter > 0:
             logger.error("User configuration validation failed.")
         else:
@@ -100,12 +377,78 @@ class ActionInputs(BaseActionInputs):
 
         return err_counter
 
+    def _validate_sharding(self) -> int:
+        """
+        Validate the sharding inputs.
+
+        @return: The number of found errors.
+        """
+        shard_count: int = self.get_shard_count()
+        if shard_count < 1:
+            logger.error("Shard count input must be a positive integer.")
+            return 1
+
+        shard_index: int = self.get_shard_index()
+        if not 0 <= shard_index < shard_count:
+            logger.error("Shard index input must be an integer from 0 to %d.", shard_count - 1)
+            return 1
+
+        if shard_count == 1:
+            if self.is_shard_merge_enabled():
+                logger.error("Shard merge requires the shard count greater than 1.")
+                return 1
+            return 0
+
+        err_counter = 0
+        if self.is_incremental_generation_enabled():
+            logger.error("Incremental generation cannot be combined with the sharded generation.")
+            err_counter += 1
+
+        if self.get_archive_format() != ARCHIVE_FORMAT_OFF:
+            logger.error("Archive output cannot be combined with the sharded generation.")
+            err_counter += 1
+
+        return err_counter
+
+    def _validate_issue_filter(self) -> int:
+        """
+        Validate the issue filter input by compiling the expression.
+
+        @return: The number of found errors.
+        """
+        issue_filter: str = self.get_issue_filter()
+        if not issue_filter:
+            return 0
+
+        try:
+            compile_filter_expression(issue_filter)
+        except ValueError as e:
+            logger.error("Issue filter input is not valid: %s", e)
+            return 1
+
+        return 0
+
     def _print_effective_configuration(self) -> None:
         """
         Print the effective configuration of the action inputs.
         """
         logger.info("source: %s", self.get_source())
         logger.info("release filtering enabled: %s", self.is_release_filtering_enabled())
+        logger.info("release labels: %s", ", ".join(self.get_release_labels()))
+        logger.info("issue filter: %s", self.get_issue_filter())
         logger.info("structured output enabled: %s", self.is_structured_output_enabled())
         logger.info("report page generation enabled: %s", self.is_report_page_generation_enabled())
+        logger.info("report json generation enabled: %s", self.is_report_json_generation_enabled())
+        logger.info("incremental generation enabled: %s", self.is_incremental_generation_enabled())
+        logger.info("source streaming enabled: %s", self.is_streaming_enabled())
+        logger.info("parallel mode: %s", self.get_parallel_mode())
+        logger.info("parallel workers: %s", self.get_parallel_workers())
+        logger.info("profiling mode: %s", self.get_profiling_mode())
+        logger.info("archive format: %s", self.get_archive_format())
+        logger.info("shard index: %s", self.get_shard_index())
+        logger.info("shard count: %s", self.get_shard_count())
+        logger.info("shard merge enabled: %s", self.is_shard_merge_enabled())
+        logger.info("index sort columns: %s", ", ".join(self.get_index_sort_columns()))
+        logger.info("index page size: %s", self.get_index_page_size())
+        logger.info("search index enabled: %s", self.is_search_index_enabled())
         logger.info("verbose logging: %s", self.get_verbose_logging())
@@ -0,0 +1,203 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Seeded generator of synthetic source datasets (the `Issues` JSON consumed by the generator) for benchmarks.
+The same specification always produces the same dataset.
+
+Usage (from the project root):
+    python -m benchmarks.dataset_generator --output dataset.json --user-stories 5000 --features 500
+"""
+
+import argparse
+import json
+import random
+
+from typing import NamedTuple
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.project_status import ProjectStatus
+from living_doc_utilities.model.user_story_issue import UserStoryIssue
+
+# Suffix of the file with the issue errors, stored next to the dataset (errors are not part of the source format)
+ERRORS_FILE_SUFFIX = ".errors.json"
+
+WORDS = ("living", "documentation", "feature", "story", "issue", "release", "project", "page", "index", "report")
+STATES = ("open", "closed")
+PROJECT_STATUSES = ("Todo", "In Progress", "Done")
+
+
+class DatasetSpec(NamedTuple):
+    """
+    The specification of a synthetic dataset.
+    """
+
+    seed: int = 42
+    user_stories: int = 1000
+    features: int = 100
+    functionalities: int = 2000
+    organizations: int = 2
+    repositories: int = 10
+    body_size: int = 2000
+    error_density: float = 0.05
+    project_statuses: bool = True
+
+
+def generate_issues(spec: DatasetSpec) -> Issues:
+    """
+    Generate the synthetic issues. Functionality issues are associated with random Features of their repository.
+
+    @param spec: The dataset specification.
+    @return: The generated Issues object, with errors attached to `error_density` of the issues.
+    """
+    rng = random.Random(spec.seed)
+    repository_ids = [f"org-{index % spec.organizations}/repo-{index}" for index in range(max(spec.repositories, 1))]
+    issues: dict[str, Issue] = {}
+    features_by_repository: dict[str, list[int]] = {}
+    next_numbers: dict[str, int] = dict.fromkeys(repository_ids, 1)
+
+    def add_issue(issue: Issue) -> Issue:
+        repository_id = rng.choice(repository_ids)
+        issue.repository_id = repository_id
+        issue.issue_number = next_numbers[repository_id]
+        next_numbers[repository_id] += 1
+        issue.title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+        issue.state = rng.choice(STATES)
+        issue.created_at = "2025-01-01T00:00:00Z"
+        issue.updated_at = "2025-02-01T00:00:00Z"
+        issue.html_url = f"https://github.com/{repository_id}/issues/{issue.issue_number}"
+        issue.body = _make_body(rng, spec.body_size)
+        issue.labels = ["DocumentedFeature"] if isinstance(issue, FeatureIssue) else ["DocumentedUserStory"]
+
+        if spec.project_statuses:
+            issue.linked_to_project = rng.random() < 0.8
+            if issue.linked_to_project:
+                project_status = ProjectStatus()
+                project_status.project_title = "Synthetic Project"
+                project_status.status = rng.choice(PROJECT_STATUSES)
+                issue.project_statuses = [project_status]
+
+        if rng.random() < spec.error_density:
+            issue.add_errors({"SyntheticError": f"Synthetic error of issue #{issue.issue_number}."})
+
+        issues[f"{repository_id}/{issue.issue_number}"] = issue
+        return issue
+
+    for _ in range(spec.user_stories):
+        add_issue(UserStoryIssue())
+
+    for _ in range(spec.features):
+        feature = add_issue(FeatureIssue())
+        features_by_repository.setdefault(feature.repository_id, []).append(feature.issue_number)
+
+    for _ in range(spec.functionalities):
+        functionality = add_issue(FunctionalityIssue())
+        repository_features = features_by_repository.get(functionality.repository_id)
+        if repository_features:
+            functionality.body = f"{functionality.body}\n### Associated Feature\n- #{rng.choice(repository_features)}\n"
+
+    return Issues(issues, spec.project_statuses)
+
+
+def write_dataset(spec: DatasetSpec, file_path: str) -> int:
+    """
+    Generate the dataset and write it as the source JSON file. The issue errors are written into
+    a separate file next to it, as the source format does not carry them.
+
+    @param spec: The dataset specification.
+    @param file_path: The path to the dataset JSON file.
+    @return: The number of generated issues.
+    """
+    issues: Issues = generate_issues(spec)
+    issues.save_to_json(file_path)
+
+    errors = {key: issue.errors for key, issue in issues.issues.items() if issue.errors}
+    with open(f"{file_path}{ERRORS_FILE_SUFFIX}", "w", encoding="utf-8") as f:
+        json.dump(errors, f)
+
+    return issues.count()
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the dataset specification options to the command line parser.
+
+    @param parser: The command line parser.
+    @return: None
+    """
+    defaults = DatasetSpec()
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--user-stories", type=int, default=defaults.user_stories)
+    parser.add_argument("--features", type=int, default=defaults.features)
+    parser.add_argument("--functionalities", type=int, default=defaults.functionalities)
+    parser.add_argument("--organizations", type=int, default=defaults.organizations)
+    parser.add_argument("--repositories", type=int, default=defaults.repositories)
+    parser.add_argument("--body-size", type=int, default=defaults.body_size)
+    parser.add_argument("--error-density", type=float, default=defaults.error_density)
+    parser.add_argument("--no-project-statuses", action="store_true", help="Generate issues without project data.")
+
+
+def spec_from_arguments(args: argparse.Namespace) -> DatasetSpec:
+    """
+    Build the dataset specification from the parsed command line options.
+
+    @param args: The parsed options added by `add_spec_arguments`.
+    @return: The dataset specification.
+    """
+    return DatasetSpec(
+        seed=args.seed,
+        user_stories=args.user_stories,
+        features=args.features,
+        functionalities=args.functionalities,
+        organizations=args.organizations,
+        repositories=args.repositories,
+        body_size=args.body_size,
+        error_density=args.error_density,
+        project_statuses=not args.no_project_statuses,
+    )
+
+
+def _make_body(rng: random.Random, body_size: int) -> str:
+    words: list[str] = []
+    size = 0
+    while size < body_size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+
+    return " ".join(words)
+
+
+def main() -> None:
+    """
+    Generate a synthetic dataset into the provided file.
+
+    @return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", required=True, help="Path to the generated dataset JSON file.")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    spec = spec_from_arguments(args)
+    print(f"Generated {write_dataset(spec, args.output)} issues into '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
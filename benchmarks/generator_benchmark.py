@@ -0,0 +1,257 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+End-to-end benchmark of `MdocLivingDocumentationGenerator.generate` on a seeded synthetic dataset.
+
+Every scenario runs in a fresh process, so the peak RSS is measured per scenario. Measured are the wall time,
+generated pages per second, peak RSS, the stat/mkdir/open filesystem calls made by the generator and the read/write
+syscall counts (Linux only, from `/proc/self/io`).
+The results are stored as JSON and can be compared with the results of another commit.
+
+Usage (from the project root):
+    python -m benchmarks.generator_benchmark --output results.json
+    python -m benchmarks.generator_benchmark --output results.json --baseline previous_results.json
+"""
+
+import argparse
+import builtins
+import functools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from benchmarks.dataset_generator import ERRORS_FILE_SUFFIX, add_spec_arguments, spec_from_arguments, write_dataset
+
+
+class Scenario(NamedTuple):
+    """
+    A benchmarked configuration of the generator.
+    """
+
+    name: str
+    structured_output: bool
+    report_page: bool
+
+
+SCENARIOS = (
+    Scenario("flat", structured_output=False, report_page=False),
+    Scenario("flat-report", structured_output=False, report_page=True),
+    Scenario("structured", structured_output=True, report_page=False),
+    Scenario("structured-report", structured_output=True, report_page=True),
+)
+
+# Counted filesystem calls and the functions counted as them, `os.makedirs` and the `os.path` checks are counted
+# by the stat and mkdir calls they make
+FILESYSTEM_CALLS: dict[str, tuple[tuple[Any, str], ...]] = {
+    "stat": ((os, "stat"), (os, "lstat")),
+    "mkdir": ((os, "mkdir"),),
+    "open": ((builtins, "open"), (os, "open")),
+}
+
+
+def run_scenario(scenario: Scenario, dataset_path: str, output_path: str) -> dict[str, Any]:
+    """
+    Run the generator for the scenario and measure it. Meant to be run in a fresh process.
+
+    @param scenario: The benchmarked scenario.
+    @param dataset_path: The path to the dataset JSON file.
+    @param output_path: The path to the output directory.
+    @return: The measured results.
+    """
+    # pylint: disable=import-outside-toplevel
+    import logging
+
+    from living_doc_utilities.model.issues import Issues
+
+    from action_inputs import ActionConfiguration
+    from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
+
+    logging.disable(logging.CRITICAL)
+
+    # The source format does not carry the issue errors, they are attached again right after the load
+    with open(f"{dataset_path}{ERRORS_FILE_SUFFIX}", "r", encoding="utf-8") as f:
+        errors: dict[str, dict[str, str]] = json.load(f)
+    load_from_json = Issues.load_from_json.__func__  # type: ignore[attr-defined]
+
+    def load_with_errors(cls, file_path):
+        issues = load_from_json(cls, file_path)
+        for key, issue_errors in errors.items():
+            issues.issues[key].add_errors(issue_errors)
+        return issues
+
+    Issues.load_from_json = classmethod(load_with_errors)  # type: ignore[method-assign, assignment]
+
+    configuration = ActionConfiguration(
+        source=dataset_path,
+        structured_output_enabled=scenario.structured_output,
+        report_page_enabled=scenario.report_page,
+    )
+
+    io_before = _read_proc_io()
+    with _count_filesystem_calls() as filesystem_calls:
+        start = time.perf_counter()
+        success = MdocLivingDocumentationGenerator(output_path, configuration).generate()
+        wall_time = time.perf_counter() - start
+    io_after = _read_proc_io()
+
+    pages = sum(1 for _, _, file_names in os.walk(output_path) for file_name in file_names if file_name.endswith(".md"))
+    return {
+        "scenario": scenario.name,
+        "success": success,
+        "wall_time_s": round(wall_time, 4),
+        "pages": pages,
+        "pages_per_s": round(pages / wall_time, 1) if wall_time > 0 else None,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "stat_calls": filesystem_calls["stat"],
+        "mkdir_calls": filesystem_calls["mkdir"],
+        "open_calls": filesystem_calls["open"],
+        "read_syscalls": _delta(io_before, io_after, "syscr"),
+        "write_syscalls": _delta(io_before, io_after, "syscw"),
+    }
+
+
+@contextmanager
+def _count_filesystem_calls() -> Iterator[dict[str, int]]:
+    """
+    Count the filesystem calls made in this process while the context is active. The `/proc/self/io` counters
+    cover only the read and write syscalls. Calls made by the parallel page workers are not counted.
+
+    @return: The counts of the filesystem calls by their names, filled when the context exits.
+    """
+    counts: dict[str, int] = dict.fromkeys(FILESYSTEM_CALLS, 0)
+
+    def counted(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counts[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    originals = [
+        (module, attribute, getattr(module, attribute))
+        for functions in FILESYSTEM_CALLS.values()
+        for module, attribute in functions
+    ]
+    for name, functions in FILESYSTEM_CALLS.items():
+        for module, attribute in functions:
+            setattr(module, attribute, counted(name, getattr(module, attribute)))
+    try:
+        yield counts
+    finally:
+        for module, attribute, function in originals:
+            setattr(module, attribute, function)
+
+
+def _read_proc_io() -> Optional[dict[str, int]]:
+    try:
+        with open("/proc/self/io", "r", encoding="utf-8") as f:
+            return {name: int(value) for name, value in (line.split(":") for line in f)}
+    except OSError:
+        return None
+
+
+def _delta(before: Optional[dict[str, int]], after: Optional[dict[str, int]], name: str) -> Optional[int]:
+    if before is None or after is None:
+        return None
+    return after[name] - before[name]
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(results: list[dict[str, Any]], baseline: Optional[dict[str, Any]]) -> None:
+    baseline_results = {result["scenario"]: result for result in baseline["results"]} if baseline else {}
+    print(
+        f"{'scenario':<20}{'wall [s]':>10}{'pages/s':>12}{'peak RSS [MB]':>15}{'stat/mkdir/open':>22}"
+        f"{'syscalls r/w':>18}{'vs base':>10}"
+    )
+    for result in results:
+        filesystem_calls = f"{result['stat_calls']}/{result['mkdir_calls']}/{result['open_calls']}"
+        syscalls = f"{result['read_syscalls']}/{result['write_syscalls']}"
+        comparison = ""
+        if result["scenario"] in baseline_results:
+            comparison = f"{baseline_results[result['scenario']]['wall_time_s'] / result['wall_time_s']:.2f}x"
+        print(
+            f"{result['scenario']:<20}{result['wall_time_s']:>10.3f}{result['pages_per_s']:>12.0f}"
+            f"{result['peak_rss_kb'] / 1024:>15.1f}{filesystem_calls:>22}{syscalls:>18}{comparison:>10}"
+        )
+
+
+def main() -> None:
+    """
+    Run all benchmark scenarios and store the results.
+
+    @return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Path to the JSON file to store the results into.")
+    parser.add_argument("--baseline", help="Path to the JSON results of a previous run to compare with.")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS], help="Run only these.")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    spec = spec_from_arguments(args)
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenario or scenario.name in args.scenario]
+
+    baseline: Optional[dict[str, Any]] = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        dataset_path = os.path.join(work_dir, "dataset.json")
+        write_dataset(spec, dataset_path)
+
+        context = multiprocessing.get_context("spawn")
+        for scenario in scenarios:
+            output_path = os.path.join(work_dir, scenario.name)
+            with context.Pool(1) as pool:
+                results.append(pool.apply(run_scenario, (scenario, dataset_path, output_path)))
+
+    report = {
+        "commit": _get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": spec._asdict(),
+        "results": results,
+    }
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results stored into '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Micro-benchmark comparing the rendering of issue pages by `str.format` on the raw template text
+with the rendering by a `CompiledTemplate`.
+
+Usage (from the project root):
+    python -m benchmarks.template_rendering_benchmark --pages 30000 --repeat 5
+"""
+
+import argparse
+import os
+import timeit
+
+from pathlib import Path
+
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.mdoc_exporter import MdocExporter
+
+
+def main() -> None:
+    """
+    Run the template rendering micro-benchmark and print the results.
+
+    @return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=30000, help="Number of rendered pages per round.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measured rounds.")
+    parser.add_argument("--body-size", type=int, default=2000, help="Size of the issue body in characters.")
+    args = parser.parse_args()
+
+    template_path = os.path.join(
+        Path(__file__).resolve().parent.parent, "templates", "us_issue_detail_page_template.md"
+    )
+    with open(template_path, "r", encoding="utf-8") as f:
+        template_source = f.read()
+    compiled_template = CompiledTemplate(template_source, MdocExporter.ISSUE_PAGE_PLACEHOLDERS)
+
+    replacements_list = [
+        {"title": f"User Story {i}", "date": "2025-01-01", "issue_content": "x" * args.body_size}
+        for i in range(args.pages)
+    ]
+    for replacements in replacements_list[:100]:
+        assert compiled_template.render(replacements) == template_source.format(**replacements)
+
+    def render_by_str_format() -> None:
+        for replacements in replacements_list:
+            template_source.format(**replacements)
+
+    def render_by_compiled_template() -> None:
+        for replacements in replacements_list:
+            compiled_template.render(replacements)
+
+    print(f"Rendering {args.pages} pages, best of {args.repeat} rounds:")
+    results = {}
+    for name, function in (("str.format", render_by_str_format), ("CompiledTemplate", render_by_compiled_template)):
+        results[name] = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"  {name:<18} {results[name] * 1000:10.2f} ms  {args.pages / results[name]:12.0f} pages/s")
+
+    print(f"  speed-up           {results['str.format'] / results['CompiledTemplate']:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
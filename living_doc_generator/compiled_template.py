@@ -0,0 +1,91 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the CompiledTemplate class, a page template parsed once into literal segments
+and placeholder slots, so rendering a page is a single join.
+"""
+
+from string import Formatter
+from typing import Any, Iterable, Mapping, Optional
+
+
+class CompiledTemplate:
+    """
+    A class representing a page template compiled from the `str.format` syntax. Only plain placeholders
+    (e.g. `{title}`) and escaped braces (`{{`, `}}`) are supported.
+    """
+
+    __slots__ = ("_source", "_parts", "_slots")
+
+    def __init__(self, source: str, allowed_placeholders: Optional[Iterable[str]] = None):
+        """
+        Compile the template source.
+
+        @param source: The template source in the `str.format` syntax.
+        @param allowed_placeholders: The placeholder names the template may use, None (or empty) to allow any name.
+        @raises ValueError: If the template is malformed or uses an unsupported or not allowed placeholder.
+        """
+        self._source: str = source
+        self._parts: list[str] = []
+        self._slots: list[tuple[int, str]] = []
+
+        allowed: frozenset[str] = frozenset(allowed_placeholders or ())
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if literal:
+                self._parts.append(literal)
+            if field_name is None:
+                continue
+
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Unsupported placeholder '{{{field_name}}}', only plain names are supported.")
+            if allowed and field_name not in allowed:
+                raise ValueError(
+                    f"Unknown placeholder '{{{field_name}}}', expected one of: {', '.join(sorted(allowed))}."
+                )
+
+            self._slots.append((len(self._parts), field_name))
+            self._parts.append("")
+
+    def __getstate__(self) -> tuple[str, list[str], list[tuple[int, str]]]:
+        return self._source, self._parts, self._slots
+
+    def __setstate__(self, state: tuple[str, list[str], list[tuple[int, str]]]) -> None:
+        self._source, self._parts, self._slots = state
+
+    @property
+    def source(self) -> str:
+        """Getter of the template source."""
+        return self._source
+
+    @property
+    def placeholders(self) -> set[str]:
+        """Getter of the placeholder names used by the template."""
+        return {name for _, name in self._slots}
+
+    def render(self, replacements: Mapping[str, Any]) -> str:
+        """
+        Render the template with the provided replacements. The result equals `source.format(**replacements)`.
+
+        @param replacements: The values of the template placeholders.
+        @return: The rendered content.
+        @raises KeyError: If a value of a used placeholder is missing.
+        """
+        parts = self._parts.copy()
+        for index, name in self._slots:
+            parts[index] = str(replacements[name])
+
+        return "".join(parts)
@@ -0,0 +1,98 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the DirectoryPlanner class, which collects the output directories before
+the pages are written and creates each of them only once.
+"""
+
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryPlanner:
+    """
+    A class representing the planner of the output directories. Directories are first planned,
+    then created at once ordered by their depth, so a parent is always created before its children.
+    Directories created once are remembered and never touched again.
+    When the output is not written to the disk (e.g. into an archive), directories are only tracked.
+    """
+
+    def __init__(self, create_directories: bool = True):
+        self._create_directories: bool = create_directories
+        self._planned: set[str] = set()
+        self._created: set[str] = set()
+
+        self.created_count: int = 0
+        self.elapsed_seconds: float = 0.0
+
+    def plan(self, directory: str) -> None:
+        """
+        Plan the creation of the directory.
+
+        @param directory: The path to the directory.
+        @return: None
+        """
+        if directory not in self._created:
+            self._planned.add(directory)
+
+    def create_planned(self) -> int:
+        """
+        Create all planned directories, which do not exist yet.
+
+        @return: The number of created directories.
+        """
+        if not self._planned:
+            return 0
+
+        if not self._create_directories:
+            self._created.update(self._planned)
+            self._planned.clear()
+            return 0
+
+        start = time.perf_counter()
+        created_count = 0
+        for directory in sorted(self._planned, key=lambda path: (path.count(os.sep), path)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                continue
+            except FileNotFoundError:
+                # A parent outside the plan is missing
+                os.makedirs(directory, exist_ok=True)
+            created_count += 1
+
+        self._created.update(self._planned)
+        self._planned.clear()
+
+        self.created_count += created_count
+        self.elapsed_seconds += time.perf_counter() - start
+        logger.debug("Created %d output directories.", created_count)
+        return created_count
+
+    def ensure(self, directory: str) -> None:
+        """
+        Create the directory right away, unless it was already created.
+
+        @param directory: The path to the directory.
+        @return: None
+        """
+        if directory not in self._created:
+            self.plan(directory)
+            self.create_planned()
@@ -0,0 +1,76 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the ReportRow record of a single error found during the generation and the functions
+turning the collected rows into the report page content and the machine-readable report.
+"""
+
+import json
+
+from collections import Counter
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from utils.constants import REPORT_PAGE_HEADER
+
+
+class ReportRow(NamedTuple):
+    """
+    A single error of a source issue listed in the report.
+    """
+
+    error_type: str
+    repository_id: str
+    issue_number: int
+    html_url: str
+    message: str
+
+    def to_markdown(self) -> str:
+        """
+        Format the row as a line of the report page table.
+
+        @return: The Markdown table line.
+        """
+        return f"| {self.error_type} | [{self.repository_id}#{self.issue_number}]({self.html_url}) | {self.message} |\n"
+
+
+def build_report_page_content(rows: Sequence[ReportRow]) -> str:
+    """
+    Build the report page table of the rows, joined at once.
+
+    @param rows: The report rows of a single group.
+    @return: The Markdown table with the header.
+    """
+    return REPORT_PAGE_HEADER + "".join(row.to_markdown() for row in rows)
+
+
+def build_report_json(rows_by_group: Mapping[str, Sequence[ReportRow]]) -> str:
+    """
+    Build the machine-readable report with the error counts and the rows of every group.
+
+    @param rows_by_group: The report rows by their group.
+    @return: The report as a JSON document.
+    """
+    groups: dict[str, Any] = {}
+    for group, rows in rows_by_group.items():
+        groups[group] = {
+            "error_count": len(rows),
+            "error_types": dict(Counter(row.error_type for row in rows)),
+            "errors": [row._asdict() for row in rows],
+        }
+
+    data = {"error_count": sum(group["error_count"] for group in groups.values()), "groups": groups}
+    return json.dumps(data, indent=2, ensure_ascii=False)
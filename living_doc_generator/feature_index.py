@@ -0,0 +1,133 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the FeatureIndex class, the lookup of Feature issues used to resolve the parent Feature
+of Functionality issues without scanning the source issues again.
+"""
+
+from typing import Callable, NamedTuple, Optional
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+
+from utils.utils import sanitize_filename
+
+
+class FeatureEntry(NamedTuple):
+    """
+    A Feature issue together with the sanitized name of its page directory.
+    """
+
+    feature: FeatureIssue
+    directory_name: str
+
+
+class FeatureIndex:
+    """
+    A class representing the index of Feature issues by their repository id and issue number.
+    It also keeps the reverse map from a Feature to its child Functionality issues.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, FeatureEntry] = {}
+        self._functionalities: dict[str, list[FunctionalityIssue]] = {}
+        # Associated Feature keys of the registered Functionality issues, so their bodies are parsed only once
+        self._parent_keys: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(repository_id: str, issue_number: int) -> str:
+        """
+        Make the index key of a Feature issue.
+
+        @param repository_id: The repository id of the Feature issue.
+        @param issue_number: The number of the Feature issue.
+        @return: The index key.
+        """
+        return f"{repository_id}/{issue_number}"
+
+    def add_feature(self, feature: FeatureIssue) -> None:
+        """
+        Add the Feature issue to the index. Its directory name is sanitized here, once per Feature.
+
+        @param feature: The Feature issue.
+        @return: None
+        """
+        key = self.make_key(feature.repository_id, feature.issue_number)
+        self._entries[key] = FeatureEntry(feature, sanitize_filename(feature.title if feature.title else ""))
+
+    def resolve_directory_names(self, resolve: Callable[[str, FeatureEntry], str]) -> None:
+        """
+        Replace the directory names of all indexed Features, visited in the order they were added.
+
+        @param resolve: The function getting the final directory name of the Feature from its index key and entry.
+        @return: None
+        """
+        for key, entry in self._entries.items():
+            self._entries[key] = entry._replace(directory_name=resolve(key, entry))
+
+    def add_functionality(self, functionality: FunctionalityIssue) -> None:
+        """
+        Register the Functionality issue as a child of the Features it is associated with.
+        The Feature itself does not have to be indexed yet.
+
+        @param functionality: The Functionality issue.
+        @return: None
+        """
+        parent_keys = self._get_parent_keys(functionality)
+        self._parent_keys[self.make_key(functionality.repository_id, functionality.issue_number)] = parent_keys
+        for key in parent_keys:
+            self._functionalities.setdefault(key, []).append(functionality)
+
+    def get_feature(self, key: str) -> Optional[FeatureEntry]:
+        """
+        Get the indexed Feature by its index key.
+
+        @param key: The index key of the Feature issue.
+        @return: The FeatureEntry or None if not found.
+        """
+        return self._entries.get(key)
+
+    def get_parent(self, functionality: FunctionalityIssue) -> Optional[FeatureEntry]:
+        """
+        Find the Feature the Functionality issue is associated with. The first associated Feature is used.
+
+        @param functionality: The Functionality issue.
+        @return: The FeatureEntry or None if the Functionality has no known Feature.
+        """
+        parent_keys = self._parent_keys.get(self.make_key(functionality.repository_id, functionality.issue_number))
+        if parent_keys is None:
+            parent_keys = self._get_parent_keys(functionality)
+
+        return self._entries.get(parent_keys[0]) if parent_keys else None
+
+    def get_functionalities(self, feature: FeatureIssue) -> list[FunctionalityIssue]:
+        """
+        Get the Functionality issues associated with the Feature issue.
+
+        @param feature: The Feature issue.
+        @return: The child Functionality issues in the order of their registration.
+        """
+        return self._functionalities.get(self.make_key(feature.repository_id, feature.issue_number), [])
+
+    def _get_parent_keys(self, functionality: FunctionalityIssue) -> list[str]:
+        return [
+            self.make_key(functionality.repository_id, feature_id)
+            for feature_id in functionality.get_related_feature_ids()
+        ]
@@ -0,0 +1,264 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IndexTableBuilder and RepositoryIndexTableBuilder classes, which build the summary
+tables of the index pages, and the navigation between the numbered index pages of a paginated table.
+"""
+
+from itertools import islice
+from typing import Any, Callable, ItemsView, Iterable, Iterator, Sequence
+
+from living_doc_generator.issue_record import IssueRecord
+from utils.constants import (
+    INDEX_NAVIGATION_WINDOW,
+    INDEX_SORT_COLUMN_NUMBER,
+    INDEX_SORT_COLUMN_ORGANIZATION,
+    INDEX_SORT_COLUMN_REPOSITORY,
+    INDEX_SORT_COLUMN_TITLE,
+    LINKED_TO_PROJECT_FALSE,
+    LINKED_TO_PROJECT_TRUE,
+    TABLE_HEADER_WITH_PROJECT_DATA,
+    TABLE_HEADER_WITHOUT_PROJECT_DATA,
+)
+
+# Values of the issue the rows are sorted by, for every supported sort column
+SORT_KEYS: dict[str, Callable[[IssueRecord], Any]] = {
+    INDEX_SORT_COLUMN_ORGANIZATION: lambda issue: issue.organization_name,
+    INDEX_SORT_COLUMN_REPOSITORY: lambda issue: issue.repository_name,
+    INDEX_SORT_COLUMN_NUMBER: lambda issue: issue.issue_number,
+    INDEX_SORT_COLUMN_TITLE: lambda issue: issue.title or "",
+}
+
+
+def get_index_page_filename(page_number: int) -> str:
+    """
+    Get the file name of the numbered index page. The first page is the index page of the directory.
+
+    @param page_number: The number of the index page, starting at 1.
+    @return: The file name of the index page.
+    """
+    return "_index.md" if page_number == 1 else f"_index_{page_number}.md"
+
+
+def get_index_page_link(from_page_number: int, to_page_number: int) -> str:
+    """
+    Get the relative link between the numbered index pages of the same directory. The first page is
+    published as the directory itself, every other page as its subdirectory.
+
+    @param from_page_number: The number of the index page holding the link.
+    @param to_page_number: The number of the linked index page.
+    @return: The relative link.
+    """
+    prefix = "./" if from_page_number == 1 else "../"
+    return prefix if to_page_number == 1 else f"{prefix}_index_{to_page_number}/"
+
+
+def get_index_page_title_suffix(page_number: int, page_count: int) -> str:
+    """
+    Get the suffix of the index page title, so the numbered index pages are distinguishable.
+
+    @param page_number: The number of the index page, starting at 1.
+    @param page_count: The number of the index pages.
+    @return: The title suffix, empty if the table is not paginated.
+    """
+    return "" if page_count <= 1 else f" ({page_number}/{page_count})"
+
+
+def build_index_page_navigation(page_number: int, page_count: int) -> str:
+    """
+    Build the navigation block of a numbered index page. It links the previous and next page, the first
+    and last page and the pages close to the current one, so its size does not grow with the page count.
+
+    @param page_number: The number of the index page, starting at 1.
+    @param page_count: The number of the index pages.
+    @return: The navigation block, empty if the table is not paginated.
+    """
+    if page_count <= 1:
+        return ""
+
+    shown_pages = {1, page_count} | set(
+        range(max(1, page_number - INDEX_NAVIGATION_WINDOW), min(page_count, page_number + INDEX_NAVIGATION_WINDOW) + 1)
+    )
+
+    items: list[str] = []
+    if page_number > 1:
+        items.append(f"[« Previous]({get_index_page_link(page_number, page_number - 1)})")
+
+    previous_shown = 0
+    for shown_page in sorted(shown_pages):
+        if shown_page > previous_shown + 1:
+            items.append("…")
+        if shown_page == page_number:
+            items.append(f"**{shown_page}**")
+        else:
+            items.append(f"[{shown_page}]({get_index_page_link(page_number, shown_page)})")
+        previous_shown = shown_page
+
+    if page_number < page_count:
+        items.append(f"[Next »]({get_index_page_link(page_number, page_number + 1)})")
+
+    return f"\nPages: {' | '.join(items)}\n"
+
+
+class IndexTableBuilder:
+    """
+    A class representing the builder of the issue summary table of an index page. Every row is formatted once
+    and the rows are joined once per table, so the cost is linear in the number of issues.
+    Rows keep the order the issues were added in, unless sort columns are set.
+    """
+
+    def __init__(self, project_statuses_included: bool, sort_columns: Sequence[str] = ()):
+        self._project_statuses_included: bool = project_statuses_included
+        self._sort_columns: Sequence[str] = sort_columns
+        self._header: str = (
+            TABLE_HEADER_WITH_PROJECT_DATA if project_statuses_included else TABLE_HEADER_WITHOUT_PROJECT_DATA
+        )
+        self._rows: list[tuple[tuple[Any, ...], str]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_issues(self, issues: Iterable[IssueRecord]) -> None:
+        """
+        Add a row for every issue.
+
+        @param issues: The records of the issues to add.
+        @return: None
+        """
+        self._rows.extend((self._get_sort_key(issue), self.format_row(issue)) for issue in issues)
+
+    def add_issue(self, issue: IssueRecord) -> None:
+        """
+        Add a row for the issue.
+
+        @param issue: The record of the issue to add.
+        @return: None
+        """
+        self._rows.append((self._get_sort_key(issue), self.format_row(issue)))
+
+    def get_page_count(self, page_size: int) -> int:
+        """
+        Get the number of the index pages the rows are split into.
+
+        @param page_size: The maximum number of rows of a table, 0 for a single table with all rows.
+        @return: The number of the index pages, at least one.
+        """
+        if page_size <= 0 or len(self._rows) <= page_size:
+            return 1
+
+        return -(-len(self._rows) // page_size)
+
+    def iter_pages(self, page_size: int) -> Iterator[str]:
+        """
+        Build the tables of the index pages one by one in a single pass over the ordered rows, so only
+        the table of the current page is held in memory besides the rows.
+
+        @param page_size: The maximum number of rows of a table, 0 for a single table with all rows.
+        @return: The tables of the index pages in their order, at least one (possibly without rows).
+        """
+        rows: Iterator[str] = (row for _, row in self._sorted_rows())
+        if page_size <= 0:
+            yield self._header + "".join(rows)
+            return
+
+        for _ in range(self.get_page_count(page_size)):
+            yield self._header + "".join(islice(rows, page_size))
+
+    def format_row(self, issue: IssueRecord) -> str:
+        """
+        Format the summary table row of a single issue.
+
+        @param issue: The record of the source issue.
+        @return: The table row for the issue.
+        """
+        title = issue.title.replace("|", " _ ")
+        issue_mdoc_link = f"features#{issue.title.replace(' ', '-').lower()}"
+        url = issue.html_url
+
+        if self._project_statuses_included:
+            # Change the bool values to more user-friendly characters
+            linked_to_project = LINKED_TO_PROJECT_TRUE if issue.linked_to_project else LINKED_TO_PROJECT_FALSE
+            status = ", ".join(issue.statuses) if issue.statuses else "---"
+            return (
+                f"| {issue.organization_name} | {issue.repository_name} |"
+                f" [#{issue.issue_number} - {title}]({issue_mdoc_link}) | {linked_to_project} | {status} |"
+                f"<a href='{url}' target='_blank'>GitHub link</a> |\n"
+            )
+
+        return (
+            f"| {issue.organization_name} | {issue.repository_name} |"
+            f" [#{issue.issue_number} - {title}]({issue_mdoc_link}) | {issue.state} |"
+            f"<a href='{url}' target='_blank'>GitHub link</a> |\n"
+        )
+
+    def _get_sort_key(self, issue: IssueRecord) -> tuple[Any, ...]:
+        """
+        Get the values of the issue the rows are sorted by.
+
+        @param issue: The record of the source issue.
+        @return: The sort key, empty if no sort columns are set.
+        """
+        return tuple(SORT_KEYS[column](issue) for column in self._sort_columns)
+
+    def _sorted_rows(self) -> list[tuple[tuple[Any, ...], str]]:
+        """
+        Get the rows ordered by the sort columns. The sort is stable, so rows with equal keys keep their order.
+
+        @return: The ordered rows.
+        """
+        if not self._sort_columns:
+            return self._rows
+
+        return sorted(self._rows, key=lambda row: row[0])
+
+
+class RepositoryIndexTableBuilder:
+    """
+    A class representing the builder of the per-repository summary tables of the structured output.
+    The issues are grouped by their repository in a single pass, every repository keeps its own rows.
+    Repositories keep the order of their first issue.
+    """
+
+    def __init__(self, project_statuses_included: bool, sort_columns: Sequence[str] = ()):
+        self._project_statuses_included: bool = project_statuses_included
+        self._sort_columns: Sequence[str] = sort_columns
+        self._tables: dict[str, IndexTableBuilder] = {}
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def add_issues(self, issues: Iterable[IssueRecord]) -> None:
+        """
+        Add a row for every issue into the table of its repository.
+
+        @param issues: The records of the issues to add.
+        @return: None
+        """
+        for issue in issues:
+            table_builder = self._tables.get(issue.repository_id)
+            if table_builder is None:
+                table_builder = IndexTableBuilder(self._project_statuses_included, self._sort_columns)
+                self._tables[issue.repository_id] = table_builder
+            table_builder.add_issue(issue)
+
+    def items(self) -> ItemsView[str, IndexTableBuilder]:
+        """
+        Get the table builders of all repositories.
+
+        @return: The (repository id, table builder) pairs.
+        """
+        return self._tables.items()
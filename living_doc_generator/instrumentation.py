@@ -0,0 +1,162 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the Instrumentation class, which collects the durations of the named generation stages
+(spans) and the run counters, and turns them into the timing report.
+"""
+
+import json
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+# Span names
+SPAN_LOAD = "load"
+SPAN_FILTER = "filter"
+SPAN_PAGES = "pages"
+SPAN_RENDER = "render"
+SPAN_WRITE = "write"
+SPAN_INDEX = "index"
+SPAN_REPORT = "report"
+
+# Counter names
+COUNTER_PAGES = "pages"
+COUNTER_BYTES_WRITTEN = "bytes_written"
+COUNTER_SKIPPED_WRITES = "skipped_writes"
+COUNTER_DIRECTORIES_CREATED = "directories_created"
+COUNTER_ERRORS = "errors"
+COUNTER_PATH_COLLISIONS = "path_collisions"
+COUNTER_RELEASE_KEPT = "release_kept"
+COUNTER_RELEASE_DROPPED = "release_dropped"
+COUNTER_FILTER_KEPT = "filter_kept"
+COUNTER_FILTER_DROPPED = "filter_dropped"
+
+
+class Instrumentation:
+    """
+    A class representing the timing and counter collector of a single generation run.
+    A span may be entered many times (e.g. once per rendered page), its durations are summed up.
+    Recording is thread-safe, so pages written by a thread pool can report into the same object.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start: float = time.perf_counter()
+        self._span_seconds: dict[str, float] = {}
+        self._span_calls: dict[str, int] = {}
+        self._counters: dict[str, int] = {}
+        self._span_listeners: list[Callable[[str], None]] = []
+
+    def add_span_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a listener called with the span name whenever a block measured by `span` ends.
+        Durations added by `add_span` are not reported to the listeners.
+
+        @param listener: The listener to call.
+        @return: None
+        """
+        self._span_listeners.append(listener)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Measure the duration of the enclosed block and add it to the named span.
+
+        @param name: The span name.
+        @return: The context manager measuring the block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, time.perf_counter() - start)
+            for listener in self._span_listeners:
+                listener(name)
+
+    def add_span(self, name: str, seconds: float, calls: int = 1) -> None:
+        """
+        Add an already measured duration to the named span.
+
+        @param name: The span name.
+        @param seconds: The measured duration in seconds.
+        @param calls: The number of measured calls the duration covers.
+        @return: None
+        """
+        with self._lock:
+            self._span_seconds[name] = self._span_seconds.get(name, 0.0) + seconds
+            self._span_calls[name] = self._span_calls.get(name, 0) + calls
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increase the named counter.
+
+        @param name: The counter name.
+        @param value: The value to add.
+        @return: None
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get_counter(self, name: str) -> int:
+        """
+        Get the value of the named counter.
+
+        @param name: The counter name.
+        @return: The counter value, 0 if never increased.
+        """
+        return self._counters.get(name, 0)
+
+    def get_span_seconds(self, name: str) -> float:
+        """
+        Get the total duration of the named span.
+
+        @param name: The span name.
+        @return: The total duration in seconds, 0.0 if never entered.
+        """
+        return self._span_seconds.get(name, 0.0)
+
+    @property
+    def total_seconds(self) -> float:
+        """Getter of the duration since the instrumentation was created."""
+        return time.perf_counter() - self._start
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Build the timing report.
+
+        @return: The timing report with the total duration, the spans in the order of their first use and the counters.
+        """
+        with self._lock:
+            spans = {
+                name: {"seconds": round(seconds, 6), "calls": self._span_calls[name]}
+                for name, seconds in self._span_seconds.items()
+            }
+            counters = dict(self._counters)
+
+        return {"total_seconds": round(self.total_seconds, 6), "spans": spans, "counters": counters}
+
+    def write_json(self, file_path: str) -> None:
+        """
+        Write the timing report as JSON.
+
+        @param file_path: The path to the timing report file.
+        @return: None
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
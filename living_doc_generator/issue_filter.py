@@ -0,0 +1,131 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssueFilter base class of the filters pruning the source issues right after
+they are loaded, and the ExpressionIssueFilter class driven by the issue filter expression input.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, Mapping
+
+from living_doc_utilities.model.issue import Issue
+
+from utils.filter_expression import SOURCE_FIELDS, compile_filter_expression
+
+
+class IssueFields(Mapping[str, Any]):
+    """
+    A read-only view of the issue attributes under the keys of the raw issue data. Only the fields read by
+    the filter are looked up. As in the raw data, empty values are missing.
+    """
+
+    __slots__ = ("_issue",)
+
+    def __init__(self, issue: Issue):
+        self._issue: Issue = issue
+
+    def __getitem__(self, key: str) -> Any:
+        if key == Issue.TYPE:
+            return type(self._issue).__name__
+
+        value = getattr(self._issue, key, None) if key in SOURCE_FIELDS else None
+        if not value:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in SOURCE_FIELDS if key in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class IssueFilter(ABC):
+    """
+    A base class of the issue filters. The decision is made on the raw issue data, so in the streaming mode
+    the Issue object of a dropped issue is never created. Every counted decision increases the kept or
+    dropped count.
+    """
+
+    def __init__(self):
+        self.kept_count: int = 0
+        self.dropped_count: int = 0
+
+    @abstractmethod
+    def matches(self, issue_data: dict[str, Any]) -> bool:
+        """
+        Decide whether the raw issue data belongs to a kept issue, without counting it.
+
+        @param issue_data: The raw issue data from the source.
+        @return: True if the issue is kept, False otherwise.
+        """
+
+    @abstractmethod
+    def matches_issue(self, issue: Issue) -> bool:
+        """
+        Decide whether the loaded issue is kept, without counting it. Only the attributes the decision
+        needs are read.
+
+        @param issue: The Issue object.
+        @return: True if the issue is kept, False otherwise.
+        """
+
+    def accepts(self, issue_data: dict[str, Any]) -> bool:
+        """
+        Decide whether the raw issue data belongs to a kept issue and count the decision.
+
+        @param issue_data: The raw issue data from the source.
+        @return: True if the issue is kept, False otherwise.
+        """
+        return self._count(self.matches(issue_data))
+
+    def select(self, issues: Iterable[tuple[str, Issue]]) -> Iterator[tuple[str, Issue]]:
+        """
+        Select the kept issues and count the decisions.
+
+        @param issues: The (issue key, Issue object) pairs of the source issues.
+        @return: The (issue key, Issue object) pairs of the kept issues, in the source order.
+        """
+        for key, issue in issues:
+            if self._count(self.matches_issue(issue)):
+                yield key, issue
+
+    def _count(self, kept: bool) -> bool:
+        if kept:
+            self.kept_count += 1
+        else:
+            self.dropped_count += 1
+
+        return kept
+
+
+class ExpressionIssueFilter(IssueFilter):
+    """
+    A class representing the filter of the issue filter expression. The expression is compiled once
+    into a predicate, which is then only called for every issue.
+    """
+
+    def __init__(self, expression: str):
+        super().__init__()
+        self.expression: str = expression
+        self._predicate = compile_filter_expression(expression)
+
+    def matches(self, issue_data: dict[str, Any]) -> bool:
+        return self._predicate(issue_data)
+
+    def matches_issue(self, issue: Issue) -> bool:
+        return self._predicate(IssueFields(issue))
@@ -0,0 +1,112 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains functions for streaming issues from the source JSON file one by one,
+so the memory usage does not depend on the size of the source.
+"""
+
+import logging
+
+from typing import Any, Callable, Iterator, Optional
+
+from living_doc_utilities.factory.issue_factory import IssueFactory
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.issue import Issue
+
+from living_doc_generator.feature_index import FeatureIndex
+
+logger = logging.getLogger(__name__)
+
+
+class SourceParseError(Exception):
+    """
+    An exception raised when the source JSON file is malformed or truncated and cannot be streamed.
+    """
+
+
+def stream_issues(
+    file_path: str, issue_filter: Optional[Callable[[dict[str, Any]], bool]] = None
+) -> Iterator[tuple[str, Issue]]:
+    """
+    Stream the issues from the source JSON file. Only one issue is kept in memory at a time.
+    Issues which cannot be created from their data are logged and skipped.
+
+    @param file_path: The path to the source JSON file.
+    @param issue_filter: The filter of the raw issue data, issues it rejects are skipped before they are created.
+    @return: An iterator of (issue key, Issue object) pairs in the source order.
+    """
+    for key, value in _stream_issue_data(file_path):
+        if issue_filter is not None and not issue_filter(value):
+            continue
+
+        try:
+            issue: Issue = IssueFactory.get(value.get(Issue.TYPE, ""), value)
+        except ValueError as e:
+            logger.warning("Issue '%s' could not be loaded, skipping it: %s", key, str(e))
+            continue
+
+        yield key, issue
+
+
+def load_feature_index(file_path: str, issue_filter: Optional[Callable[[dict[str, Any]], bool]] = None) -> FeatureIndex:
+    """
+    Load the index of all Feature issues from the source JSON file in a streaming pre-pass.
+    Feature bodies are dropped, only the data needed to resolve the parent of a Functionality issue is kept.
+
+    @param file_path: The path to the source JSON file.
+    @param issue_filter: The filter of the raw issue data, Features it rejects are not indexed.
+    @return: The index of all Feature issues.
+    """
+    feature_index: FeatureIndex = FeatureIndex()
+    for _, value in _stream_issue_data(file_path):
+        if value.get(Issue.TYPE) != FeatureIssue.__name__:
+            continue
+        if issue_filter is not None and not issue_filter(value):
+            continue
+
+        feature_issue = FeatureIssue()
+        feature_issue.repository_id = value.get(Issue.REPOSITORY_ID, "")
+        feature_issue.issue_number = value.get(Issue.ISSUE_NUMBER, 0)
+        feature_issue.title = value.get(Issue.TITLE, "")
+        feature_index.add_feature(feature_issue)
+
+    logger.debug("Feature index loaded with %d features.", len(feature_index))
+    return feature_index
+
+
+def _stream_issue_data(file_path: str) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Stream the raw issue data (top-level key and value pairs) from the source JSON file.
+
+    @param file_path: The path to the source JSON file.
+    @return: An iterator of (issue key, issue data) pairs.
+    @raise SourceParseError: If the source JSON file is malformed or truncated.
+    """
+    # Loaded only in the streaming mode
+    import ijson  # type: ignore[import-untyped]  # pylint: disable=import-outside-toplevel
+
+    with open(file_path, "rb") as f:
+        try:
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                if not isinstance(value, dict):
+                    logger.warning("Issue '%s' has no data, skipping it.", key)
+                    continue
+
+                yield key, value
+        except ijson.JSONError as e:
+            logger.error("Failed to parse JSON from %s: %s", file_path, str(e))
+            raise SourceParseError(str(e)) from e
@@ -0,0 +1,113 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssuePartition class, which classifies the source issues in a single pass
+into the buckets read by all generation stages.
+"""
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.user_story_issue import UserStoryIssue
+
+from living_doc_generator.feature_index import FeatureIndex
+from living_doc_generator.issue_record import IssueRecord
+
+
+class IssuePartition:
+    """
+    A class representing the source issues classified by their type and repository.
+    All buckets keep the source order of the issues.
+    """
+
+    def __init__(self):
+        self.issues_count: int = 0
+
+        # Issues having an MDoc page (User Story, Feature and Functionality)
+        self.page_issues: list[Issue] = []
+
+        # Records of the issues listed on the index pages, they do not keep the Issue objects alive
+        self.user_stories: list[IssueRecord] = []
+        self.features: list[IssueRecord] = []
+        self.functionalities: list[FunctionalityIssue] = []
+
+        # Feature issues with their child Functionalities, used to resolve the Feature of a Functionality
+        self.feature_index: FeatureIndex = FeatureIndex()
+
+        # Organization names of all issues, the dictionary keeps the order of the first occurrence
+        self._organization_names: dict[str, None] = {}
+
+    @classmethod
+    def from_issues(cls, issues: Issues) -> "IssuePartition":
+        """
+        Classify all source issues.
+
+        @param issues: The source issues.
+        @return: The IssuePartition object.
+        """
+        partition = cls()
+        for issue in issues.issues.values():
+            partition.add(issue)
+
+        return partition
+
+    @property
+    def organization_names(self) -> list[str]:
+        """Getter of the organization names of all issues in the order of their first occurrence."""
+        return list(self._organization_names)
+
+    def add(self, issue: Issue, index_only: bool = False) -> None:
+        """
+        Classify the issue into its buckets.
+
+        @param issue: The source Issue object.
+        @param index_only: True if the issue page is already generated and only its record is kept for the index
+                           pages. Feature issues are then not indexed and Functionality issues not kept at all.
+        @return: None
+        """
+        self.issues_count += 1
+        if issue.repository_id is not None:
+            self._organization_names[issue.repository_id.split("/")[0]] = None
+
+        if isinstance(issue, UserStoryIssue):
+            self.user_stories.append(IssueRecord.from_issue(issue))
+        elif isinstance(issue, FeatureIssue):
+            self.features.append(IssueRecord.from_issue(issue))
+        elif not isinstance(issue, FunctionalityIssue):
+            return
+
+        if index_only:
+            # The Feature index would keep the whole issue alive, bodies included, until the end of the run
+            return
+
+        if isinstance(issue, FeatureIssue):
+            self.feature_index.add_feature(issue)
+        elif isinstance(issue, FunctionalityIssue):
+            self.functionalities.append(issue)
+            self.feature_index.add_functionality(issue)
+        self.page_issues.append(issue)
+
+    def release_page_issues(self) -> None:
+        """
+        Release the issues whose pages are generated, only their records are kept for the index pages.
+
+        @return: None
+        """
+        self.page_issues = []
+        self.functionalities = []
+        self.feature_index = FeatureIndex()
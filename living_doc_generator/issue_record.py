@@ -0,0 +1,67 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssueRecord class, the compact projection of a source issue kept for the index pages
+once the issue page is generated.
+"""
+
+from typing import NamedTuple, Optional
+
+from living_doc_utilities.model.issue import Issue
+
+from utils.utils import make_issue_key
+
+
+class IssueRecord(NamedTuple):
+    """
+    The values of a source issue read by the index pages. Unlike the Issue object, the record holds
+    no body, errors or project status objects, and as a tuple it has no per-instance dictionary.
+    """
+
+    key: str
+    repository_id: str
+    organization_name: str
+    repository_name: str
+    issue_number: int
+    title: str
+    state: Optional[str]
+    html_url: Optional[str]
+    linked_to_project: bool
+    statuses: tuple[str, ...]
+
+    @classmethod
+    def from_issue(cls, issue: Issue) -> "IssueRecord":
+        """
+        Project the issue into its record.
+
+        @param issue: The source Issue object.
+        @return: The IssueRecord object.
+        """
+        organization_name = issue.organization_name
+        repository_name = issue.repository_name
+        return cls(
+            key=make_issue_key(organization_name, repository_name, issue.issue_number),
+            repository_id=issue.repository_id,
+            organization_name=organization_name,
+            repository_name=repository_name,
+            issue_number=issue.issue_number,
+            title=issue.title,
+            state=issue.state,
+            html_url=issue.html_url,
+            linked_to_project=bool(issue.linked_to_project),
+            statuses=tuple(project_status.status for project_status in issue.project_statuses),
+        )
@@ -0,0 +1,107 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the function building the attribute table of a single issue.
+"""
+
+from living_doc_utilities.model.issue import Issue
+
+from utils.constants import LINKED_TO_PROJECT_FALSE
+
+
+def build_issue_summary_table(issue: Issue, project_statuses_included: bool) -> str:
+    """
+    Generates a string representation of feature info in a table format.
+
+    @param issue: The source Issue object containing the issue data.
+    @param project_statuses_included: Whether the project data of the issue are listed.
+    @return: The string representation of the issue info in a table format.
+    """
+    # Join issue labels into one string
+    issue_labels = issue.labels
+    labels = ", ".join(issue_labels) if issue_labels else None
+
+    # Format issue URL as an MDoc link
+    issue_url_ = issue.html_url
+    issue_url = f"<a href='{issue_url_}' target='_blank'>GitHub link</a> " if issue_url_ else None
+
+    # Define the header for the issue summary table
+    headers = [
+        "Organization name",
+        "Repository name",
+        "Issue number",
+        "Title",
+        "State",
+        "Issue URL",
+        "Created at",
+        "Updated at",
+        "Closed at",
+        "Labels",
+    ]
+
+    # Define the values for the issue summary table
+    values = [
+        issue.organization_name,
+        issue.repository_name,
+        issue.issue_number,
+        issue.title,
+        issue.state.lower() if issue.state else None,
+        issue_url,
+        issue.created_at,
+        issue.updated_at,
+        issue.closed_at,
+        labels,
+    ]
+
+    # Update the summary table based on the project data mining situation
+    if project_statuses_included:
+        project_statuses = issue.project_statuses
+
+        if issue.linked_to_project:
+            project_data_header = [
+                "Project title",
+                "Status",
+                "Priority",
+                "Size",
+                "MoSCoW",
+            ]
+
+            for project_status in project_statuses:
+                # Update the summary data table for every project attached to the repository issue
+                project_data_values = [
+                    project_status.project_title,
+                    project_status.status,
+                    project_status.priority,
+                    project_status.size,
+                    project_status.moscow,
+                ]
+
+                headers.extend(project_data_header)
+                values.extend(project_data_values)
+        else:
+            headers.append("Linked to project")
+            linked_to_project = LINKED_TO_PROJECT_FALSE
+            values.append(linked_to_project)
+
+    # Initialize the MDoc table
+    issue_info = "| Attribute | Content |\n|---|---|\n"
+
+    # Add together all the attributes from the summary table in MDoc format
+    for attribute, content in zip(headers, values):
+        issue_info += f"| {attribute} | {content} |\n"
+
+    return issue_info
@@ -22,23 +22,92 @@ import logging
 import os
 import shutil
 
+from typing import Any, Callable, Iterable, Optional
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.issue import Issue
 from living_doc_utilities.model.issues import Issues
 
-from action_inputs import ActionInputs
+from action_inputs import ActionConfiguration
+from living_doc_generator.feature_index import FeatureIndex
+from living_doc_generator.instrumentation import (
+    COUNTER_FILTER_DROPPED,
+    COUNTER_FILTER_KEPT,
+    COUNTER_RELEASE_DROPPED,
+    COUNTER_RELEASE_KEPT,
+    SPAN_FILTER,
+    SPAN_LOAD,
+    Instrumentation,
+)
+from living_doc_generator.issue_filter import ExpressionIssueFilter, IssueFilter
+from living_doc_generator.issue_loader import SourceParseError, load_feature_index, stream_issues
 from living_doc_generator.mdoc_exporter import MdocExporter
+from living_doc_generator.page_manifest import PageManifest
+from living_doc_generator.release_filter import ReleaseFilter
+from living_doc_generator.sharding import (
+    check_shard_manifests,
+    compute_source_digest,
+    remove_shard_manifests,
+    select_shard_issues,
+    write_shard_manifest,
+)
+from utils.archive_writer import ArchiveWriter
+from utils.constants import ARCHIVE_FORMAT_OFF, PAGE_MANIFEST_SUFFIX, TIMING_REPORT_SUFFIX
+from utils.output_staging import OutputStaging, StagingPageWriter
+from utils.page_writer import PageWriter
 
 logger = logging.getLogger(__name__)
 
 
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
 class MdocLivingDocumentationGenerator:
     """
     A class representing the Living Documentation Generator - Mdoc output format.
     The class generates output in the Mdoc format.
     """
 
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: str, configuration: ActionConfiguration):
         self.__output_path = output_path
+        self.__configuration = configuration
+        self.__manifest_path = f"{output_path.rstrip(os.sep)}{PAGE_MANIFEST_SUFFIX}"
+        self.__timing_report_path = f"{output_path.rstrip(os.sep)}{TIMING_REPORT_SUFFIX}"
+        self.__instrumentation = Instrumentation()
+
+        self.__page_writer: PageWriter = PageWriter()
+
+        # In the archive mode all pages are collected into a single archive stored next to the output directory
+        self.__archive_path: Optional[str] = None
+        if configuration.archive_format != ARCHIVE_FORMAT_OFF:
+            self.__archive_path = f"{output_path.rstrip(os.sep)}.{configuration.archive_format}"
+            self.__page_writer = ArchiveWriter(output_path, configuration.archive_format)
+
+        # A full run generates into a staging directory swapped in place of the output directory on success
+        self.__output_staging: Optional[OutputStaging] = None
+
+        # Issues not published in the release documentation are pruned right after they are loaded
+        self.__release_filter: Optional[ReleaseFilter] = None
+        if configuration.release_filtering_enabled:
+            self.__release_filter = ReleaseFilter(configuration.release_labels)
+
+        # Issues not matching the issue filter expression are pruned right after they are loaded as well
+        self.__expression_filter: Optional[ExpressionIssueFilter] = None
+        if configuration.issue_filter:
+            self.__expression_filter = ExpressionIssueFilter(configuration.issue_filter)
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Getter of the instrumentation with the stage timings and counters of the run."""
+        return self.__instrumentation
+
+    @property
+    def timing_report_path(self) -> str:
+        """Getter of the path to the timing report file written at the end of the generation."""
+        return self.__timing_report_path
+
+    @property
+    def archive_path(self) -> Optional[str]:
+        """Getter of the path to the archive with all pages, None if the archive output is disabled."""
+        return self.__archive_path
 
     def generate(self) -> bool:
         """
@@ -46,45 +115,318 @@ class MdocLivingDocumentationGenerator:
 
         @return: True if generation is successful, False otherwise (error occurred).
         """
-        self._clean_output_directory()
-        logger.debug("Output directory cleaned.")
+        page_manifest: Optional[PageManifest] = None
+        if self.__configuration.incremental_generation_enabled:
+            page_manifest = PageManifest.load(self.__manifest_path, self.__output_path)
+
+        full_run: bool = page_manifest is None or not page_manifest.has_previous_run
+        if self.__archive_path is not None:
+            # No page is written into the output directory, only the archive and the timing report next to it
+            os.makedirs(os.path.dirname(os.path.abspath(self.__output_path)), exist_ok=True)
+        elif full_run and not self.__configuration.shard_merge_enabled:
+            self._prepare_output_directory()
+            logger.debug("Output directory prepared.")
+            if page_manifest is not None and self.__output_staging is not None:
+                # The manifest of this run describes the staged output, which becomes the output directory
+                page_manifest = PageManifest(self.__output_staging.staging_path)
+        else:
+            # Keep the previous output, only changed pages are rewritten and orphaned pages removed (incremental run),
+            # or the index and report pages are added to the issue pages of all shards (shard merge run)
+            os.makedirs(self.__output_path, exist_ok=True)
+
+        if self.__configuration.shard_merge_enabled and not self._check_shards():
+            logger.error("Shard merge - outputs of the shards are incomplete, merge aborted.")
+            return False
+
+        try:
+            res = self._generate_output(page_manifest)
+        except BaseException:
+            # The output of the previous run stays untouched
+            if self.__output_staging is not None:
+                self.__output_staging.discard()
+            raise
+
+        self._finish_output(res, page_manifest)
+        self._write_timing_report()
+        return res
+
+    def _generate_output(self, page_manifest: Optional[PageManifest]) -> bool:
+        """
+        Load the issues from the source and generate the output pages.
+
+        @param page_manifest: The page manifest of the previous run, used in the incremental mode.
+        @return: True if generation is successful, False otherwise (error occurred).
+        """
+        if self.__configuration.streaming_enabled:
+            try:
+                # Issues are loaded one by one during the generation, only the Feature index is loaded upfront
+                logger.info("Loading of feature index from source - started.")
+                with self.__instrumentation.span(SPAN_LOAD):
+                    feature_index: FeatureIndex = load_feature_index(
+                        self.__configuration.source, self._build_issue_data_filter(counted=False)
+                    )
+                logger.info("Loading of feature index from source - finished.")
 
-        # load issues data
-        logger.info("Loading of issue from source - started.")
-        issues: Issues = Issues.load_from_json(ActionInputs.get_source())
-        logger.info("Loading of issue from source - finished.")
+                logger.info("Generating Living Documentation output from streamed source - started.")
+                res = self._generate_living_documents_from_stream(feature_index, page_manifest)
+                logger.info("Generating Living Documentation output from streamed source - finished.")
+            except SourceParseError:
+                # The parse error is logged by the loader, the output of the previous run stays untouched
+                logger.error("Living Documentation mdoc output generation failed.")
+                return False
+        else:
+            # load issues data
+            logger.info("Loading of issue from source - started.")
+            with self.__instrumentation.span(SPAN_LOAD):
+                issues: Issues = Issues.load_from_json(self.__configuration.source)
+            logger.info("Loading of issue from source - finished.")
 
-        # filter out issues without repository id
-        issues_keys = list(issues.issues.keys())
-        for key in issues_keys:
-            if issues.issues[key] is None:
-                logger.warning("Issue '%s' has no repository id, removing it from the loaded issues.", key)
-                del issues.issues[key]
+            # filter out issues without repository id
+            with self.__instrumentation.span(SPAN_FILTER):
+                issues_keys = list(issues.issues.keys())
+                for key in issues_keys:
+                    if issues.issues[key] is None:
+                        logger.warning("Issue '%s' has no repository id, removing it from the loaded issues.", key)
+                        del issues.issues[key]
 
-        # Generate markdown pages
-        logger.info("Generating Living Documentation output - started.")
-        res = self._generate_living_documents(issues)
-        logger.info("Generating Living Documentation output - finished.")
+                issue_filters = self._get_issue_filters()
+                if issue_filters:
+                    # Only the issues kept by all filters get their pages, before anything is prepared for them
+                    selected_issues: Iterable[tuple[str, Issue]] = issues.issues.items()
+                    for issue_filter in issue_filters:
+                        selected_issues = issue_filter.select(selected_issues)
+                    issues.issues = dict(selected_issues)
 
+                source_issues: Optional[list[Issue]] = None
+                if self.__configuration.is_shard_run:
+                    # Only the issues of this shard get their pages, the paths are claimed for all source issues
+                    source_issues = list(issues.issues.values())
+                    issues.issues = dict(
+                        select_shard_issues(
+                            issues.issues.items(), self.__configuration.shard_index, self.__configuration.shard_count
+                        )
+                    )
+
+            # Generate markdown pages
+            logger.info("Generating Living Documentation output - started.")
+            res = self._generate_living_documents(issues, page_manifest, source_issues)
+            logger.info("Generating Living Documentation output - finished.")
+
+        self._report_issue_filters()
         return res
 
-    def _clean_output_directory(self) -> None:
+    def _get_issue_filters(self) -> list[IssueFilter]:
+        """
+        Get the enabled issue filters in the order they are applied.
+
+        @return: The enabled issue filters, empty if no filter is enabled.
+        """
+        return [
+            issue_filter
+            for issue_filter in (self.__release_filter, self.__expression_filter)
+            if issue_filter is not None
+        ]
+
+    def _build_issue_data_filter(self, counted: bool) -> Optional[Callable[[dict[str, Any]], bool]]:
+        """
+        Build the filter of the raw issue data for the streaming loader, keeping the issues kept by all enabled
+        filters. An issue dropped by a filter is not passed to the following ones.
+
+        @param counted: Whether the decisions are counted by the filters.
+        @return: The filter of the raw issue data, None if no filter is enabled.
         """
-        Clean the output directory from the previous run.
+        issue_filters = self._get_issue_filters()
+        if not issue_filters:
+            return None
+
+        if counted:
+            return lambda issue_data: all(issue_filter.accepts(issue_data) for issue_filter in issue_filters)
+        return lambda issue_data: all(issue_filter.matches(issue_data) for issue_filter in issue_filters)
+
+    def _report_issue_filters(self) -> None:
+        """
+        Report the numbers of the issues kept and dropped by the enabled issue filters.
 
         @return: None
         """
-        shutil.rmtree(self.__output_path, ignore_errors=True)
-        os.makedirs(self.__output_path, exist_ok=True)
+        if self.__release_filter is not None:
+            self.__instrumentation.count(COUNTER_RELEASE_KEPT, self.__release_filter.kept_count)
+            self.__instrumentation.count(COUNTER_RELEASE_DROPPED, self.__release_filter.dropped_count)
+            logger.info(
+                "Release filter - kept %d issues, dropped %d issues.",
+                self.__release_filter.kept_count,
+                self.__release_filter.dropped_count,
+            )
+
+        if self.__expression_filter is not None:
+            self.__instrumentation.count(COUNTER_FILTER_KEPT, self.__expression_filter.kept_count)
+            self.__instrumentation.count(COUNTER_FILTER_DROPPED, self.__expression_filter.dropped_count)
+            logger.info(
+                "Issue filter - kept %d issues, dropped %d issues.",
+                self.__expression_filter.kept_count,
+                self.__expression_filter.dropped_count,
+            )
+
+    def _finish_output(self, res: bool, page_manifest: Optional[PageManifest]) -> None:
+        """
+        Finish the output of the run: save the archive, or swap the staged output in place of the output
+        directory. A failed run keeps the output of the previous run.
+
+        @param res: True if the generation was successful, False otherwise.
+        @param page_manifest: The page manifest filled during the generation, used in the incremental mode.
+        @return: None
+        """
+        if isinstance(self.__page_writer, ArchiveWriter) and self.__archive_path is not None:
+            if res:
+                self.__page_writer.save(self.__archive_path)
+                if os.path.isdir(self.__output_path):
+                    # The output directory of an earlier run would be taken for the output of this run
+                    logger.info("Removing the output directory '%s' of an earlier run.", self.__output_path)
+                    shutil.rmtree(self.__output_path, ignore_errors=True)
+        elif self.__output_staging is not None:
+            if res:
+                if self.__configuration.is_shard_run:
+                    write_shard_manifest(
+                        self.__output_staging.staging_path,
+                        self.__configuration.shard_index,
+                        self.__configuration.shard_count,
+                        compute_source_digest(self.__configuration.source),
+                    )
+                self.__output_staging.commit()
+            else:
+                self.__output_staging.discard()
+
+        if res and self.__configuration.shard_merge_enabled:
+            remove_shard_manifests(self.__output_path, self.__configuration.shard_count)
+
+        if page_manifest is not None:
+            if res:
+                self._finish_incremental_generation(page_manifest)
+            elif os.path.isfile(self.__manifest_path):
+                # The output is no longer described by the manifest, the next run regenerates all pages
+                os.remove(self.__manifest_path)
 
-    def _generate_living_documents(self, issues: Issues) -> bool:
+    def _write_timing_report(self) -> None:
+        """
+        Write the timing report of the run next to the output directory and log its summary.
+
+        @return: None
+        """
+        timing_report = self.__instrumentation.to_dict()
+        try:
+            self.__instrumentation.write_json(self.__timing_report_path)
+        except OSError as e:
+            logger.warning("Timing report could not be written to '%s': %s", self.__timing_report_path, str(e))
+
+        logger.info(
+            "Living Documentation generation took %.3f seconds - spans: %s, counters: %s.",
+            timing_report["total_seconds"],
+            ", ".join(f"{name} {span['seconds']:.3f}s" for name, span in timing_report["spans"].items()),
+            ", ".join(f"{name} {value}" for name, value in timing_report["counters"].items()),
+        )
+
+    def _prepare_output_directory(self) -> None:
+        """
+        Prepare the staging directory for a full run. The output directory of the previous run is kept
+        until the run succeeds, and its identical files are linked instead of written again.
+
+        @return: None
+        """
+        self.__output_staging = OutputStaging(self.__output_path)
+        self.__output_staging.prepare()
+        self.__page_writer = StagingPageWriter(self.__output_staging)
+
+        # The manifest of a previous incremental run no longer describes the output
+        if os.path.isfile(self.__manifest_path):
+            os.remove(self.__manifest_path)
+
+    def _check_shards(self) -> bool:
+        """
+        Check that the output directory holds the complete outputs of all shards generated from the same source.
+
+        @return: True if the outputs of all shards are complete, False otherwise.
+        """
+        source_digest = compute_source_digest(self.__configuration.source)
+        return check_shard_manifests(self.__output_path, self.__configuration.shard_count, source_digest)
+
+    def _create_exporter(self, page_manifest: Optional[PageManifest]) -> MdocExporter:
+        """
+        Create the exporter sharing the instrumentation and the page writer of the run.
+
+        @param page_manifest: The page manifest of the previous run, used in the incremental mode.
+        @return: The MdocExporter object.
+        """
+        export_path = self.__output_staging.staging_path if self.__output_staging is not None else self.__output_path
+        return MdocExporter(
+            export_path, self.__configuration, page_manifest, self.__instrumentation, self.__page_writer
+        )
+
+    def _finish_incremental_generation(self, page_manifest: PageManifest) -> None:
+        """
+        Remove the orphaned pages of the previous run and save the page manifest of this run.
+
+        @param page_manifest: The page manifest filled during the generation.
+        @return: None
+        """
+        removed_count = page_manifest.remove_orphaned_files()
+        page_manifest.save(self.__manifest_path)
+        logger.info(
+            "Incremental generation - %d pages unchanged, %d pages written, %d orphaned files removed.",
+            page_manifest.unchanged_pages_count,
+            page_manifest.changed_pages_count,
+            removed_count,
+        )
+
+    def _generate_living_documents(
+        self, issues: Issues, page_manifest: Optional[PageManifest] = None, source_issues: Optional[list[Issue]] = None
+    ) -> bool:
         """
         Generate the output in the Mdoc format.
 
         @param issues: Issues object containing the source issue data.
+        @param page_manifest: The page manifest of the previous run, used in the incremental mode.
+        @param source_issues: All source issues of a shard run, their paths are claimed before the shard pages.
+        @return: True if generation is successful, False otherwise (error occurred).
+        """
+        export_kwargs: dict[str, Any] = {"issues": issues}
+        if source_issues is not None:
+            source_feature_index = FeatureIndex()
+            for issue in source_issues:
+                if isinstance(issue, FeatureIssue):
+                    source_feature_index.add_feature(issue)
+            export_kwargs.update(source_issues=source_issues, source_feature_index=source_feature_index)
+
+        if self._create_exporter(page_manifest).export(**export_kwargs):
+            logger.info("Living Documentation mdoc output generated successfully.")
+            return True
+
+        logger.error("Living Documentation mdoc output generation failed.")
+        return False
+
+    def _generate_living_documents_from_stream(
+        self, feature_index: FeatureIndex, page_manifest: Optional[PageManifest] = None
+    ) -> bool:
+        """
+        Generate the output in the Mdoc format from the issues streamed from the source.
+
+        @param feature_index: The index of all Feature issues, used to resolve the Functionality parents.
+        @param page_manifest: The page manifest of the previous run, used in the incremental mode.
         @return: True if generation is successful, False otherwise (error occurred).
         """
-        if MdocExporter(self.__output_path).export(issues=issues):
+        issue_stream = stream_issues(self.__configuration.source, self._build_issue_data_filter(counted=True))
+        export_kwargs: dict[str, Any] = {"feature_index": feature_index}
+        if self.__configuration.is_shard_run:
+            issue_stream = select_shard_issues(
+                issue_stream, self.__configuration.shard_index, self.__configuration.shard_count
+            )
+            # The paths of all source issues are claimed in an extra pass over the source before the shard pages
+            source_issues = (
+                issue
+                for _, issue in stream_issues(self.__configuration.source, self._build_issue_data_filter(counted=False))
+            )
+            export_kwargs.update(source_issues=source_issues, source_feature_index=feature_index)
+
+        if self._create_exporter(page_manifest).export(issue_stream=issue_stream, **export_kwargs):
             logger.info("Living Documentation mdoc output generated successfully.")
             return True
 
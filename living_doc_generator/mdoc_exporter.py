@@ -23,7 +23,7 @@ import os
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TypeVar, Sequence
+from typing import Iterable, Optional, Sequence
 
 from living_doc_utilities.exporter.exporter import Exporter
 from living_doc_utilities.model.feature_issue import FeatureIssue
@@ -32,19 +32,57 @@ from living_doc_utilities.model.issue import Issue
 from living_doc_utilities.model.issues import Issues
 from living_doc_utilities.model.user_story_issue import UserStoryIssue
 
-from action_inputs import ActionInputs
-from utils.utils import make_absolute_path, generate_root_level_index_page, load_template, sanitize_filename
+from action_inputs import ActionConfiguration
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.directory_planner import DirectoryPlanner
+from living_doc_generator.error_report import ReportRow, build_report_json, build_report_page_content
+from living_doc_generator.feature_index import FeatureEntry, FeatureIndex
+from living_doc_generator.index_table import (
+    IndexTableBuilder,
+    RepositoryIndexTableBuilder,
+    build_index_page_navigation,
+    get_index_page_filename,
+    get_index_page_title_suffix,
+)
+from living_doc_generator.instrumentation import (
+    COUNTER_BYTES_WRITTEN,
+    COUNTER_DIRECTORIES_CREATED,
+    COUNTER_ERRORS,
+    COUNTER_PAGES,
+    COUNTER_PATH_COLLISIONS,
+    COUNTER_SKIPPED_WRITES,
+    SPAN_INDEX,
+    SPAN_PAGES,
+    SPAN_REPORT,
+    Instrumentation,
+)
+from living_doc_generator.issue_partition import IssuePartition
+from living_doc_generator.issue_record import IssueRecord
+from living_doc_generator.issue_summary import build_issue_summary_table
+from living_doc_generator.page_generation import PageJob, PagePool, generate_pages
+from living_doc_generator.page_manifest import PageManifest, compute_page_digest
+from living_doc_generator.path_namer import PathNamer
+from living_doc_generator.search_index import SearchIndex
+from utils.page_writer import PageWriter
+from utils.utils import (
+    make_absolute_path,
+    make_issue_key,
+    generate_root_level_index_page,
+    load_template,
+    sanitize_filename,
+)
 from utils.constants import (
-    REPORT_PAGE_HEADER,
-    TABLE_HEADER_WITH_PROJECT_DATA,
-    TABLE_HEADER_WITHOUT_PROJECT_DATA,
-    LINKED_TO_PROJECT_TRUE,
-    LINKED_TO_PROJECT_FALSE,
+    PARALLEL_MODE_OFF,
+    PATH_COLLISION_ERROR_TYPE,
+    REPORT_JSON_FILENAME,
+    SEARCH_INDEX_FILENAME,
 )
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T", bound=Issue)
+
+# Number of streamed issue pages generated at once
+STREAM_BATCH_SIZE = 1000
 
 
 # pylint: disable=too-many-instance-attributes, too-few-public-methods
@@ -57,131 +95,429 @@ class MdocExporter(Exporter):
     PARENT_PATH_US = "user_stories"
     PARENT_PATH_FEAT = "features"
 
-    def __init__(self, output_path: str):
+    # Placeholders the templates may use, exactly the values passed when they are rendered
+    ISSUE_PAGE_PLACEHOLDERS = ("title", "date", "issue_content")
+    INDEX_PAGE_PLACEHOLDERS = ("date", "issue_overview_table", "index_page_title_suffix", "index_page_navigation")
+    # The repository name is passed only to the index pages of the structured output
+    STRUCTURED_INDEX_PAGE_PLACEHOLDERS = INDEX_PAGE_PLACEHOLDERS + ("data_level_name",)
+    ORG_LEVEL_PAGE_PLACEHOLDERS = ("date", "organization_name")
+    REPORT_PAGE_PLACEHOLDERS = ("date", "livdoc_report_page_content", "group")
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        output_path: str,
+        configuration: ActionConfiguration,
+        page_manifest: Optional[PageManifest] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        page_writer: Optional[PageWriter] = None,
+    ):
         self._output_path = output_path
+        self._configuration: ActionConfiguration = configuration
+        self._page_manifest: Optional[PageManifest] = page_manifest
+        self._instrumentation: Instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self._page_writer: PageWriter = page_writer if page_writer is not None else PageWriter()
+        self._directory_planner: DirectoryPlanner = DirectoryPlanner(self._page_writer.writes_to_disk)
+        self._path_namer: PathNamer = PathNamer()
+        self._page_pool: Optional[PagePool] = None
 
         # templates
-        self._us_issue_page_detail_template: str = ""
-        self._feat_issue_page_detail_template: str = ""
-        self._func_issue_page_detail_template: str = ""
+        self._us_issue_page_detail_template: CompiledTemplate = CompiledTemplate("")
+        self._feat_issue_page_detail_template: CompiledTemplate = CompiledTemplate("")
+        self._func_issue_page_detail_template: CompiledTemplate = CompiledTemplate("")
         self._us_index_root_level_template_page: str = ""
         self._feat_index_root_level_template_page: str = ""
-        self._index_org_level_template: str = ""
-        self._report_page_template: str = ""
-        self._us_index_no_struct_template_file: str = ""
-        self._feat_index_no_struct_template_file: str = ""
-        self._report_page_content: dict[str, str] = {}
+        self._index_org_level_template: CompiledTemplate = CompiledTemplate("")
+        self._report_page_template: CompiledTemplate = CompiledTemplate("")
+        self._us_index_no_struct_template_file: CompiledTemplate = CompiledTemplate("")
+        self._feat_index_no_struct_template_file: CompiledTemplate = CompiledTemplate("")
+        self._report_rows: dict[str, list[ReportRow]] = {}
+        self._search_index: Optional[SearchIndex] = SearchIndex() if configuration.search_index_enabled else None
 
         self.project_statuses_included: bool = False
 
     def export(self, **kwargs) -> bool:
         logger.info("MDoc page generation - started.")
 
+        issue_stream: Optional[Iterable[tuple[str, Issue]]] = kwargs.get("issue_stream")
         issues: Issues = kwargs.get("issues", Issues())
         self.project_statuses_included = issues.project_states_included
-        logger.debug("Exporting %d issues...", issues.count())
+        if issue_stream is None:
+            logger.debug("Exporting %d issues...", issues.count())
 
         # Load the template files for generating the MDoc pages
         if not self._load_all_templates():
             return False
 
-        # Generate an MDoc page for every issue in the expected path
-        self._generate_page_per_issue(issues)
-
-        # Generate all the structure of the index pages
-        self._generate_output_structure(issues)
-
-        # Generate a report page
-        if ActionInputs.is_report_page_generation_enabled():
-            self._generate_report_page()
-
+        # Generate an MDoc page for every issue in the expected path, the workers are shared by all page batches
+        workers: int = self._configuration.parallel_workers
+        page_pool = PagePool(self._configuration.parallel_mode, workers if workers > 0 else None)
+        with self._instrumentation.span(SPAN_PAGES), page_pool:
+            self._page_pool = page_pool
+            # A shard claims the paths of all source issues first, so it resolves the path collisions like a single run
+            source_issues: Optional[Iterable[Issue]] = kwargs.get("source_issues")
+            if source_issues is not None:
+                self._claim_source_paths(source_issues, kwargs.get("source_feature_index", FeatureIndex()))
+
+            if issue_stream is None:
+                # Classify the issues once, all later stages read the buckets
+                partition: IssuePartition = IssuePartition.from_issues(issues)
+                self._generate_page_per_issue(partition)
+                # The loaded issues are released as well, so only the issue records stay for the index pages
+                issues.issues.clear()
+            else:
+                partition = self._generate_page_per_streamed_issue(
+                    issue_stream, kwargs.get("feature_index", FeatureIndex())
+                )
+        self._page_pool = None
+
+        # A shard writes only its issue pages, the index and report pages are written by the merge step
+        if not self._configuration.is_shard_run:
+            with self._instrumentation.span(SPAN_INDEX):
+                self._generate_output_structure(partition)
+                if self._search_index is not None:
+                    self._generate_search_index(self._search_index)
+
+            with self._instrumentation.span(SPAN_REPORT):
+                if self._configuration.report_page_enabled:
+                    self._generate_report_page()
+                if self._configuration.report_json_enabled:
+                    self._generate_report_json()
+
+        self._instrumentation.count(COUNTER_DIRECTORIES_CREATED, self._directory_planner.created_count)
+        self._instrumentation.count(COUNTER_SKIPPED_WRITES, self._page_writer.skipped_count)
+        logger.info(
+            "MDoc page generation - created %d directories in %.3f seconds.",
+            self._directory_planner.created_count,
+            self._directory_planner.elapsed_seconds,
+        )
         logger.info("MDoc page generation - finished.")
         return True
 
     def _generate_report_page(self):
-        def write_report_page(group: str, parent_dir: str, content: str) -> None:
-            header, divider, *error_rows = content.strip().split("\n")  # pylint: disable=unused-variable
-            if error_rows:
-                report_page = self._report_page_template.format(
-                    date=datetime.now().strftime("%Y-%m-%d"),
-                    livdoc_report_page_content=content,
-                    group=group,
+        def write_report_page(group: str, parent_dir: str, rows: list[ReportRow]) -> None:
+            if rows:
+                report_page = self._report_page_template.render(
+                    {
+                        "date": datetime.now().strftime("%Y-%m-%d"),
+                        "livdoc_report_page_content": build_report_page_content(rows),
+                        "group": group,
+                    }
                 )
-                with open(
-                    os.path.join(make_absolute_path(self._output_path), parent_dir, "report_page.md"),
-                    "w",
-                    encoding="utf-8",
-                ) as f:
-                    f.write(report_page)
+                report_page_path = os.path.join(make_absolute_path(self._output_path), parent_dir, "report_page.md")
+                self._write_output_page(report_page_path, report_page)
 
             logger.warning("MDoc page generation - Report page '%s' generated.", group)
 
-        for group, content in self._report_page_content.items():
+        for group, rows in self._report_rows.items():
             parent_dir = self.PARENT_PATH_US if group == self.REPORT_PAGE_US_GROUP else self.PARENT_PATH_FEAT
-            write_report_page(group, parent_dir, content)
+            write_report_page(group, parent_dir, rows)
 
-    def _generate_page_per_issue(self, issues: Issues) -> None:
+    def _generate_report_json(self) -> None:
+        """
+        Generate the machine-readable report with the errors of all groups.
+
+        @return: None
+        """
+        report_json_path = os.path.join(make_absolute_path(self._output_path), REPORT_JSON_FILENAME)
+        written_bytes = self._write_output_file(report_json_path, build_report_json(self._report_rows))
+        self._instrumentation.count(COUNTER_BYTES_WRITTEN, written_bytes)
+        logger.info("MDoc page generation - Report JSON generated.")
+
+    def _generate_search_index(self, search_index: SearchIndex) -> None:
+        """
+        Generate the search index of all issue pages, collected while their page jobs were prepared.
+
+        @param search_index: The collected search index.
+        @return: None
+        """
+        search_index_path = os.path.join(make_absolute_path(self._output_path), SEARCH_INDEX_FILENAME)
+        written_bytes = self._write_output_file(search_index_path, search_index.to_json())
+        self._instrumentation.count(COUNTER_BYTES_WRITTEN, written_bytes)
+        logger.info("MDoc page generation - Search index with %d pages generated.", len(search_index))
+
+    def _generate_page_per_issue(self, partition: IssuePartition) -> None:
         logger.info("Generating MDoc pages ...")
-        for issue in issues.issues.values():
+        self._claim_feature_directories(partition.feature_index)
+        # Report page rows are collected here in the source order, so the result does not depend on workers
+        page_jobs: list[PageJob] = self._prepare_page_jobs(partition)
+        self._generate_pages(page_jobs)
+
+        # The index pages read only the issue records, the issues are not needed anymore
+        partition.release_page_issues()
+
+        logger.info("MDoc page generation - generated `%i` issue pages.", partition.issues_count)
+
+    def _generate_page_per_streamed_issue(
+        self, issue_stream: Iterable[tuple[str, Issue]], feature_index: FeatureIndex
+    ) -> IssuePartition:
+        """
+        Generate an MDoc page for every issue of the stream. Pages are generated in batches, so only a bounded
+        number of issue bodies is held in memory at a time.
+
+        @param issue_stream: The stream of (issue key, Issue object) pairs.
+        @param feature_index: The index of all Feature issues, used to resolve the Functionality parents.
+        @return: The partition of the issues for the index pages, holding the records of the issues only.
+        """
+        logger.info("Generating MDoc pages from the issue stream ...")
+        self._claim_feature_directories(feature_index)
+
+        index_partition: IssuePartition = IssuePartition()
+        page_jobs: list[PageJob] = []
+        for _, issue in issue_stream:
+            page_job: Optional[PageJob] = self._prepare_page_job(issue, feature_index)
+            if page_job is not None:
+                page_jobs.append(page_job)
+
+            # Only the record of the issue is kept for the index pages, the page job keeps its own body reference
+            index_partition.add(issue, index_only=True)
+
+            if len(page_jobs) >= STREAM_BATCH_SIZE:
+                self._generate_pages(page_jobs)
+                page_jobs = []
+
+        self._generate_pages(page_jobs)
+
+        logger.info("MDoc page generation - generated `%i` issue pages.", index_partition.issues_count)
+        return index_partition
+
+    def _generate_pages(self, page_jobs: list[PageJob]) -> None:
+        """
+        Create the directories of the page jobs and generate the pages in the configured parallel mode.
+
+        @param page_jobs: The page jobs to generate.
+        @return: None
+        """
+        if self._configuration.shard_merge_enabled:
+            return  # The issue pages were written by the shard runs
+
+        parallel_mode: str = self._configuration.parallel_mode
+        if parallel_mode != PARALLEL_MODE_OFF:
+            logger.debug("Generating %d MDoc pages in parallel mode '%s' ...", len(page_jobs), parallel_mode)
+
+        if self._page_pool is not None:
+            self._page_pool.generate(page_jobs, self._directory_planner, self._instrumentation, self._page_writer)
+            return
+
+        workers: int = self._configuration.parallel_workers
+        generate_pages(
+            page_jobs,
+            parallel_mode,
+            workers if workers > 0 else None,
+            self._directory_planner,
+            self._instrumentation,
+            self._page_writer,
+        )
+
+    def _prepare_page_jobs(self, partition: IssuePartition) -> list[PageJob]:
+        """
+        Prepare a page job for every issue and collect the report page rows on the way.
+
+        @param partition: The classified source issues.
+        @return: The page jobs in the source order.
+        """
+        page_jobs: list[PageJob] = []
+        for issue in partition.page_issues:
+            page_job: Optional[PageJob] = self._prepare_page_job(issue, partition.feature_index)
+            if page_job is not None:
+                page_jobs.append(page_job)
+
+        return page_jobs
+
+    def _prepare_page_job(self, issue: Issue, feature_index: FeatureIndex) -> Optional[PageJob]:
+        """
+        Prepare the page job of a single issue and collect its report page rows.
+
+        @param issue: The source Issue object.
+        @param feature_index: The index used to resolve the Feature of a Functionality issue.
+        @return: The page job or None if the issue has no page or its page is up to date.
+        """
+        page_job: Optional[PageJob] = None
+        if isinstance(issue, UserStoryIssue):
+            page_job = self._prepare_md_issue_page_for_us(issue)
+            self._update_error_page(issue, self.REPORT_PAGE_US_GROUP)
+
+        if isinstance(issue, FeatureIssue):
+            feature_entry = feature_index.get_feature(FeatureIndex.make_key(issue.repository_id, issue.issue_number))
+            page_job = self._prepare_md_issue_page_for_feat(issue, feature_entry)
+            self._update_error_page(issue, self.REPORT_PAGE_FEAT_GROUP)
+
+        if isinstance(issue, FunctionalityIssue):
+            page_job = self._prepare_md_issue_page_for_func(issue, feature_index.get_parent(issue))
+            self._update_error_page(issue, self.REPORT_PAGE_FEAT_GROUP)
+
+        # Every page is indexed, including the pages kept up to date by the incremental generation
+        if page_job is not None and self._search_index is not None:
+            page_path = os.path.relpath(
+                os.path.join(page_job.directory, page_job.filename), make_absolute_path(self._output_path)
+            )
+            self._search_index.add_document(page_path.replace(os.sep, "/"), issue.title, issue.labels, issue.body)
+
+        if page_job is not None and self._is_page_changed(issue, page_job):
+            return page_job
+
+        return None
+
+    def _claim_feature_directories(self, feature_index: FeatureIndex) -> None:
+        """
+        Claim the directories of all indexed Features in the index order before any page is prepared, so the Feature
+        page and the pages of its Functionalities get the same directory whatever order they are prepared in.
+
+        @param feature_index: The index of all Feature issues.
+        @return: None
+        """
+
+        def claim(key: str, entry: FeatureEntry) -> str:
+            # A title sanitized to nothing would make the Feature page the index page of the Feature group
+            directory_name = entry.directory_name if entry.directory_name else f"feature_{entry.feature.issue_number}"
+            # The Feature directories are stored in the same directory as the User Story pages of the repository
+            parent_path = self._generate_directory_path_us(self.PARENT_PATH_FEAT, entry.feature.repository_id)
+            return self._path_namer.claim(parent_path, directory_name, "", key)
+
+        feature_index.resolve_directory_names(claim)
+
+    def _claim_source_paths(self, source_issues: Iterable[Issue], source_feature_index: FeatureIndex) -> None:
+        """
+        Claim the paths of all source issues in the order a single run claims them, before the pages of this shard
+        are prepared. All shards then resolve the path collisions the same way and never write the same file.
+
+        @param source_issues: All source issues in the source order, not only the issues of this shard.
+        @param source_feature_index: The index of all Feature issues of the source.
+        @return: None
+        """
+        self._claim_feature_directories(source_feature_index)
+        for issue in source_issues:
             if isinstance(issue, UserStoryIssue):
-                self._generate_md_issue_page_for_us(issue)
-                self._update_error_page(issue, self.REPORT_PAGE_US_GROUP)
+                self._claim_page_filename(
+                    self._generate_directory_path_us(self.PARENT_PATH_US, issue.repository_id), issue
+                )
+            elif isinstance(issue, FunctionalityIssue):
+                self._claim_page_filename(
+                    self._get_func_page_directory_path(issue, source_feature_index.get_parent(issue)), issue
+                )
+
+    def _claim_page_filename(self, page_directory_path: str, issue: Issue) -> str:
+        """
+        Claim the file of the issue page in its directory.
+
+        @param page_directory_path: The directory of the issue page.
+        @param issue: The source Issue object.
+        @return: The filename of the issue page, with a number suffix if another issue page owns the path.
+        """
+        stem, extension = os.path.splitext(self.generate_page_filename(issue))
+        owner = make_issue_key(issue.organization_name, issue.repository_name, issue.issue_number)
+        return self._path_namer.claim(page_directory_path, stem, extension, owner)
+
+    def _is_page_changed(self, issue: Issue, page_job: PageJob) -> bool:
+        """
+        Register the issue page in the page manifest (incremental mode) and decide whether it must be written.
+
+        @param issue: The source Issue object of the page.
+        @param page_job: The page job of the issue page.
+        @return: True if the page must be written, False if the existing page is up to date.
+        """
+        if self._page_manifest is None:
+            return True
+
+        issue_key = make_issue_key(issue.organization_name, issue.repository_name, issue.issue_number)
+        file_path = os.path.join(page_job.directory, page_job.filename)
+        return self._page_manifest.register_page(issue_key, file_path, compute_page_digest(page_job))
+
+    def _write_output_page(self, file_path: str, content: str) -> None:
+        """
+        Write a page, which is not an issue page, track it in the page manifest and count it.
 
-            if isinstance(issue, FeatureIssue):
-                self._generate_md_issue_page_for_feat(issue)
-                self._update_error_page(issue, self.REPORT_PAGE_FEAT_GROUP)
+        @param file_path: The path to the page file.
+        @param content: The page content.
+        @return: None
+        """
+        written_bytes = self._write_output_file(file_path, content)
+        self._instrumentation.count(COUNTER_PAGES)
+        self._instrumentation.count(COUNTER_BYTES_WRITTEN, written_bytes)
 
-            if isinstance(issue, FunctionalityIssue):
-                # get associated feature ID
-                feature_issue = None
-                feature_ids = issue.get_related_feature_ids()
-                if feature_ids:
-                    feature_key = f"{issue.repository_id}/{feature_ids[0]}"
-                    possible_feature = issues.get_issue(feature_key)
-                    if isinstance(possible_feature, FeatureIssue):
-                        feature_issue = possible_feature
+    def _write_output_file(self, file_path: str, content: str) -> int:
+        """
+        Write a file, which is not an issue page, and track it in the page manifest.
+        The write is skipped if the file already holds the identical content.
 
-                self._generate_md_issue_page_for_func(issue, feature_issue)
-                self._update_error_page(issue, self.REPORT_PAGE_FEAT_GROUP)
+        @param file_path: The path to the file.
+        @param content: The file content.
+        @return: The number of written bytes, 0 if the write was skipped.
+        """
+        written_bytes = self._page_writer.write(file_path, content)
+        self._track_output_file(file_path)
+        return written_bytes
 
-        logger.info("MDoc page generation - generated `%i` issue pages.", issues.count())
+    def _track_output_file(self, file_path: str) -> None:
+        """
+        Track a produced file, which is not an issue page, in the page manifest (incremental mode).
 
-    def _generate_output_structure(self, issues: Issues) -> None:
-        if ActionInputs.is_structured_output_enabled():
-            regime_output_path = make_absolute_path(self._output_path)
+        @param file_path: The path to the produced file.
+        @return: None
+        """
+        if self._page_manifest is not None:
+            self._page_manifest.track_file(file_path)
+
+    def _generate_output_structure(self, partition: IssuePartition) -> None:
+        # Create all index page directories before any index page is written
+        self._plan_index_directories(partition)
 
+        if self._configuration.structured_output_enabled:
             # User Story
-            generate_root_level_index_page(
-                self._us_index_root_level_template_page, os.path.join(regime_output_path, "user_stories")
-            )
-            self._generate_structured_index_pages(issues, "user_stories")
+            self._generate_root_level_index_page(self._us_index_root_level_template_page, "user_stories")
+            self._generate_structured_index_pages(partition, "user_stories")
 
             # Features
-            generate_root_level_index_page(
-                self._feat_index_root_level_template_page, os.path.join(regime_output_path, "features")
-            )
-            self._generate_structured_index_pages(issues, "features")
+            self._generate_root_level_index_page(self._feat_index_root_level_template_page, "features")
+            self._generate_structured_index_pages(partition, "features")
 
         # Generate an index page with a summary table about all User Stories
-        us_issues: list[UserStoryIssue] = [
-            issue for issue in issues.issues.values() if isinstance(issue, UserStoryIssue)
-        ]
-        self._generate_index_page(self._us_index_no_struct_template_file, "user_stories", us_issues)
+        self._generate_index_page(self._us_index_no_struct_template_file, "user_stories", partition.user_stories)
         logger.info("MDoc page generation - generated User Stories `_index.md`.")
 
         # Generate an index page with a summary table about all Features
-        feat_issues: list[FeatureIssue] = [issue for issue in issues.issues.values() if isinstance(issue, FeatureIssue)]
-        self._generate_index_page(self._feat_index_no_struct_template_file, "features", feat_issues)
+        self._generate_index_page(self._feat_index_no_struct_template_file, "features", partition.features)
         logger.info("MDoc page generation - generated Features `_index.md`.")
 
-    def _generate_md_issue_page_for_us(self, issue: Issue) -> None:
+    def _generate_root_level_index_page(self, template: str, group_name: str) -> None:
         """
-        Generates an MDoc page for a User Story ticket or GitHub issue from a template and saves
-        it to the output directory.
+        Generate the root-level index page of the group for the structured output.
 
-        @param issue: The source Issue object containing the issue data.
+        @param template: The root-level template, written as is.
+        @param group_name: The name of the group directory.
+        @return: None
+        """
+        group_output_path = os.path.join(make_absolute_path(self._output_path), group_name)
+        written_bytes = generate_root_level_index_page(template, group_output_path, self._page_writer)
+        self._track_output_file(os.path.join(group_output_path, "_index.md"))
+        self._instrumentation.count(COUNTER_PAGES)
+        self._instrumentation.count(COUNTER_BYTES_WRITTEN, written_bytes)
+
+    def _plan_index_directories(self, partition: IssuePartition) -> None:
+        """
+        Plan the directories of all index pages and create them at once.
+
+        @param partition: The classified source issues the index pages are generated for.
         @return: None
         """
+        regime_output_path = make_absolute_path(self._output_path)
+        for group_name in (self.PARENT_PATH_US, self.PARENT_PATH_FEAT):
+            self._directory_planner.plan(os.path.join(regime_output_path, group_name))
+
+            # The repository directories are created with their index pages, only for the repositories in the group
+            if self._configuration.structured_output_enabled:
+                for organization_name in partition.organization_names:
+                    self._directory_planner.plan(os.path.join(regime_output_path, group_name, organization_name))
+
+        self._directory_planner.create_planned()
+
+    def _prepare_md_issue_page_for_us(self, issue: Issue) -> PageJob:
+        """
+        Prepares the page job of an MDoc page for a User Story ticket or GitHub issue.
+
+        @param issue: The source Issue object containing the issue data.
+        @return: The page job for the issue page.
+        """
         # Initialize dictionary with replacements
         # TODO - add support for - planned in Issue https://github.com/AbsaOSS/living-doc-generator/issues/111
         #   - GH State badge
@@ -194,27 +530,20 @@ class MdocExporter(Exporter):
             "issue_content": issue.body,
         }
 
-        # Run through all replacements and update template keys with adequate content
-        issue_md_page_content = self._us_issue_page_detail_template.format(**replacements)
-
         # Create a directory structure path for the issue page
         assert issue.repository_id is not None
         page_directory_path: str = self._generate_directory_path_us(self.PARENT_PATH_US, issue.repository_id)
-        os.makedirs(page_directory_path, exist_ok=True)
-
-        # Save the single issue MDoc page
-        page_filename = self.generate_page_filename(issue)
-        with open(os.path.join(page_directory_path, page_filename), "w", encoding="utf-8") as f:
-            f.write(issue_md_page_content)
 
-        logger.debug("Generated MDoc page: %s.", page_filename)
+        page_filename: str = self._claim_page_filename(page_directory_path, issue)
+        return PageJob(page_directory_path, page_filename, self._us_issue_page_detail_template, replacements)
 
-    def _generate_md_issue_page_for_feat(self, issue: Issue) -> None:
+    def _prepare_md_issue_page_for_feat(self, issue: Issue, feature_entry: Optional[FeatureEntry] = None) -> PageJob:
         """
-        Generates an MDoc page for a Feature ticket/GH issue from a template and saves it to the output directory.
+        Prepares the page job of an MDoc page for a Feature ticket/GH issue.
 
         @param issue: The source Issue object containing the issue data.
-        @return: None
+        @param feature_entry: The indexed Feature with the claimed directory name, if any.
+        @return: The page job for the issue page.
         """
         # Initialize dictionary with replacements
         # TODO - add support for - planned in Issue https://github.com/AbsaOSS/living-doc-generator/issues/111
@@ -229,33 +558,30 @@ class MdocExporter(Exporter):
             "issue_content": issue.body,
         }
 
-        # Run through all replacements and update template keys with adequate content
-        issue_md_page_content = self._feat_issue_page_detail_template.format(**replacements)
-
         # Create a directory structure path for the issue page
         assert issue.repository_id is not None
-        page_directory_path: str = self._generate_directory_path_feat(
-            self.PARENT_PATH_FEAT, issue.repository_id, issue.title if issue.title else ""
-        )
-        os.makedirs(page_directory_path, exist_ok=True)
-
-        # Save the single issue MDoc page
-        page_filename = self.generate_page_filename(issue)
-        with open(os.path.join(page_directory_path, page_filename), "w", encoding="utf-8") as f:
-            f.write(issue_md_page_content)
+        if feature_entry is not None and feature_entry.directory_name:
+            page_directory_path: str = self._generate_directory_path_func(
+                self.PARENT_PATH_FEAT, issue.repository_id, feature_entry.directory_name
+            )
+        else:
+            page_directory_path = self._generate_directory_path_feat(
+                self.PARENT_PATH_FEAT, issue.repository_id, issue.title if issue.title else ""
+            )
 
-        logger.debug("Generated MDoc page: %s.", page_filename)
+        return PageJob(
+            page_directory_path, self.generate_page_filename(issue), self._feat_issue_page_detail_template, replacements
+        )
 
-    def _generate_md_issue_page_for_func(
-        self, issue: FunctionalityIssue, feature_issue: Optional[FeatureIssue] = None
-    ) -> None:
+    def _prepare_md_issue_page_for_func(
+        self, issue: FunctionalityIssue, feature_entry: Optional[FeatureEntry] = None
+    ) -> PageJob:
         """
-        Generates an MDoc page for a Functionality ticket or GitHub issue from a template and saves
-        it to the output directory.
+        Prepares the page job of an MDoc page for a Functionality ticket or GitHub issue.
 
         @param issue: The source Issue object containing the issue data.
-        @param feature_issue: The FeatureIssue object associated with the FunctionalityIssue, if any.
-        @return: None
+        @param feature_entry: The indexed Feature associated with the FunctionalityIssue, if any.
+        @return: The page job for the issue page.
         """
         # Initialize dictionary with replacements
         # TODO - add support for - planned in Issue https://github.com/AbsaOSS/living-doc-generator/issues/111
@@ -264,31 +590,34 @@ class MdocExporter(Exporter):
         #   - GH Priority
         #   - GH Icon link
 
-        title = issue.title
-        feature_title = feature_issue.title if feature_issue and feature_issue.title else "no_feature"
-
         replacements = {
-            "title": title,
+            "title": issue.title,
             "date": datetime.now().strftime("%Y-%m-%d"),
             "issue_content": issue.body,
         }
 
-        # Run through all replacements and update template keys with adequate content
-        issue_md_page_content = self._func_issue_page_detail_template.format(**replacements)
-
         # Create a directory structure path for the issue page
-        assert issue.repository_id is not None
-        page_directory_path: str = self._generate_directory_path_func(
-            self.PARENT_PATH_FEAT, issue.repository_id, feature_title
-        )
-        os.makedirs(page_directory_path, exist_ok=True)
+        page_directory_path: str = self._get_func_page_directory_path(issue, feature_entry)
+        page_filename: str = self._claim_page_filename(page_directory_path, issue)
+        return PageJob(page_directory_path, page_filename, self._func_issue_page_detail_template, replacements)
+
+    def _get_func_page_directory_path(
+        self, issue: FunctionalityIssue, feature_entry: Optional[FeatureEntry] = None
+    ) -> str:
+        """
+        Get the directory of the Functionality page, the directory of its Feature.
 
-        # Save the single issue MDoc page
-        page_filename = self.generate_page_filename(issue)
-        with open(os.path.join(page_directory_path, page_filename), "w", encoding="utf-8") as f:
-            f.write(issue_md_page_content)
+        @param issue: The source Functionality issue.
+        @param feature_entry: The indexed Feature associated with the FunctionalityIssue, if any.
+        @return: The directory path of the issue page.
+        """
+        # The directory name is sanitized once per Feature by the index, the same way as for the Feature page
+        feature_directory_name = (
+            feature_entry.directory_name if feature_entry and feature_entry.directory_name else "no_feature"
+        )
 
-        logger.debug("Generated MDoc page: %s.", page_filename)
+        assert issue.repository_id is not None
+        return self._generate_directory_path_func(self.PARENT_PATH_FEAT, issue.repository_id, feature_directory_name)
 
     def generate_page_filename(self, issue: Issue) -> str:
         """
@@ -307,142 +636,105 @@ class MdocExporter(Exporter):
 
         return page_filename
 
-    # pylint: disable=too-many-arguments
-    def _generate_structured_index_pages(self, issues: Issues, group_name: str) -> None:
+    def _generate_structured_index_pages(self, partition: IssuePartition, group_name: str) -> None:
         """
-        Generates a set of index pages due to a structured output feature.
+        Generates the organization level index pages of the structured output, each written once.
 
-        @param issues: A dictionary containing all source issues.
+        @param partition: The classified source issues.
         @return: None
         """
-        # Group issues by repository for structured index page content
-        issues_by_repository: dict[str, list[Issue]] = {}
-        for issue in issues.issues.values():
-            assert issue.repository_id is not None
-            if issue.repository_id not in issues_by_repository:
-                issues_by_repository[issue.repository_id] = []
-            issues_by_repository[issue.repository_id].append(issue)
-
-        # Generate an index page for each repository
-        repository_ids = issues_by_repository.keys()
-        for repository_id in repository_ids:
-            self._generate_sub_level_index_page(self._index_org_level_template, repository_id, group_name)
-            logger.debug(
-                "Generated '%s' organization level `_index.md` for %s.",
-                group_name,
-                repository_id.split("/")[0],
-            )
+        for organization_name in partition.organization_names:
+            self._generate_sub_level_index_page(self._index_org_level_template, organization_name, group_name)
+            logger.debug("Generated '%s' organization level `_index.md` for %s.", group_name, organization_name)
 
-            logger.info("MDoc page generation - generated `_index.md` pages for %s.", repository_id)
+        logger.info(
+            "MDoc page generation - generated `_index.md` pages for %d organizations.",
+            len(partition.organization_names),
+        )
 
-    def _generate_index_page(self, issue_index_page_template: str, group_name: str, issues: Sequence[T]) -> None:
+    def _generate_index_page(
+        self, issue_index_page_template: CompiledTemplate, group_name: str, issues: Sequence[IssueRecord]
+    ) -> None:
         """
         Generates an index page that summarizes all issues and saves it to the output directory.
+        With the structured output, an index page is generated for every repository instead.
 
-        @param issue_index_page_template: The template string for generating the index mdoc page.
-        @param issues: A dictionary containing all source issues.
-        @param repository_id: The repository ID used if the structured output is generated.
+        @param issue_index_page_template: The compiled template for generating the index mdoc page.
+        @param group_name: The name of the group directory.
+        @param issues: The records of the group issues.
         @return: None
         """
-        # Initializing the issue table header based on the project mining state
-        issue_table = (
-            TABLE_HEADER_WITH_PROJECT_DATA if self.project_statuses_included else TABLE_HEADER_WITHOUT_PROJECT_DATA
-        )
-
-        # Create an issue summary table for every issue
-        for issue in issues:
-            issue_table += self._generate_mdoc_line(issue)
-
-        # Prepare issues replacement for the index page
-        replacement = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "issue_overview_table": issue_table,
-        }
-
-        if len(issues) > 0:
-            repository_id = issues[0].repository_id
-        else:
+        if len(issues) == 0:
             logger.info("No source issues found for group: %s.", group_name)
             return
 
-        if ActionInputs.is_structured_output_enabled():
+        # Create an issue summary table for every issue, the rows are grouped in a single pass
+        sort_columns: tuple[str, ...] = self._configuration.index_sort_columns
+        if self._configuration.structured_output_enabled:
+            repository_tables = RepositoryIndexTableBuilder(self.project_statuses_included, sort_columns)
+            repository_tables.add_issues(issues)
+            for repository_id, table_builder in repository_tables.items():
+                self._write_index_pages(issue_index_page_template, group_name, table_builder, repository_id)
+        else:
+            table_builder = IndexTableBuilder(self.project_statuses_included, sort_columns)
+            table_builder.add_issues(issues)
+            self._write_index_pages(issue_index_page_template, group_name, table_builder)
+
+    def _write_index_pages(
+        self,
+        issue_index_page_template: CompiledTemplate,
+        group_name: str,
+        table_builder: IndexTableBuilder,
+        repository_id: Optional[str] = None,
+    ) -> None:
+        """
+        Write the index page with the summary table. A table with more rows than the index page size
+        is split into the numbered index pages.
+
+        @param issue_index_page_template: The compiled template for generating the index mdoc page.
+        @param group_name: The name of the group directory.
+        @param table_builder: The builder holding the table rows.
+        @param repository_id: The repository of the index page if the structured output is generated.
+        @return: None
+        """
+        replacement = {"date": datetime.now().strftime("%Y-%m-%d")}
+        if repository_id is not None:
             replacement["data_level_name"] = repository_id.split("/")[1]
 
-        # Replace the issue placeholders in the index template
-        index_page: str = issue_index_page_template.format(**replacement)
+        page_size: int = self._configuration.index_page_size
+        page_count: int = table_builder.get_page_count(page_size)
 
-        # Generate a directory structure path for the index page
-        # Note: repository_id is used only if the structured output is generated
         index_directory_path: str = self._generate_index_directory_path(group_name, repository_id)
-
-        # Create an index page file
-        with open(os.path.join(index_directory_path, "_index.md"), "w", encoding="utf-8") as f:
-            f.write(index_page)
-
-    def _generate_sub_level_index_page(self, index_template: str, repository_id: str, group_name) -> None:
+        for page_number, issue_table in enumerate(table_builder.iter_pages(page_size), start=1):
+            replacement["issue_overview_table"] = issue_table
+            replacement["index_page_title_suffix"] = get_index_page_title_suffix(page_number, page_count)
+            replacement["index_page_navigation"] = build_index_page_navigation(page_number, page_count)
+            index_page_path = os.path.join(index_directory_path, get_index_page_filename(page_number))
+            self._write_output_page(index_page_path, issue_index_page_template.render(replacement))
+
+    def _generate_sub_level_index_page(
+        self, index_template: CompiledTemplate, organization_name: str, group_name: str
+    ) -> None:
         """
         Generates an index page for the structured output based on the level.
 
-        @param index_template: The template string for generating the index MDoc page.
-        @param repository_id: The repository ID of a repository that stores the issues.
+        @param index_template: The compiled template for generating the index MDoc page.
+        @param organization_name: The name of the organization owning the repositories of the issues.
+        @param group_name: The name of the group directory.
         @return: None
         """
         replacement = {
             "date": datetime.now().strftime("%Y-%m-%d"),
+            "organization_name": organization_name,
         }
 
-        organization_name = repository_id.split("/")[0]
-        replacement["organization_name"] = organization_name
-
         # Replace the issue placeholders in the index template
-        sub_level_index_page = index_template.format(**replacement)
+        sub_level_index_page = index_template.render(replacement)
 
         # Create a sub-index page file
         output_path = os.path.join(make_absolute_path(self._output_path), group_name, organization_name)
-        os.makedirs(output_path, exist_ok=True)
-        with open(os.path.join(output_path, "_index.md"), "w", encoding="utf-8") as f:
-            f.write(sub_level_index_page)
-
-    def _generate_mdoc_line(self, issue: Issue) -> str:
-        """
-        Generates an MDoc summary line for a single issue.
-
-        @param issue: The source Issue object containing the issue data.
-        @return: The MDoc line for the issue.
-        """
-        organization_name = issue.organization_name
-        repository_name = issue.repository_name
-        number = issue.issue_number
-        title = issue.title
-        title = title.replace("|", " _ ")
-        issue_link_base = issue.title.replace(" ", "-").lower()
-        issue_mdoc_link = f"features#{issue_link_base}"
-        url = issue.html_url
-        state = issue.state
-
-        status_list = [project_status.status for project_status in issue.project_statuses]
-        status = ", ".join(status_list) if status_list else "---"
-
-        # Change the bool values to more user-friendly characters
-        if self.project_statuses_included:
-            if issue.linked_to_project:
-                linked_to_project = LINKED_TO_PROJECT_TRUE
-            else:
-                linked_to_project = LINKED_TO_PROJECT_FALSE
-
-            # Generate the MDoc issue line WITH extra project data
-            md_issue_line = (
-                f"| {organization_name} | {repository_name} | [#{number} - {title}]({issue_mdoc_link}) |"
-                f" {linked_to_project} | {status} |<a href='{url}' target='_blank'>GitHub link</a> |\n"
-            )
-        else:
-            # Generate the MDoc issue line WITHOUT project data
-            md_issue_line = (
-                f"| {organization_name} | {repository_name} | [#{number} - {title}]({issue_mdoc_link}) |"
-                f" {state} |<a href='{url}' target='_blank'>GitHub link</a> |\n"
-            )
-
-        return md_issue_line
+        self._directory_planner.ensure(output_path)
+        self._write_output_page(os.path.join(output_path, "_index.md"), sub_level_index_page)
 
     def _generate_issue_summary_table(self, issue: Issue) -> str:
         """
@@ -451,80 +743,7 @@ class MdocExporter(Exporter):
         @param issue: The source Issue object containing the issue data.
         @return: The string representation of the issue info in a table format.
         """
-        # Join issue labels into one string
-        issue_labels = issue.labels
-        labels = ", ".join(issue_labels) if issue_labels else None
-
-        # Format issue URL as an MDoc link
-        issue_url_ = issue.html_url
-        issue_url = f"<a href='{issue_url_}' target='_blank'>GitHub link</a> " if issue_url_ else None
-
-        # Define the header for the issue summary table
-        headers = [
-            "Organization name",
-            "Repository name",
-            "Issue number",
-            "Title",
-            "State",
-            "Issue URL",
-            "Created at",
-            "Updated at",
-            "Closed at",
-            "Labels",
-        ]
-
-        # Define the values for the issue summary table
-        values = [
-            issue.organization_name,
-            issue.repository_name,
-            issue.issue_number,
-            issue.title,
-            issue.state.lower() if issue.state else None,
-            issue_url,
-            issue.created_at,
-            issue.updated_at,
-            issue.closed_at,
-            labels,
-        ]
-
-        # Update the summary table based on the project data mining situation
-        if self.project_statuses_included:
-            project_statuses = issue.project_statuses
-
-            if issue.linked_to_project:
-                project_data_header = [
-                    "Project title",
-                    "Status",
-                    "Priority",
-                    "Size",
-                    "MoSCoW",
-                ]
-
-                for project_status in project_statuses:
-                    # Update the summary data table for every project attached to the repository issue
-                    project_data_values = [
-                        project_status.project_title,
-                        project_status.status,
-                        project_status.priority,
-                        project_status.size,
-                        project_status.moscow,
-                    ]
-
-                    headers.extend(project_data_header)
-                    values.extend(project_data_values)
-            else:
-                headers.append("Linked to project")
-                linked_to_project = LINKED_TO_PROJECT_FALSE
-                values.append(linked_to_project)
-
-        # Initialize the MDoc table
-        issue_info = "| Attribute | Content |\n|---|---|\n"
-
-        # Add together all the attributes from the summary table in MDoc format
-        for attribute, content in zip(headers, values):
-            issue_info += f"| {attribute} | {content} |\n"
-
-        return issue_info
+        return build_issue_summary_table(issue, self.project_statuses_included)
 
     def _generate_index_directory_path(self, group_name: str, repository_id: Optional[str]) -> str:
         """
@@ -533,21 +752,31 @@ class MdocExporter(Exporter):
         @param repository_id: The repository ID.
         @return: The generated directory path.
         """
+        output_path: str = self._get_index_directory_path(group_name, repository_id)
+        self._directory_planner.ensure(output_path)
+
+        return output_path
+
+    def _get_index_directory_path(self, group_name: str, repository_id: Optional[str]) -> str:
+        """
+        Get the directory path of the index page based on whether structured output is required.
+
+        @param repository_id: The repository ID.
+        @return: The directory path.
+        """
         output_path: str = os.path.join(make_absolute_path(self._output_path), group_name)
 
-        if ActionInputs.is_structured_output_enabled() and repository_id:
+        if self._configuration.structured_output_enabled and repository_id:
             organization_name, repository_name = repository_id.split("/")
             output_path = os.path.join(output_path, organization_name, repository_name)
 
-        os.makedirs(output_path, exist_ok=True)
-
         return output_path
 
     def _load_all_templates(self) -> bool:
         """
         Load all template files for generating the MDoc pages.
 
-        @return: A tuple containing all loaded template files.
+        @return: True if all templates were loaded and compiled, False otherwise.
         """
         project_root = Path(__file__).resolve().parent.parent
         templates_base_path = os.path.join(project_root, "templates")
@@ -567,27 +796,38 @@ class MdocExporter(Exporter):
 
         report_page_template_file = os.path.join(templates_base_path, "report_page_template.md")
 
-        _us_issue_page_detail_template: Optional[str] = load_template(
+        _us_issue_page_detail_template: Optional[CompiledTemplate] = self._load_compiled_template(
             us_issue_detail_page_template,
             "User Story detail page template file was not successfully loaded.",
+            self.ISSUE_PAGE_PLACEHOLDERS,
         )
-        _feat_issue_page_detail_template: Optional[str] = load_template(
+        _feat_issue_page_detail_template: Optional[CompiledTemplate] = self._load_compiled_template(
             feat_issue_detail_page_template,
             "Feature detail page template file was not successfully loaded.",
+            self.ISSUE_PAGE_PLACEHOLDERS,
         )
-        _func_issue_page_detail_template: Optional[str] = load_template(
+        _func_issue_page_detail_template: Optional[CompiledTemplate] = self._load_compiled_template(
             func_issue_detail_page_template,
             "Functionality detail page template file was not successfully loaded.",
+            self.ISSUE_PAGE_PLACEHOLDERS,
         )
 
-        _us_index_no_struct_template_file: Optional[str] = load_template(
+        index_page_placeholders: tuple[str, ...] = (
+            self.STRUCTURED_INDEX_PAGE_PLACEHOLDERS
+            if self._configuration.structured_output_enabled
+            else self.INDEX_PAGE_PLACEHOLDERS
+        )
+        _us_index_no_struct_template_file: Optional[CompiledTemplate] = self._load_compiled_template(
             us_index_no_struct_template_file,
             "User Story index page template file was not successfully loaded.",
+            index_page_placeholders,
         )
-        _feat_index_no_struct_template_file: Optional[str] = load_template(
+        _feat_index_no_struct_template_file: Optional[CompiledTemplate] = self._load_compiled_template(
             feat_index_no_struct_template_file,
             "Feature index page template file was not successfully loaded.",
+            index_page_placeholders,
         )
+        # The root-level pages are written as they are, their templates are never rendered
         _us_index_root_level_template_page: Optional[str] = load_template(
             us_index_root_level_template_file,
             "Structured User Story index page template file for root level was not successfully loaded.",
@@ -596,14 +836,16 @@ class MdocExporter(Exporter):
             feat_index_root_level_template_file,
             "Structured Feature index page template file for root level was not successfully loaded.",
         )
-        _index_org_level_template_file = load_template(
+        _index_org_level_template_file: Optional[CompiledTemplate] = self._load_compiled_template(
             index_org_level_template_file,
             "Structured index page template file for organization level was not successfully loaded.",
+            self.ORG_LEVEL_PAGE_PLACEHOLDERS,
         )
 
-        _report_page_template: Optional[str] = load_template(
+        _report_page_template: Optional[CompiledTemplate] = self._load_compiled_template(
             report_page_template_file,
             "Report page template file was not successfully loaded.",
+            self.REPORT_PAGE_PLACEHOLDERS,
         )
 
         if (
@@ -632,11 +874,42 @@ class MdocExporter(Exporter):
 
         return True
 
+    @staticmethod
+    def _load_compiled_template(
+        file_path: str, error_message: str, placeholders: Sequence[str]
+    ) -> Optional[CompiledTemplate]:
+        """
+        Load the template file and compile it. The placeholders are checked here, so a broken template
+        fails before any page is generated.
+
+        @param file_path: The path to the template file.
+        @param error_message: The error message to log if the file cannot be read.
+        @param placeholders: The placeholder names the template may use.
+        @return: The compiled template or None if the template cannot be read or is not valid.
+        """
+        template_source: Optional[str] = load_template(file_path, error_message)
+        if template_source is None:
+            return None
+
+        try:
+            return CompiledTemplate(template_source, placeholders)
+        except ValueError as e:
+            logger.error("MDoc page generation - template '%s' is not valid: %s", file_path, str(e))
+            return None
+
     def _update_error_page(self, issue: Issue, group: str) -> None:
-        if ActionInputs.is_report_page_generation_enabled() and issue.errors:
-            keys = self._report_page_content.keys()
-            if group not in keys:
-                self._report_page_content[group] = REPORT_PAGE_HEADER
+        collision = self._path_namer.pop_collision(
+            make_issue_key(issue.organization_name, issue.repository_name, issue.issue_number)
+        )
+        if collision is not None:
+            self._instrumentation.count(COUNTER_PATH_COLLISIONS)
+            issue.add_errors({PATH_COLLISION_ERROR_TYPE: collision.describe(make_absolute_path(self._output_path))})
+
+        if issue.errors:
+            self._instrumentation.count(COUNTER_ERRORS, len(issue.errors))
+
+        if (self._configuration.report_page_enabled or self._configuration.report_json_enabled) and issue.errors:
+            rows: list[ReportRow] = self._report_rows.setdefault(group, [])
 
             repository_id: str = issue.repository_id
             number: int = issue.issue_number
@@ -646,9 +919,7 @@ class MdocExporter(Exporter):
                 html_url = issue.html_url
 
             for error_type, error_message in issue.errors.items():
-                self._report_page_content[
-                    group
-                ] += f"| {error_type} | [{repository_id}#{number}]({html_url}) | {error_message} |\n"
+                rows.append(ReportRow(error_type, repository_id, number, html_url, error_message))
 
     def _generate_directory_path_us(self, parent_path: str, repository_id: str) -> str:
         """
@@ -657,7 +928,7 @@ class MdocExporter(Exporter):
         @return: The list of generated directory paths.
         """
         # If structured output is enabled, create a directory path based on the repository
-        if ActionInputs.is_structured_output_enabled() and repository_id:
+        if self._configuration.structured_output_enabled and repository_id:
             organization_name, repository_name = repository_id.split("/")
             output_path = os.path.join(self._output_path, parent_path, organization_name, repository_name)
         else:
@@ -672,10 +943,10 @@ class MdocExporter(Exporter):
 
         @return: The list of generated directory paths.
         """
-        safe_title = sanitize_filename(feature_title)
+        safe_title = self._path_namer.sanitize(feature_title)
 
         # If structured output is enabled, create a directory path based on the repository
-        if ActionInputs.is_structured_output_enabled() and repository_id:
+        if self._configuration.structured_output_enabled and repository_id:
             organization_name, repository_name = repository_id.split("/")
             output_path = os.path.join(self._output_path, parent_path, organization_name, repository_name, safe_title)
         else:
@@ -684,20 +955,21 @@ class MdocExporter(Exporter):
 
         return output_path
 
-    def _generate_directory_path_func(self, parent_path: str, repository_id: str, feature_title: str) -> str:
+    def _generate_directory_path_func(self, parent_path: str, repository_id: str, feature_directory_name: str) -> str:
         """
         Generate a list of directory paths based on enabled features.
 
+        @param feature_directory_name: The sanitized directory name of the parent Feature.
         @return: The list of generated directory paths.
         """
         # If structured output is enabled, create a directory path based on the repository
-        if ActionInputs.is_structured_output_enabled() and repository_id:
+        if self._configuration.structured_output_enabled and repository_id:
             organization_name, repository_name = repository_id.split("/")
             output_path = os.path.join(
-                self._output_path, parent_path, organization_name, repository_name, feature_title
+                self._output_path, parent_path, organization_name, repository_name, feature_directory_name
             )
         else:
             # If structured output is not enabled, create a directory path based on the parent path
-            output_path = os.path.join(self._output_path, parent_path, feature_title)
+            output_path = os.path.join(self._output_path, parent_path, feature_directory_name)
 
         return output_path
@@ -0,0 +1,258 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the page generation engine used by the MDoc exporter. A page is described
+by a `PageJob`, rendered into its final content and written into the output directory, either
+serially or with the help of the thread/process pool of a `PagePool`. The directories of all pages are created
+upfront by the `DirectoryPlanner`, so writing a page only opens its file.
+"""
+
+import logging
+import os
+import time
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, Sequence
+
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.directory_planner import DirectoryPlanner
+from living_doc_generator.instrumentation import (
+    COUNTER_BYTES_WRITTEN,
+    COUNTER_PAGES,
+    SPAN_RENDER,
+    SPAN_WRITE,
+    Instrumentation,
+)
+from utils.constants import PARALLEL_MODE_OFF, PARALLEL_MODE_THREADS, SUPPORTED_PARALLEL_MODES
+from utils.page_writer import PageWriter
+
+logger = logging.getLogger(__name__)
+
+# Number of page jobs sent to a rendering process at once
+PROCESS_POOL_CHUNK_SIZE = 64
+
+
+class PageJob(NamedTuple):
+    """
+    A description of a single page: where it is stored, which template it uses and the values
+    of the template placeholders.
+    """
+
+    directory: str
+    filename: str
+    template: CompiledTemplate
+    replacements: dict[str, Any]
+
+
+def render_page(job: PageJob) -> str:
+    """
+    Render the page content of the provided job.
+
+    Note: Kept on module level, so it can be sent to a rendering process.
+
+    @param job: The page job to render.
+    @return: The rendered page content.
+    """
+    return job.template.render(job.replacements)
+
+
+def render_page_timed(job: PageJob) -> tuple[str, float]:
+    """
+    Render the page content of the provided job and measure the rendering time.
+
+    Note: Kept on module level, so it can be sent to a rendering process.
+
+    @param job: The page job to render.
+    @return: The rendered page content and the rendering time in seconds.
+    """
+    start = time.perf_counter()
+    content = render_page(job)
+    return content, time.perf_counter() - start
+
+
+def write_page(job: PageJob, content: str, page_writer: Optional[PageWriter] = None) -> int:
+    """
+    Write the rendered page content into the job's output file. The job directory must already exist.
+    The write is skipped if the file already holds the identical content.
+
+    @param job: The page job describing the output file.
+    @param content: The rendered page content.
+    @param page_writer: The writer of the output files, a new one if None.
+    @return: The number of written bytes, 0 if the write was skipped.
+    """
+    writer: PageWriter = page_writer if page_writer is not None else PageWriter()
+    written_bytes = writer.write(os.path.join(job.directory, job.filename), content)
+
+    logger.debug("Generated MDoc page: %s.", job.filename)
+    return written_bytes
+
+
+def render_and_write_page(
+    job: PageJob, instrumentation: Optional[Instrumentation] = None, page_writer: Optional[PageWriter] = None
+) -> None:
+    """
+    Render the page content of the provided job and write it into the output directory.
+
+    @param job: The page job to process.
+    @param instrumentation: The instrumentation recording the render and write spans, if any.
+    @param page_writer: The writer of the output files, a new one if None.
+    @return: None
+    """
+    content, render_seconds = render_page_timed(job)
+    if instrumentation is not None:
+        instrumentation.add_span(SPAN_RENDER, render_seconds)
+    _write_page_recorded(job, content, instrumentation, page_writer)
+
+
+class PagePool:
+    """
+    A class representing the workers of the parallel mode, created once per run and shared by all page batches,
+    so the worker processes and threads are started only once. Use it as a context manager, the workers are
+    stopped on exit.
+    """
+
+    def __init__(self, mode: str, workers: Optional[int] = None):
+        if mode not in SUPPORTED_PARALLEL_MODES:
+            raise ValueError(f"Unsupported parallel mode: '{mode}'.")
+
+        self.mode: str = mode
+        self._workers: Optional[int] = workers
+        self._renderers: Optional[Executor] = None
+        self._writers: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "PagePool":
+        if self.mode != PARALLEL_MODE_OFF:
+            self._writers = ThreadPoolExecutor(max_workers=self._workers)
+        if self.mode not in (PARALLEL_MODE_OFF, PARALLEL_MODE_THREADS):
+            # Loaded only here, the process pool pulls in multiprocessing
+            from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+            self._renderers = ProcessPoolExecutor(max_workers=self._workers)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        for executor in (self._renderers, self._writers):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._renderers = None
+        self._writers = None
+
+    def generate(
+        self,
+        jobs: Sequence[PageJob],
+        directory_planner: Optional[DirectoryPlanner] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        page_writer: Optional[PageWriter] = None,
+    ) -> None:
+        """
+        Render and write all provided page jobs by the workers of the pool.
+
+        The content of every page depends only on its job, so all modes produce identical output.
+        An exception raised by any job is re-raised in the calling thread.
+
+        @param jobs: The page jobs to process.
+        @param directory_planner: The planner creating the page directories, a new one if None.
+        @param instrumentation: The instrumentation recording the render and write spans, if any.
+        @param page_writer: The writer of the output files, a new one if None.
+        @return: None
+        """
+        # Create all page directories before any page is written
+        planner: DirectoryPlanner = directory_planner if directory_planner is not None else DirectoryPlanner()
+        for job in jobs:
+            planner.plan(job.directory)
+        planner.create_planned()
+
+        file_writer: PageWriter = page_writer if page_writer is not None else PageWriter()
+
+        if self._writers is None:
+            for job in jobs:
+                render_and_write_page(job, instrumentation, file_writer)
+            return
+
+        if self._renderers is None:
+            futures: list[Future] = [
+                self._writers.submit(render_and_write_page, job, instrumentation, file_writer) for job in jobs
+            ]
+            _wait_for_all(futures)
+            return
+
+        # Render in worker processes, write the results by a thread pool as they come back in job order
+        rendered_pages = self._renderers.map(render_page_timed, jobs, chunksize=PROCESS_POOL_CHUNK_SIZE)
+        futures = []
+        for job, (content, render_seconds) in zip(jobs, rendered_pages):
+            if instrumentation is not None:
+                instrumentation.add_span(SPAN_RENDER, render_seconds)
+            futures.append(self._writers.submit(_write_page_recorded, job, content, instrumentation, file_writer))
+        _wait_for_all(futures)
+
+
+# pylint: disable=too-many-arguments
+def generate_pages(
+    jobs: Sequence[PageJob],
+    mode: str,
+    workers: Optional[int] = None,
+    directory_planner: Optional[DirectoryPlanner] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    page_writer: Optional[PageWriter] = None,
+) -> None:
+    """
+    Render and write all provided page jobs using the selected parallel mode, by a pool used only for them.
+
+    @param jobs: The page jobs to process.
+    @param mode: The parallel mode - off, threads or processes.
+    @param workers: The maximum number of workers, None for the executor's default.
+    @param directory_planner: The planner creating the page directories, a new one if None.
+    @param instrumentation: The instrumentation recording the render and write spans, if any.
+    @param page_writer: The writer of the output files, a new one if None.
+    @return: None
+    """
+    with PagePool(mode, workers) as page_pool:
+        page_pool.generate(jobs, directory_planner, instrumentation, page_writer)
+
+
+def _write_page_recorded(
+    job: PageJob, content: str, instrumentation: Optional[Instrumentation], page_writer: Optional[PageWriter]
+) -> None:
+    """
+    Write the rendered page and record the write span, the page and its written bytes.
+
+    @param job: The page job describing the output file.
+    @param content: The rendered page content.
+    @param instrumentation: The instrumentation to record into, if any.
+    @param page_writer: The writer of the output files, a new one if None.
+    @return: None
+    """
+    if instrumentation is None:
+        write_page(job, content, page_writer)
+        return
+
+    start = time.perf_counter()
+    written_bytes = write_page(job, content, page_writer)
+    instrumentation.add_span(SPAN_WRITE, time.perf_counter() - start)
+    instrumentation.count(COUNTER_PAGES)
+    instrumentation.count(COUNTER_BYTES_WRITTEN, written_bytes)
+
+
+def _wait_for_all(futures: Sequence[Future]) -> None:
+    """
+    Wait for all futures in submission order and re-raise the first error.
+
+    @param futures: The futures to wait for.
+    @return: None
+    """
+    for future in futures:
+        future.result()
@@ -0,0 +1,178 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the PageManifest class, which keeps track of the pages generated by the previous run
+to support the incremental regeneration of the output.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from typing import Optional
+
+from living_doc_generator.page_generation import PageJob
+
+logger = logging.getLogger(__name__)
+
+
+def compute_page_digest(job: PageJob) -> str:
+    """
+    Compute a digest of all inputs of the page: the template and the replacements.
+    The generation date is left out, so the page of an unchanged issue keeps its original date.
+
+    @param job: The page job to compute the digest for.
+    @return: The hex digest of the page inputs.
+    """
+    replacements = {key: value for key, value in job.replacements.items() if key != "date"}
+    payload = json.dumps([job.template.source, replacements], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PageManifest:
+    """
+    A class representing the manifest of the generated output. It maps every issue key to its page path
+    and the digest of the page inputs, and lists all other files produced by the run.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        output_path: str,
+        previous_pages: Optional[dict[str, dict[str, str]]] = None,
+        previous_files: Optional[list[str]] = None,
+    ):
+        self._output_path = output_path
+        self._previous_pages: dict[str, dict[str, str]] = previous_pages or {}
+        self._previous_files: set[str] = set(previous_files or [])
+
+        self._pages: dict[str, dict[str, str]] = {}
+        self._files: set[str] = set()
+
+        self.unchanged_pages_count: int = 0
+        self.changed_pages_count: int = 0
+
+    @classmethod
+    def load(cls, manifest_path: str, output_path: str) -> "PageManifest":
+        """
+        Load the manifest of the previous run. A missing or unreadable manifest results in an empty one,
+        which leads to the regeneration of all pages.
+
+        @param manifest_path: The path to the manifest file.
+        @param output_path: The path to the output directory described by the manifest.
+        @return: The loaded PageManifest object.
+        """
+        if not os.path.isfile(manifest_path):
+            logger.info("No page manifest found at '%s'. All pages will be generated.", manifest_path)
+            return cls(output_path)
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Page manifest at '%s' could not be read. All pages will be generated.", manifest_path)
+            return cls(output_path)
+
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            logger.warning("Page manifest at '%s' has unsupported format. All pages will be generated.", manifest_path)
+            return cls(output_path)
+
+        return cls(output_path, data.get("pages", {}), data.get("files", []))
+
+    @property
+    def has_previous_run(self) -> bool:
+        """Getter of the flag telling whether the manifest describes a previous run."""
+        return len(self._previous_files) > 0
+
+    def register_page(self, issue_key: str, file_path: str, digest: str) -> bool:
+        """
+        Register the issue page produced by this run and decide whether it must be written.
+
+        @param issue_key: The unique key of the issue.
+        @param file_path: The path to the issue page file.
+        @param digest: The digest of the page inputs.
+        @return: True if the page changed and must be written, False if the existing file is up to date.
+        """
+        relative_path = self._to_relative_path(file_path)
+        self._pages[issue_key] = {"path": relative_path, "hash": digest}
+        self._files.add(relative_path)
+
+        previous_page = self._previous_pages.get(issue_key)
+        if (
+            previous_page is not None
+            and previous_page.get("path") == relative_path
+            and previous_page.get("hash") == digest
+            and os.path.isfile(file_path)
+        ):
+            self.unchanged_pages_count += 1
+            return False
+
+        self.changed_pages_count += 1
+        return True
+
+    def track_file(self, file_path: str) -> None:
+        """
+        Track a file, which is not an issue page, produced by this run.
+
+        @param file_path: The path to the produced file.
+        @return: None
+        """
+        self._files.add(self._to_relative_path(file_path))
+
+    def remove_orphaned_files(self) -> int:
+        """
+        Remove the files produced by the previous run, which were not produced by this run.
+        Directories left empty are removed as well.
+
+        @return: The number of removed files.
+        """
+        removed_count = 0
+        for relative_path in sorted(self._previous_files - self._files):
+            file_path = os.path.join(self._output_path, relative_path)
+            try:
+                os.remove(file_path)
+                removed_count += 1
+            except FileNotFoundError:
+                continue
+
+            logger.debug("Removed orphaned file: %s.", relative_path)
+            self._remove_empty_parent_directories(os.path.dirname(file_path))
+
+        return removed_count
+
+    def save(self, manifest_path: str) -> None:
+        """
+        Save the manifest describing this run.
+
+        @param manifest_path: The path to the manifest file.
+        @return: None
+        """
+        data = {"version": self.VERSION, "pages": self._pages, "files": sorted(self._files)}
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+
+    def _to_relative_path(self, file_path: str) -> str:
+        return os.path.relpath(file_path, self._output_path).replace(os.sep, "/")
+
+    def _remove_empty_parent_directories(self, directory: str) -> None:
+        output_path = os.path.abspath(self._output_path)
+        directory = os.path.abspath(directory)
+        while directory.startswith(output_path + os.sep) and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
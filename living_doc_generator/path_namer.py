@@ -0,0 +1,132 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the PathNamer class, which names the page files and directories of the output:
+it memoizes the sanitized names and keeps the registry of the claimed paths, so two issues whose names
+sanitize to the same path do not overwrite each other.
+"""
+
+import logging
+import os
+
+from typing import NamedTuple, Optional
+
+from utils.utils import sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+
+class PathCollision(NamedTuple):
+    """
+    A path claimed by an issue while it was already claimed by another issue.
+    """
+
+    requested_path: str
+    resolved_path: str
+    owner: str
+    previous_owner: str
+
+    def describe(self, output_path: str) -> str:
+        """
+        Describe the collision for the report.
+
+        @param output_path: The output directory, the paths are shown relative to it.
+        @return: The description of the collision.
+        """
+        requested_path = os.path.relpath(self.requested_path, output_path).replace(os.sep, "/")
+        resolved_path = os.path.relpath(self.resolved_path, output_path).replace(os.sep, "/")
+        return (
+            f"Path '{requested_path}' is already used by issue {self.previous_owner},"
+            f" the output of this issue is written to '{resolved_path}'."
+        )
+
+
+class PathNamer:
+    """
+    A class representing the naming service of the output paths. A path is owned by the first issue claiming it.
+    Any other issue claiming the same path gets the first free path with a number suffix ('_2', '_3', ...),
+    so the same issues claiming in the same order always get the same paths. Paths differing only in case are
+    the same path, as they are on a case-insensitive filesystem.
+    """
+
+    def __init__(self):
+        self._sanitized_names: dict[str, str] = {}
+        self._path_owners: dict[str, str] = {}
+        self._claimed_names: dict[tuple[str, str, str], str] = {}
+        self._collisions: dict[str, PathCollision] = {}
+
+    def sanitize(self, name: str) -> str:
+        """
+        Sanitize the name of a page file or directory. Every distinct name is sanitized only once.
+
+        @param name: The name to sanitize.
+        @return: The sanitized name.
+        """
+        sanitized_name = self._sanitized_names.get(name)
+        if sanitized_name is None:
+            sanitized_name = sanitize_filename(name)
+            self._sanitized_names[name] = sanitized_name
+
+        return sanitized_name
+
+    def claim(self, directory: str, stem: str, extension: str, owner: str) -> str:
+        """
+        Claim the path in the directory for the owner. Claiming the same path again by the same owner
+        returns the same name.
+
+        @param directory: The directory of the path.
+        @param stem: The sanitized name without the extension.
+        @param extension: The extension of the name, empty for a directory.
+        @param owner: The key of the issue claiming the path.
+        @return: The name of the claimed path, with the number suffix if the path is owned by another issue.
+        """
+        requested_name = f"{stem}{extension}"
+        claimed_name = self._claimed_names.get((directory, requested_name, owner))
+        if claimed_name is not None:
+            return claimed_name
+
+        name = requested_name
+        suffix = 1
+        while self._path_owners.setdefault(os.path.join(directory, name).casefold(), owner) != owner:
+            suffix += 1
+            name = f"{stem}_{suffix}{extension}"
+
+        if name != requested_name:
+            requested_path = os.path.join(directory, requested_name)
+            collision = PathCollision(
+                requested_path, os.path.join(directory, name), owner, self._path_owners[requested_path.casefold()]
+            )
+            self._collisions[owner] = collision
+            logger.warning(
+                "Path collision - '%s' is already used by issue %s, issue %s uses '%s'.",
+                requested_path,
+                collision.previous_owner,
+                owner,
+                collision.resolved_path,
+            )
+
+        self._claimed_names[(directory, requested_name, owner)] = name
+        return name
+
+    def pop_collision(self, owner: str) -> Optional[PathCollision]:
+        """
+        Take the collision of the path claimed by the owner, so it is reported only once.
+
+        @param owner: The key of the issue.
+        @return: The collision or None if the path of the issue did not collide.
+        """
+        return self._collisions.pop(owner, None)
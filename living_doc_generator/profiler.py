@@ -0,0 +1,172 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the Profiler class, which wraps a generation run in cProfile and optionally
+takes tracemalloc snapshots at the end of every generation stage.
+"""
+
+import cProfile
+import logging
+import os
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+from utils.constants import (
+    MEMORY_PROFILE_SUFFIX,
+    PROFILE_STATS_SUFFIX,
+    PROFILING_MODE_FULL,
+    PROFILING_TOP_ALLOCATIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Traces of the profiling machinery itself are left out of the memory profile
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+class StageSnapshot(NamedTuple):
+    """
+    The traced memory at the end of a generation stage.
+    """
+
+    stage: str
+    snapshot: tracemalloc.Snapshot
+    current_bytes: int
+    peak_bytes: int
+
+
+class Profiler:
+    """
+    A class representing the profiler of a single generation run. The CPU profile is stored as a pstats dump,
+    the memory profile as a text summary of the largest allocations added by every stage.
+    Only the calling thread is profiled by cProfile, the page workers of the parallel modes are not.
+    """
+
+    def __init__(self, mode: str, output_path: str, top_allocations: int = PROFILING_TOP_ALLOCATIONS):
+        self._memory_enabled: bool = mode == PROFILING_MODE_FULL
+        self._top_allocations: int = top_allocations
+        self._profile: cProfile.Profile = cProfile.Profile()
+        self._profiling: bool = False
+        self._stage_snapshots: list[StageSnapshot] = []
+
+        output_base_path = output_path.rstrip(os.sep)
+        self.stats_path: str = f"{output_base_path}{PROFILE_STATS_SUFFIX}"
+        self.memory_profile_path: Optional[str] = (
+            f"{output_base_path}{MEMORY_PROFILE_SUFFIX}" if self._memory_enabled else None
+        )
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """
+        Profile the enclosed block and write the profiles when it ends.
+
+        @return: The context manager profiling the block.
+        """
+        if self._memory_enabled:
+            tracemalloc.start()
+            self.take_snapshot("start")
+
+        self._set_cpu_profiling(True)
+        try:
+            yield
+        finally:
+            self._set_cpu_profiling(False)
+            if self._memory_enabled:
+                self.take_snapshot("end")
+                tracemalloc.stop()
+            self._write_profiles()
+
+    def take_snapshot(self, stage: str) -> None:
+        """
+        Take a memory snapshot at the end of the stage. Used as the span listener of the instrumentation.
+        Does nothing when the memory is not traced.
+
+        @param stage: The name of the finished stage.
+        @return: None
+        """
+        if not tracemalloc.is_tracing():
+            return
+
+        # The snapshot itself is not part of the CPU profile
+        profiling = self._profiling
+        self._set_cpu_profiling(False)
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        self._stage_snapshots.append(StageSnapshot(stage, snapshot, current_bytes, peak_bytes))
+        self._set_cpu_profiling(profiling)
+
+    def _set_cpu_profiling(self, enabled: bool) -> None:
+        """
+        Enable or disable the CPU profile, unless it is already in the requested state.
+
+        @param enabled: True to enable the CPU profile, False to disable it.
+        @return: None
+        """
+        if enabled and not self._profiling:
+            self._profile.enable()
+        elif not enabled and self._profiling:
+            self._profile.disable()
+        self._profiling = enabled
+
+    def _write_profiles(self) -> None:
+        """
+        Write the pstats dump and the memory profile summary.
+
+        @return: None
+        """
+        self._profile.dump_stats(self.stats_path)
+        logger.info("Profiling - CPU profile written to '%s'.", self.stats_path)
+
+        if self.memory_profile_path is None:
+            return
+
+        with open(self.memory_profile_path, "w", encoding="utf-8") as f:
+            f.write(self._build_memory_summary())
+        logger.info("Profiling - memory profile written to '%s'.", self.memory_profile_path)
+
+    def _build_memory_summary(self) -> str:
+        """
+        Build the memory profile summary: the traced memory at the end of every stage and the largest
+        allocations added since the previous stage.
+
+        @return: The memory profile summary.
+        """
+        lines: list[str] = []
+        previous: Optional[StageSnapshot] = None
+        for stage_snapshot in self._stage_snapshots:
+            lines.append(
+                f"Stage '{stage_snapshot.stage}': current {stage_snapshot.current_bytes / 1024:.1f} KiB,"
+                f" peak {stage_snapshot.peak_bytes / 1024:.1f} KiB\n"
+            )
+            if previous is not None:
+                lines.append(f"  Top {self._top_allocations} allocations added since '{previous.stage}':\n")
+                differences = stage_snapshot.snapshot.compare_to(previous.snapshot, "lineno")
+                lines.extend(f"    {difference}\n" for difference in differences[: self._top_allocations])
+            previous = stage_snapshot
+
+        if previous is not None:
+            lines.append(f"Top {self._top_allocations} allocations at the end of the run:\n")
+            statistics = previous.snapshot.statistics("lineno")
+            lines.extend(f"  {statistic}\n" for statistic in statistics[: self._top_allocations])
+
+        return "".join(lines)
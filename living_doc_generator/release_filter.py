@@ -0,0 +1,61 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the ReleaseFilter class, which prunes the source issues not published
+in the release documentation before any page is prepared.
+"""
+
+from typing import Any, Iterable, Optional
+
+from living_doc_utilities.model.issue import Issue
+
+from living_doc_generator.issue_filter import IssueFilter
+from utils.constants import RELEASE_ISSUE_STATE
+
+
+class ReleaseFilter(IssueFilter):
+    """
+    A class representing the release filter. An issue is a release issue if it is closed and, when release
+    labels are set, carries at least one of them. The decision reads only the state and the labels, so it is
+    made on the raw issue data as well, before the Issue object is created.
+    """
+
+    def __init__(self, release_labels: Iterable[str] = ()):
+        super().__init__()
+        self._release_labels: frozenset[str] = frozenset(label.lower() for label in release_labels)
+
+    def is_release_issue(self, state: Optional[str], labels: Optional[Iterable[str]]) -> bool:
+        """
+        Decide whether the issue is published in the release documentation.
+
+        @param state: The state of the issue.
+        @param labels: The labels of the issue.
+        @return: True if the issue is kept, False otherwise.
+        """
+        if (state or "").lower() != RELEASE_ISSUE_STATE:
+            return False
+
+        if not self._release_labels:
+            return True
+
+        return any(label.lower() in self._release_labels for label in labels or ())
+
+    def matches(self, issue_data: dict[str, Any]) -> bool:
+        return self.is_release_issue(issue_data.get(Issue.STATE), issue_data.get(Issue.LABELS))
+
+    def matches_issue(self, issue: Issue) -> bool:
+        return self.is_release_issue(issue.state, issue.labels)
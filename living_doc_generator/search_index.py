@@ -0,0 +1,106 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the SearchIndex class, which collects the inverted index of the issue pages
+while they are generated, so the doc site can search the pages without scanning the index tables.
+"""
+
+import json
+import re
+
+from typing import Any, Iterable, Optional
+
+from utils.constants import SEARCH_INDEX_MAX_TOKEN_LENGTH, SEARCH_INDEX_MIN_TOKEN_LENGTH
+
+SEARCH_INDEX_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> set[str]:
+    """
+    Split the text into the unique lowercase word tokens. Too short and too long tokens
+    (e.g. encoded images pasted into the issue body) are dropped.
+
+    @param text: The text to tokenize.
+    @return: The tokens of the text.
+    """
+    if not text:
+        return set()
+
+    return {
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if SEARCH_INDEX_MIN_TOKEN_LENGTH <= len(token) <= SEARCH_INDEX_MAX_TOKEN_LENGTH
+    }
+
+
+class SearchIndex:
+    """
+    A class representing the inverted index of the issue pages. Every page is a document identified
+    by its position in the document list. Every token maps to the ascending ids of the documents
+    containing it, so the same pages added in the same order always produce the identical index.
+    """
+
+    def __init__(self):
+        self._documents: list[dict[str, str]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add_document(self, page_path: str, title: str, labels: Iterable[str], body: Optional[str]) -> int:
+        """
+        Add the page as a document, indexed by its title, labels and body.
+
+        @param page_path: The path to the page relative to the output directory.
+        @param title: The page title.
+        @param labels: The labels of the page issue.
+        @param body: The body of the page issue.
+        @return: The id of the document.
+        """
+        document_id = len(self._documents)
+        self._documents.append({"path": page_path, "title": title})
+
+        tokens = tokenize(title) | tokenize(body)
+        for label in labels:
+            tokens |= tokenize(label)
+
+        for token in tokens:
+            self._postings.setdefault(token, []).append(document_id)
+
+        return document_id
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Build the search index file content.
+
+        @return: The documents and the postings of all tokens, ordered by the token.
+        """
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "documents": self._documents,
+            "index": {token: self._postings[token] for token in sorted(self._postings)},
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize the search index into compact JSON.
+
+        @return: The search index as a JSON string.
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,211 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the deterministic partition of the source issues into shards, generated by separate runs,
+and the shard manifests, which let the merge step check that the outputs of all shards are present.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+
+from typing import Iterable, Iterator
+
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.issue import Issue
+
+from living_doc_generator.feature_index import FeatureIndex
+from utils.constants import SHARD_MANIFEST_FILENAME
+
+logger = logging.getLogger(__name__)
+
+SHARD_MANIFEST_VERSION = 1
+
+# Size of the chunks the source file is read by when computing its digest
+SOURCE_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+def get_shard_key(issue: Issue) -> str:
+    """
+    Get the key the shard of the issue is derived from. A Functionality issue shares the key of its Feature,
+    so the pages stored in the same Feature directory are generated by the same shard.
+
+    @param issue: The source Issue object.
+    @return: The shard key.
+    """
+    if isinstance(issue, FunctionalityIssue):
+        feature_ids = issue.get_related_feature_ids()
+        if feature_ids:
+            return FeatureIndex.make_key(issue.repository_id, feature_ids[0])
+
+    return FeatureIndex.make_key(issue.repository_id, issue.issue_number)
+
+
+def get_shard_index(issue: Issue, shard_count: int) -> int:
+    """
+    Get the shard of the issue. The CRC32 checksum of the shard key is used, as it is stable across processes
+    and Python versions, unlike the built-in hash of strings.
+
+    @param issue: The source Issue object.
+    @param shard_count: The number of shards.
+    @return: The index of the shard generating the issue page.
+    """
+    return zlib.crc32(get_shard_key(issue).encode("utf-8")) % shard_count
+
+
+def select_shard_issues(
+    issues: Iterable[tuple[str, Issue]], shard_index: int, shard_count: int
+) -> Iterator[tuple[str, Issue]]:
+    """
+    Select the issues belonging to the shard.
+
+    @param issues: The (issue key, Issue object) pairs of all source issues.
+    @param shard_index: The index of the shard.
+    @param shard_count: The number of shards.
+    @return: The (issue key, Issue object) pairs of the shard issues, in the source order.
+    """
+    for key, issue in issues:
+        if get_shard_index(issue, shard_count) == shard_index:
+            yield key, issue
+
+
+def compute_source_digest(file_path: str) -> str:
+    """
+    Compute the digest of the source file, so the merge step can check all shards were generated from it.
+
+    @param file_path: The path to the source file.
+    @return: The SHA-256 hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(SOURCE_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def get_shard_manifest_path(output_path: str, shard_index: int, shard_count: int) -> str:
+    """
+    Get the path to the shard manifest, stored in the output directory of the shard.
+
+    @param output_path: The path to the output directory.
+    @param shard_index: The index of the shard.
+    @param shard_count: The number of shards.
+    @return: The path to the shard manifest file.
+    """
+    return os.path.join(output_path, SHARD_MANIFEST_FILENAME.format(index=shard_index, count=shard_count))
+
+
+def write_shard_manifest(output_path: str, shard_index: int, shard_count: int, source_digest: str) -> None:
+    """
+    Write the manifest of the shard, listing all files of the shard output.
+
+    @param output_path: The path to the output directory of the shard.
+    @param shard_index: The index of the shard.
+    @param shard_count: The number of shards.
+    @param source_digest: The digest of the source file the shard was generated from.
+    @return: None
+    """
+    files = sorted(
+        os.path.relpath(os.path.join(directory, file_name), output_path).replace(os.sep, "/")
+        for directory, _, file_names in os.walk(output_path)
+        for file_name in file_names
+    )
+    data = {
+        "version": SHARD_MANIFEST_VERSION,
+        "shard_index": shard_index,
+        "shard_count": shard_count,
+        "source_digest": source_digest,
+        "files": files,
+    }
+    with open(get_shard_manifest_path(output_path, shard_index, shard_count), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+    logger.info("Shard %d/%d - manifest with %d files written.", shard_index, shard_count, len(files))
+
+
+def check_shard_manifests(output_path: str, shard_count: int, source_digest: str) -> bool:
+    """
+    Check that the outputs of all shards are present in the output directory, were generated from the same source
+    and do not overlap. A file listed by two shards was written by both, so one of the outputs was overwritten.
+
+    @param output_path: The path to the output directory holding the outputs of all shards.
+    @param shard_count: The number of shards.
+    @param source_digest: The digest of the source file of the merge step.
+    @return: True if the outputs of all shards are complete, False otherwise.
+    """
+    complete = True
+    # Shard owning every listed file, so the files listed by more than one shard are found
+    file_shards: dict[str, int] = {}
+    for shard_index in range(shard_count):
+        manifest_path = get_shard_manifest_path(output_path, shard_index, shard_count)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            logger.error(
+                "Shard %d/%d - manifest '%s' not found or unreadable.", shard_index, shard_count, manifest_path
+            )
+            complete = False
+            continue
+
+        if data.get("version") != SHARD_MANIFEST_VERSION or data.get("source_digest") != source_digest:
+            logger.error("Shard %d/%d - output was generated from a different source.", shard_index, shard_count)
+            complete = False
+            continue
+
+        files: list[str] = data.get("files", [])
+        shared_files = [path for path in files if file_shards.setdefault(path, shard_index) != shard_index]
+        if shared_files:
+            logger.error(
+                "Shard %d/%d - %d files are also listed by another shard, e.g. '%s' by shard %d.",
+                shard_index,
+                shard_count,
+                len(shared_files),
+                shared_files[0],
+                file_shards[shared_files[0]],
+            )
+            complete = False
+
+        missing_files = [path for path in files if not os.path.isfile(os.path.join(output_path, path))]
+        if missing_files:
+            logger.error(
+                "Shard %d/%d - %d files are missing, e.g. '%s'.",
+                shard_index,
+                shard_count,
+                len(missing_files),
+                missing_files[0],
+            )
+            complete = False
+
+    return complete
+
+
+def remove_shard_manifests(output_path: str, shard_count: int) -> None:
+    """
+    Remove the manifests of all shards from the merged output directory.
+
+    @param output_path: The path to the output directory.
+    @param shard_count: The number of shards.
+    @return: None
+    """
+    for shard_index in range(shard_count):
+        manifest_path = get_shard_manifest_path(output_path, shard_index, shard_count)
+        if os.path.isfile(manifest_path):
+            os.remove(manifest_path)
@@ -23,15 +23,21 @@ import logging
 import os.path
 import sys
 
+from typing import TYPE_CHECKING
+
 from living_doc_utilities.constants import OUTPUT_PATH
 from living_doc_utilities.github.utils import set_action_output
 from living_doc_utilities.logging_config import setup_logging
 
-from action_inputs import ActionInputs
-from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
-from utils.constants import GENERATOR_OUTPUT_PATH
+from action_inputs import ActionConfiguration, ActionInputs
+from utils.constants import GENERATOR_OUTPUT_PATH, PROFILING_MODE_OFF
 from utils.utils import make_absolute_path
 
+# The generator with the exporter and all model classes is imported only after the configuration is validated,
+# so validation failures exit without loading it
+if TYPE_CHECKING:
+    from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
+
 
 def run() -> None:
     """
@@ -48,10 +54,11 @@ def run() -> None:
         logger.error("Living Documentation generator - mdoc - user configuration validation failed.")
         sys.exit(1)
 
+    configuration: ActionConfiguration = ActionInputs.get_configuration()
     output_path: str = make_absolute_path(os.path.join(OUTPUT_PATH, GENERATOR_OUTPUT_PATH, "mdoc"))
 
     # Generate the Living documentation
-    res = MdocLivingDocumentationGenerator(output_path).generate()
+    res = generate(configuration, output_path)
 
     # Set the output for the GitHub Action
     set_action_output("output-path", output_path)
@@ -66,5 +73,59 @@ def run() -> None:
     logger.info("Living Documentation generator - mdoc - generation successfully completed.")
 
 
+def generate(configuration: ActionConfiguration, output_path: str) -> bool:
+    """
+    Generate the Living Documentation and set the timing outputs of the run.
+
+    @param configuration: The configuration of the run.
+    @param output_path: The root output path.
+    @return: True if generation is successful, False otherwise (error occurred).
+    """
+    # pylint: disable=import-outside-toplevel
+    from living_doc_generator.instrumentation import COUNTER_ERRORS, COUNTER_PAGES
+    from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
+
+    generator = MdocLivingDocumentationGenerator(output_path, configuration)
+    if configuration.profiling_mode != PROFILING_MODE_OFF:
+        res = generate_profiled(generator, configuration.profiling_mode, output_path)
+    else:
+        res = generator.generate()
+
+    instrumentation = generator.instrumentation
+    set_action_output("timing-report-path", generator.timing_report_path)
+    set_action_output("generation-seconds", f"{instrumentation.total_seconds:.3f}")
+    set_action_output("pages-count", str(instrumentation.get_counter(COUNTER_PAGES)))
+    set_action_output("errors-count", str(instrumentation.get_counter(COUNTER_ERRORS)))
+    if res and generator.archive_path is not None:
+        set_action_output("archive-path", generator.archive_path)
+
+    return res
+
+
+def generate_profiled(generator: "MdocLivingDocumentationGenerator", profiling_mode: str, output_path: str) -> bool:
+    """
+    Run the generation wrapped in the profiler and set the paths of the profiles as the action outputs.
+
+    @param generator: The generator to run.
+    @param profiling_mode: The profiling mode - cpu or full.
+    @param output_path: The root output path, the profiles are stored next to it.
+    @return: True if generation is successful, False otherwise (error occurred).
+    """
+    from living_doc_generator.profiler import Profiler  # pylint: disable=import-outside-toplevel
+
+    profiler = Profiler(profiling_mode, output_path)
+    # Memory snapshots are taken at the end of every generation stage
+    generator.instrumentation.add_span_listener(profiler.take_snapshot)
+
+    with profiler.profile():
+        res = generator.generate()
+
+    set_action_output("profile-path", profiler.stats_path)
+    if profiler.memory_profile_path is not None:
+        set_action_output("memory-profile-path", profiler.memory_profile_path)
+
+    return res
+
+
 if __name__ == "__main__":
     run()
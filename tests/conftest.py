@@ -16,6 +16,7 @@
 import os
 import pytest
 
+from action_inputs import ActionConfiguration
 from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
 from living_doc_generator.mdoc_exporter import MdocExporter
 from living_doc_utilities.model.feature_issue import FeatureIssue
@@ -49,7 +50,7 @@ def mdoc_exporter(tmp_path):
     """Fixture to create an instance of MdocExporter with modified template paths."""
     output_dir = os.path.join(tmp_path, "output")
     os.makedirs(output_dir, exist_ok=True)
-    return MdocExporter(output_dir)
+    return MdocExporter(output_dir, ActionConfiguration())
 
 
 @pytest.fixture
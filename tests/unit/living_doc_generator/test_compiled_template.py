@@ -0,0 +1,88 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pickle
+
+import pytest
+
+from living_doc_generator.compiled_template import CompiledTemplate
+
+
+# render
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "",
+        "plain text",
+        "{title}",
+        '---\ntitle: "{title}"\ndate: {date}\n---\n\n{issue_content}\n',
+        "{{escaped}} {title} {{ {date} }}",
+        "{title}{title}",
+    ],
+)
+def test_render_equals_str_format(source):
+    # Arrange
+    replacements = {"title": "My Title", "date": "2025-01-01", "issue_content": None}
+    template = CompiledTemplate(source)
+
+    # Act
+    actual = template.render(replacements)
+
+    # Assert
+    assert actual == source.format(**replacements)
+
+
+def test_render_missing_replacement():
+    # Arrange
+    template = CompiledTemplate("{title} {date}")
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        template.render({"title": "T"})
+
+
+def test_placeholders_and_pickle():
+    # Arrange
+    template = CompiledTemplate("{title} {{not}} {date}")
+
+    # Act
+    restored = pickle.loads(pickle.dumps(template))
+
+    # Assert
+    assert template.placeholders == {"title", "date"}
+    assert restored.source == template.source
+    assert restored.render({"title": "T", "date": "D"}) == "T {not} D"
+
+
+# __init__ validation
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("{unknown}", "Unknown placeholder '{unknown}'"),
+        ("{title!r}", "Unsupported placeholder '{title}'"),
+        ("{title:>10}", "Unsupported placeholder '{title}'"),
+        ("{title.upper}", "Unsupported placeholder '{title.upper}'"),
+        ("{}", "Unsupported placeholder '{}'"),
+        ("single } brace", "Single '}'"),
+    ],
+)
+def test_invalid_template(source, message):
+    # Act & Assert
+    with pytest.raises(ValueError, match=message):
+        CompiledTemplate(source, ("title", "date"))
@@ -0,0 +1,96 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+from living_doc_generator.directory_planner import DirectoryPlanner
+
+
+# create_planned
+
+
+def test_create_planned_creates_each_directory_once(tmp_path, mocker):
+    # Arrange
+    planner = DirectoryPlanner()
+    features = os.path.join(tmp_path, "features")
+    feature_1 = os.path.join(features, "feature_1")
+    for _ in range(3):
+        planner.plan(feature_1)
+    planner.plan(features)
+    spy_mkdir = mocker.spy(os, "mkdir")
+
+    # Act
+    created_count = planner.create_planned()
+    planner.plan(feature_1)
+    created_again_count = planner.create_planned()
+
+    # Assert
+    assert created_count == 2
+    assert created_again_count == 0
+    assert [call.args[0] for call in spy_mkdir.call_args_list] == [features, feature_1]
+    assert os.path.isdir(feature_1)
+    assert planner.created_count == 2
+    assert planner.elapsed_seconds > 0
+
+
+def test_create_planned_existing_and_missing_parent(tmp_path):
+    # Arrange
+    planner = DirectoryPlanner()
+    existing = os.path.join(tmp_path, "existing")
+    nested = os.path.join(tmp_path, "missing", "nested")
+    os.makedirs(existing)
+    planner.plan(existing)
+    planner.plan(nested)
+
+    # Act
+    created_count = planner.create_planned()
+
+    # Assert
+    assert created_count == 1
+    assert os.path.isdir(nested)
+
+
+def test_create_planned_without_creating_directories(tmp_path, mocker):
+    # Arrange
+    planner = DirectoryPlanner(create_directories=False)
+    directory = os.path.join(tmp_path, "features")
+    planner.plan(directory)
+    spy_mkdir = mocker.spy(os, "mkdir")
+
+    # Act
+    created_count = planner.create_planned()
+
+    # Assert
+    assert created_count == 0
+    spy_mkdir.assert_not_called()
+    assert not os.path.exists(directory)
+
+
+# ensure
+
+
+def test_ensure(tmp_path, mocker):
+    # Arrange
+    planner = DirectoryPlanner()
+    directory = os.path.join(tmp_path, "user_stories")
+    spy_mkdir = mocker.spy(os, "mkdir")
+
+    # Act
+    planner.ensure(directory)
+    planner.ensure(directory)
+
+    # Assert
+    assert os.path.isdir(directory)
+    spy_mkdir.assert_called_once_with(directory)
@@ -0,0 +1,107 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+
+from living_doc_generator.feature_index import FeatureIndex
+
+
+def _make_functionality(number, body):
+    functionality = FunctionalityIssue()
+    functionality.repository_id = "org/repo"
+    functionality.issue_number = number
+    functionality.body = body
+    return functionality
+
+
+# get_parent
+
+
+def test_get_parent(sample_issues_without_project_states):
+    # Arrange
+    feature_index = FeatureIndex()
+    feature_index.add_feature(sample_issues_without_project_states.get_issue("org/repo/3"))
+    functionality = sample_issues_without_project_states.get_issue("org/repo/5")
+
+    # Act
+    feature_entry = feature_index.get_parent(functionality)
+
+    # Assert
+    assert feature_entry.feature.issue_number == 3
+    assert feature_entry.directory_name == "Sample_Feature_1"
+
+
+def test_get_parent_unknown_or_missing_feature():
+    # Arrange
+    feature_index = FeatureIndex()
+
+    # Act & Assert
+    assert feature_index.get_parent(_make_functionality(7, "### Associated Feature\n- #3\n")) is None
+    assert feature_index.get_parent(_make_functionality(8, "No feature here.")) is None
+
+
+def test_get_parent_of_registered_functionality_parses_body_once(sample_issues_without_project_states, mocker):
+    # Arrange
+    feature_index = FeatureIndex()
+    feature_index.add_feature(sample_issues_without_project_states.get_issue("org/repo/3"))
+    functionality = sample_issues_without_project_states.get_issue("org/repo/5")
+    spy_related_ids = mocker.spy(functionality, "get_related_feature_ids")
+    feature_index.add_functionality(functionality)
+
+    # Act
+    feature_entry = feature_index.get_parent(functionality)
+
+    # Assert
+    assert feature_entry.feature.issue_number == 3
+    spy_related_ids.assert_called_once()
+
+
+# resolve_directory_names
+
+
+def test_resolve_directory_names(sample_issues_without_project_states):
+    # Arrange
+    feature_index = FeatureIndex()
+    feature_index.add_feature(sample_issues_without_project_states.get_issue("org/repo/3"))
+    feature_index.add_feature(sample_issues_without_project_states.get_issue("org/repo/4"))
+    visited = []
+
+    # Act
+    feature_index.resolve_directory_names(lambda key, entry: visited.append(key) or f"{entry.directory_name}_x")
+
+    # Assert
+    assert visited == ["org/repo/3", "org/repo/4"]
+    assert feature_index.get_feature("org/repo/4").directory_name == "Sample_Feature_2_x"
+
+
+# get_functionalities
+
+
+def test_get_functionalities(sample_issues_without_project_states):
+    # Arrange
+    feature_index = FeatureIndex()
+    feature = sample_issues_without_project_states.get_issue("org/repo/3")
+    other_functionality = _make_functionality(7, "### Associated Feature\n- #3\n- #4\n")
+
+    # Act - Functionalities may be registered before their Feature
+    feature_index.add_functionality(sample_issues_without_project_states.get_issue("org/repo/5"))
+    feature_index.add_functionality(other_functionality)
+    feature_index.add_feature(feature)
+
+    # Assert
+    assert [issue.issue_number for issue in feature_index.get_functionalities(feature)] == [5, 7]
+    assert feature_index.get_functionalities(sample_issues_without_project_states.get_issue("org/repo/4")) == [
+        other_functionality
+    ]
@@ -0,0 +1,209 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from living_doc_utilities.model.user_story_issue import UserStoryIssue
+
+from living_doc_generator.issue_record import IssueRecord
+from living_doc_generator.index_table import (
+    IndexTableBuilder,
+    RepositoryIndexTableBuilder,
+    build_index_page_navigation,
+    get_index_page_filename,
+    get_index_page_link,
+    get_index_page_title_suffix,
+)
+from utils.constants import TABLE_HEADER_WITHOUT_PROJECT_DATA
+
+
+def _make_record(repository_id: str, number: int) -> IssueRecord:
+    issue = UserStoryIssue()
+    issue.repository_id = repository_id
+    issue.issue_number = number
+    issue.title = f"Story {number}"
+    issue.state = "open"
+    return IssueRecord.from_issue(issue)
+
+
+# get_index_page_filename
+
+
+def test_get_index_page_filename():
+    # Act & Assert
+    assert get_index_page_filename(1) == "_index.md"
+    assert get_index_page_filename(2) == "_index_2.md"
+
+
+# get_index_page_link
+
+
+def test_get_index_page_link():
+    # Act & Assert
+    assert get_index_page_link(1, 1) == "./"
+    assert get_index_page_link(1, 3) == "./_index_3/"
+    assert get_index_page_link(3, 1) == "../"
+    assert get_index_page_link(3, 2) == "../_index_2/"
+
+
+# get_index_page_title_suffix
+
+
+def test_get_index_page_title_suffix():
+    # Act & Assert
+    assert get_index_page_title_suffix(1, 1) == ""
+    assert get_index_page_title_suffix(2, 5) == " (2/5)"
+
+
+# build_index_page_navigation
+
+
+def test_build_index_page_navigation_single_page():
+    # Act & Assert
+    assert build_index_page_navigation(1, 1) == ""
+
+
+def test_build_index_page_navigation_windowed():
+    # Act
+    navigation = build_index_page_navigation(6, 20)
+
+    # Assert
+    assert navigation == (
+        "\nPages: [« Previous](../_index_5/) | [1](../) | … | [4](../_index_4/) | [5](../_index_5/) | **6**"
+        " | [7](../_index_7/) | [8](../_index_8/) | … | [20](../_index_20/) | [Next »](../_index_7/)\n"
+    )
+
+
+def test_build_index_page_navigation_last_page():
+    # Act
+    navigation = build_index_page_navigation(3, 3)
+
+    # Assert
+    assert navigation == "\nPages: [« Previous](../_index_2/) | [1](../) | [2](../_index_2/) | **3**\n"
+
+
+# format_row
+
+
+def test_format_row_linked_and_not_linked(sample_issues_without_project_states):
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=True)
+    issue = sample_issues_without_project_states.issues["org/repo/1"]
+
+    # Act
+    issue.linked_to_project = True
+    result_linked = builder.format_row(IssueRecord.from_issue(issue))
+    issue.linked_to_project = False
+    result_not_linked = builder.format_row(IssueRecord.from_issue(issue))
+
+    # Assert
+    assert "| org | repo | [#1 - Sample User Story 1]" in result_linked
+    assert "🟢" in result_linked
+    assert "| org | repo | [#1 - Sample User Story 1]" in result_not_linked
+    assert "🔴" in result_not_linked
+
+
+def test_format_row_no_project_data(sample_issues_without_project_states):
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=False)
+    issue = sample_issues_without_project_states.issues["org/repo/1"]
+    issue.linked_to_project = False
+
+    # Act
+    result = builder.format_row(IssueRecord.from_issue(issue))
+
+    # Assert
+    assert result == (
+        "| org | repo | [#1 - Sample User Story 1](features#sample-user-story-1) | In Progress |"
+        "<a href='None' target='_blank'>GitHub link</a> |\n"
+    )
+
+
+# iter_pages
+
+
+def test_iter_pages_keeps_source_order_without_sort_columns():
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=False)
+    builder.add_issues([_make_record("org/b", 2), _make_record("org/a", 1)])
+
+    # Act
+    (table,) = builder.iter_pages(0)
+
+    # Assert
+    assert len(builder) == 2
+    assert table.startswith(TABLE_HEADER_WITHOUT_PROJECT_DATA)
+    assert table.index("[#2 - ") < table.index("[#1 - ")
+
+
+def test_iter_pages_sorts_by_columns():
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=False, sort_columns=("repository", "number"))
+    builder.add_issues([_make_record("org/b", 1), _make_record("org/a", 10), _make_record("org/a", 9)])
+
+    # Act
+    (table,) = builder.iter_pages(0)
+
+    # Assert
+    rows = table[len(TABLE_HEADER_WITHOUT_PROJECT_DATA) :].splitlines()
+    assert [row.split("|")[2].strip() for row in rows] == ["a", "a", "b"]
+    assert "[#9 - " in rows[0] and "[#10 - " in rows[1]
+
+
+def test_iter_pages_splits_rows():
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=False)
+    builder.add_issues([_make_record("org/repo", number) for number in range(1, 6)])
+
+    # Act
+    pages = list(builder.iter_pages(2))
+
+    # Assert
+    assert len(pages) == 3
+    assert all(page.startswith(TABLE_HEADER_WITHOUT_PROJECT_DATA) for page in pages)
+    assert builder.get_page_count(2) == 3
+    assert "[#5 - " in pages[2] and "[#4 - " not in pages[2]
+    assert "".join(page[len(TABLE_HEADER_WITHOUT_PROJECT_DATA) :] for page in pages) == next(builder.iter_pages(0))[
+        len(TABLE_HEADER_WITHOUT_PROJECT_DATA) :
+    ]
+
+
+def test_iter_pages_without_rows():
+    # Arrange
+    builder = IndexTableBuilder(project_statuses_included=False)
+
+    # Act
+    pages = list(builder.iter_pages(2))
+
+    # Assert
+    assert builder.get_page_count(2) == 1
+    assert pages == [TABLE_HEADER_WITHOUT_PROJECT_DATA]
+
+
+# RepositoryIndexTableBuilder
+
+
+def test_repository_index_table_builder_groups_rows():
+    # Arrange
+    builder = RepositoryIndexTableBuilder(project_statuses_included=False, sort_columns=("number",))
+
+    # Act
+    builder.add_issues([_make_record("org/b", 3), _make_record("org/a", 2), _make_record("org/b", 1)])
+
+    # Assert
+    assert len(builder) == 2
+    tables = {repository_id: next(table_builder.iter_pages(0)) for repository_id, table_builder in builder.items()}
+    assert list(tables) == ["org/b", "org/a"]
+    assert tables["org/b"].index("[#1 - ") < tables["org/b"].index("[#3 - ")
+    assert "[#2 - " not in tables["org/b"]
+    assert "[#2 - " in tables["org/a"]
@@ -0,0 +1,117 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+
+import pytest
+
+from action_inputs import ActionConfiguration
+from living_doc_generator.instrumentation import Instrumentation
+from living_doc_generator.mdoc_exporter import MdocExporter
+
+
+# span
+
+
+def test_span_sums_durations_and_calls(mocker):
+    # Arrange
+    instrumentation = Instrumentation()
+    mocker.patch("living_doc_generator.instrumentation.time.perf_counter", side_effect=[1.0, 1.5, 2.0, 2.25, 3.0])
+
+    # Act
+    with instrumentation.span("render"):
+        pass
+    with instrumentation.span("render"):
+        pass
+
+    # Assert
+    assert instrumentation.get_span_seconds("render") == 0.75
+    assert instrumentation.to_dict()["spans"]["render"]["calls"] == 2
+
+
+def test_span_records_duration_when_block_fails():
+    # Arrange
+    instrumentation = Instrumentation()
+
+    # Act
+    with pytest.raises(ValueError):
+        with instrumentation.span("load"):
+            raise ValueError("broken source")
+
+    # Assert
+    assert instrumentation.to_dict()["spans"]["load"]["calls"] == 1
+
+
+# count
+
+
+def test_count_increases_counters():
+    # Arrange
+    instrumentation = Instrumentation()
+
+    # Act
+    instrumentation.count("pages")
+    instrumentation.count("pages")
+    instrumentation.count("bytes_written", 100)
+
+    # Assert
+    assert instrumentation.get_counter("pages") == 2
+    assert instrumentation.get_counter("bytes_written") == 100
+    assert instrumentation.get_counter("errors") == 0
+
+
+# write_json
+
+
+def test_write_json(tmp_path):
+    # Arrange
+    instrumentation = Instrumentation()
+    instrumentation.add_span("index", 0.5)
+    instrumentation.count("pages", 3)
+    file_path = os.path.join(tmp_path, "timing.json")
+
+    # Act
+    instrumentation.write_json(file_path)
+
+    # Assert
+    with open(file_path, "r", encoding="utf-8") as f:
+        timing_report = json.load(f)
+    assert timing_report["spans"] == {"index": {"seconds": 0.5, "calls": 1}}
+    assert timing_report["counters"] == {"pages": 3}
+    assert timing_report["total_seconds"] >= 0
+
+
+# MdocExporter integration
+
+
+@pytest.mark.parametrize("mode", ["off", "threads"])
+def test_export_records_spans_and_counters(tmp_path, sample_issues_with_errors_without_project_states, mode):
+    # Arrange
+    instrumentation = Instrumentation()
+    configuration = ActionConfiguration(report_page_enabled=True, parallel_mode=mode)
+    exporter = MdocExporter(str(tmp_path), configuration, instrumentation=instrumentation)
+
+    # Act
+    exporter.export(issues=sample_issues_with_errors_without_project_states)
+
+    # Assert
+    written_files = [os.path.join(root, name) for root, _, names in os.walk(tmp_path) for name in names]
+    timing_report = instrumentation.to_dict()
+    assert set(timing_report["spans"]) == {"pages", "render", "write", "index", "report"}
+    assert instrumentation.get_counter("pages") == len(written_files)
+    assert instrumentation.get_counter("bytes_written") == sum(os.path.getsize(path) for path in written_files)
+    assert instrumentation.get_counter("directories_created") > 0
+    assert instrumentation.get_counter("errors") > 0
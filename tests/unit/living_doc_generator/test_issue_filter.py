@@ -0,0 +1,54 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_generator.issue_filter import ExpressionIssueFilter
+
+
+# matches_issue
+
+
+@pytest.mark.parametrize("expression", [
+    'type == "FeatureIssue" or issue_number >= 5',
+    'state == "to do" and organization == "org"',
+    'repository == "repo" and not labels contains "bug"',
+    'title == "" or closed_at == ""',
+])
+def test_matches_issue_agrees_with_raw_data(expression, sample_issues_without_project_states):
+    # Arrange
+    issue_filter = ExpressionIssueFilter(expression)
+    issues = sample_issues_without_project_states.issues.values()
+
+    # Act
+    actual = [issue_filter.matches_issue(issue) for issue in issues]
+
+    # Assert
+    assert actual == [issue_filter.matches(issue.to_dict()) for issue in issues]
+    assert (issue_filter.kept_count, issue_filter.dropped_count) == (0, 0)
+
+
+def test_matches_issue_reads_only_used_attributes(mocker, sample_issues_without_project_states):
+    # Arrange
+    issue_filter = ExpressionIssueFilter('repository_id == "org/repo"')
+    issue = sample_issues_without_project_states.get_issue("org/repo/1")
+    mock_to_dict = mocker.patch.object(issue, "to_dict")
+
+    # Act
+    actual = issue_filter.matches_issue(issue)
+
+    # Assert
+    assert actual
+    mock_to_dict.assert_not_called()
@@ -0,0 +1,135 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+
+import pytest
+
+from living_doc_utilities.factory.issue_factory import IssueFactory
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.user_story_issue import UserStoryIssue
+
+from living_doc_generator.issue_loader import SourceParseError, load_feature_index, stream_issues
+
+
+# stream_issues
+
+
+def test_stream_issues(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+
+    # Act
+    streamed = list(stream_issues(source_path))
+
+    # Assert
+    assert [key for key, _ in streamed] == list(sample_issues_without_project_states.issues.keys())
+    assert isinstance(streamed[0][1], UserStoryIssue)
+    assert isinstance(streamed[2][1], FeatureIssue)
+    assert isinstance(streamed[4][1], FunctionalityIssue)
+    assert streamed[4][1].get_related_feature_ids() == [3]
+    assert streamed[0][1].to_dict() == sample_issues_without_project_states.issues["org/repo/1"].to_dict()
+
+
+def test_stream_issues_with_filter(tmp_path, sample_issues_without_project_states, mocker):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+    mock_issue_factory = mocker.patch(
+        "living_doc_generator.issue_loader.IssueFactory.get", wraps=IssueFactory.get
+    )
+
+    # Act
+    streamed = list(stream_issues(source_path, lambda data: data["issue_number"] % 2 == 0))
+
+    # Assert
+    assert [key for key, _ in streamed] == ["org/repo/2", "org/repo/4", "org/repo/6"]
+    assert mock_issue_factory.call_count == 3
+
+
+def test_stream_issues_skips_invalid_issue(tmp_path, mocker):
+    # Arrange
+    mock_logger_warning = mocker.patch("living_doc_generator.issue_loader.logger.warning")
+    source_path = os.path.join(tmp_path, "source.json")
+    with open(source_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "org/repo/1": {"type": "UserStoryIssue", "title": "No repository", "issue_number": 1},
+                "org/repo/2": {"type": "UserStoryIssue", "repository_id": "org/repo", "title": "OK", "issue_number": 2},
+                "org/repo/3": None,
+            },
+            f,
+        )
+
+    # Act
+    streamed = list(stream_issues(source_path))
+
+    # Assert
+    assert [key for key, _ in streamed] == ["org/repo/2"]
+    assert mock_logger_warning.call_count == 2
+
+
+def test_stream_issues_malformed_source(tmp_path, mocker):
+    # Arrange
+    mock_logger_error = mocker.patch("living_doc_generator.issue_loader.logger.error")
+    source_path = os.path.join(tmp_path, "source.json")
+    with open(source_path, "w", encoding="utf-8") as f:
+        f.write('{"org/repo/1": {"type": "UserStoryIssue", "repository_id": "org/repo", "issue_number": 1}, "org/repo/2": {')
+
+    # Act
+    with pytest.raises(SourceParseError):
+        list(stream_issues(source_path))
+
+    # Assert
+    mock_logger_error.assert_called_once()
+    assert mock_logger_error.call_args[0][:2] == ("Failed to parse JSON from %s: %s", source_path)
+
+
+# load_feature_index
+
+
+def test_load_feature_index(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+
+    # Act
+    feature_index = load_feature_index(source_path)
+
+    # Assert
+    assert len(feature_index) == 2
+    feature_entry = feature_index.get_feature("org/repo/3")
+    assert feature_entry.feature.title == "Sample Feature 1"
+    assert feature_entry.feature.repository_id == "org/repo"
+    assert feature_entry.feature.body is None
+    assert feature_entry.directory_name == "Sample_Feature_1"
+    assert feature_index.get_feature("org/repo/4") is not None
+
+
+def test_load_feature_index_with_filter(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+
+    # Act
+    feature_index = load_feature_index(source_path, lambda data: data["issue_number"] == 4)
+
+    # Assert
+    assert len(feature_index) == 1
+    assert feature_index.get_feature("org/repo/3") is None
+    assert feature_index.get_feature("org/repo/4") is not None
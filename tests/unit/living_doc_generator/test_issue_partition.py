@@ -0,0 +1,102 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.issue import Issue
+
+from living_doc_generator.issue_partition import IssuePartition
+from living_doc_generator.issue_record import IssueRecord
+
+
+# from_issues
+
+
+def test_from_issues(sample_issues_without_project_states):
+    # Arrange
+    other_issue = Issue()
+    other_issue.repository_id = "org/other-repo"
+    other_issue.issue_number = 99
+    sample_issues_without_project_states.add_issue("org/other-repo/99", other_issue)
+
+    # Act
+    partition = IssuePartition.from_issues(sample_issues_without_project_states)
+
+    # Assert
+    assert partition.issues_count == 7
+    assert [issue.issue_number for issue in partition.user_stories] == [1, 2]
+    assert [issue.issue_number for issue in partition.features] == [3, 4]
+    assert [issue.issue_number for issue in partition.functionalities] == [5, 6]
+    assert [issue.issue_number for issue in partition.page_issues] == [1, 2, 3, 4, 5, 6]
+    assert len(partition.feature_index) == 2
+    assert partition.feature_index.get_parent(partition.functionalities[0]).feature.issue_number == 3
+    assert partition.organization_names == ["org"]
+    assert partition.user_stories[0] == IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/1"])
+
+
+# add
+
+
+def test_add_index_only():
+    # Arrange
+    partition = IssuePartition()
+    issue = FunctionalityIssue()
+    issue.repository_id = "org/repo"
+    issue.issue_number = 5
+
+    # Act
+    partition.add(issue, index_only=True)
+
+    # Assert
+    assert partition.issues_count == 1
+    assert partition.functionalities == []
+    assert partition.page_issues == []
+    assert partition.organization_names == ["org"]
+
+
+def test_add_index_only_feature_keeps_only_record():
+    # Arrange
+    partition = IssuePartition()
+    issue = FeatureIssue()
+    issue.repository_id = "org/repo"
+    issue.issue_number = 3
+    issue.title = "Sample Feature"
+    issue.body = "A long body which is not needed by the index pages."
+
+    # Act
+    partition.add(issue, index_only=True)
+
+    # Assert
+    assert partition.features == [IssueRecord.from_issue(issue)]
+    assert len(partition.feature_index) == 0
+    assert partition.page_issues == []
+
+
+# release_page_issues
+
+
+def test_release_page_issues(sample_issues_without_project_states):
+    # Arrange
+    partition = IssuePartition.from_issues(sample_issues_without_project_states)
+
+    # Act
+    partition.release_page_issues()
+
+    # Assert
+    assert partition.page_issues == []
+    assert partition.functionalities == []
+    assert len(partition.feature_index) == 0
+    assert [record.issue_number for record in partition.user_stories] == [1, 2]
+    assert [record.issue_number for record in partition.features] == [3, 4]
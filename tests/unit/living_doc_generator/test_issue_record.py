@@ -0,0 +1,44 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from living_doc_generator.issue_record import IssueRecord
+
+
+# from_issue
+
+
+def test_from_issue(sample_issues_with_project_states):
+    # Arrange
+    issue = sample_issues_with_project_states.issues["org/repo/1"]
+    issue.html_url = "https://github.com/org/repo/issues/1"
+    issue.add_errors({"SomeError": "Fake some error."})
+
+    # Act
+    record = IssueRecord.from_issue(issue)
+
+    # Assert
+    assert record == IssueRecord(
+        key="org/repo/1",
+        repository_id="org/repo",
+        organization_name="org",
+        repository_name="repo",
+        issue_number=1,
+        title="Sample User Story 1",
+        state="In Progress",
+        html_url="https://github.com/org/repo/issues/1",
+        linked_to_project=True,
+        statuses=("In Progress",),
+    )
+    assert not hasattr(record, "__dict__")
@@ -11,35 +11,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import copy
+import os
+import shutil
+import tarfile
+
+import pytest
+
 from living_doc_utilities.model.issues import Issues
 
-from action_inputs import ActionInputs
+from action_inputs import ActionConfiguration
 from living_doc_generator.living_doc_generator import MdocLivingDocumentationGenerator
 
 
+def _read_tree(root_path: str) -> dict[str, str]:
+    tree: dict[str, str] = {}
+    for directory, _, file_names in os.walk(root_path):
+        for file_name in file_names:
+            with open(os.path.join(directory, file_name), "r", encoding="utf-8") as f:
+                tree[os.path.relpath(os.path.join(directory, file_name), root_path)] = f.read()
+    return tree
+
+
 # generate
 
 
 def test_generate_correct_behaviour(mocker):
     # Arrange
-    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator("/path/to/output")
-    mock_clean_output_directory = mocker.patch.object(generator, "_clean_output_directory")
+    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(
+        "/path/to/output", ActionConfiguration(source="mocked_source")
+    )
+    mock_prepare_output_directory = mocker.patch.object(generator, "_prepare_output_directory")
     mock_generate_living_documents = mocker.patch.object(generator, "_generate_living_documents", return_value=True)
     mock_logger_info = mocker.patch("living_doc_generator.living_doc_generator.logger.info")
     mock_logger_debug = mocker.patch("living_doc_generator.living_doc_generator.logger.debug")
     mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
     mock_issues_load.return_value = Issues()
-    mock_action_inputs = mocker.patch("action_inputs.ActionInputs.get_source", return_value="mocked_source")
 
     # Act
     generator.generate()
 
     # Assert
-    mock_clean_output_directory.assert_called_once()
+    mock_prepare_output_directory.assert_called_once()
     mock_generate_living_documents.assert_called_once()
-    mock_action_inputs.assert_called_once()
-    mock_issues_load.assert_called_once_with(ActionInputs.get_source())
-    mock_logger_debug.assert_called_once_with("Output directory cleaned.")
+    mock_issues_load.assert_called_once_with("mocked_source")
+    mock_logger_debug.assert_called_once_with("Output directory prepared.")
     mock_logger_info.assert_has_calls(
         [
             mocker.call("Loading of issue from source - started."),
@@ -51,21 +67,332 @@ def test_generate_correct_behaviour(mocker):
     )
 
 
-# _clean_output_directory
+def test_generate_incremental_rewrites_only_changed_pages(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    configuration = ActionConfiguration(source="mocked_source", incremental_generation_enabled=True)
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+    mock_issues_load.side_effect = lambda _: copy.deepcopy(sample_issues_without_project_states)
+    us_page_1 = os.path.join(output_path, "user_stories", "1_sample_user_story_1.md")
+    us_page_2 = os.path.join(output_path, "user_stories", "2_sample_user_story_2.md")
+    feat_page_2 = os.path.join(output_path, "features", "Sample_Feature_2", "_index.md")
+
+    # Act - first run generates all pages
+    assert MdocLivingDocumentationGenerator(output_path, configuration).generate()
+    first_run_mtime = os.stat(us_page_1).st_mtime_ns
+    os.utime(us_page_1, ns=(first_run_mtime - 10**9, first_run_mtime - 10**9))
+
+    # Act - second run with one changed and one removed issue
+    sample_issues_without_project_states.issues["org/repo/2"].body = "Changed body."
+    sample_issues_without_project_states.issues.pop("org/repo/4")
+    sample_issues_without_project_states.issues.pop("org/repo/6")
+    assert MdocLivingDocumentationGenerator(output_path, configuration).generate()
+
+    # Assert
+    assert os.stat(us_page_1).st_mtime_ns == first_run_mtime - 10**9
+    with open(us_page_2, "r", encoding="utf-8") as f:
+        assert "Changed body." in f.read()
+    assert not os.path.exists(feat_page_2)
+    assert os.path.isfile(f"{output_path}_manifest.json")
+
+
+def test_generate_skips_identical_pages_and_removes_stale_files(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    configuration = ActionConfiguration(source="mocked_source")
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+    mock_issues_load.side_effect = lambda _: copy.deepcopy(sample_issues_without_project_states)
+    us_page_1 = os.path.join(output_path, "user_stories", "1_sample_user_story_1.md")
+    feat_page_2 = os.path.join(output_path, "features", "Sample_Feature_2", "_index.md")
+
+    # Act - first run generates all pages
+    assert MdocLivingDocumentationGenerator(output_path, configuration).generate()
+    first_run_mtime = os.stat(us_page_1).st_mtime_ns
+    os.utime(us_page_1, ns=(first_run_mtime - 10**9, first_run_mtime - 10**9))
+
+    # Act - second run with one removed issue
+    sample_issues_without_project_states.issues.pop("org/repo/4")
+    sample_issues_without_project_states.issues.pop("org/repo/6")
+    generator = MdocLivingDocumentationGenerator(output_path, configuration)
+    assert generator.generate()
+
+    # Assert
+    assert os.stat(us_page_1).st_mtime_ns == first_run_mtime - 10**9
+    assert not os.path.exists(os.path.dirname(feat_page_2))
+    assert generator.instrumentation.get_counter("skipped_writes") > 0
+
+
+def test_generate_crash_keeps_previous_output(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    configuration = ActionConfiguration(source="mocked_source")
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+    mock_issues_load.side_effect = lambda _: copy.deepcopy(sample_issues_without_project_states)
+    assert MdocLivingDocumentationGenerator(output_path, configuration).generate()
+    previous_files = sorted(os.path.join(directory, name) for directory, _, names in os.walk(output_path) for name in names)
+    mocker.patch("living_doc_generator.mdoc_exporter.MdocExporter._generate_index_page", side_effect=KeyError("date"))
+
+    # Act
+    with pytest.raises(KeyError):
+        MdocLivingDocumentationGenerator(output_path, configuration).generate()
+
+    # Assert
+    assert sorted(os.path.join(directory, name) for directory, _, names in os.walk(output_path) for name in names) == previous_files
+    assert not os.path.exists(f"{output_path}.staging")
+
+
+def test_generate_archive_matches_directory_output(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    directory_output_path = os.path.join(tmp_path, "directory", "mdoc")
+    serial_output_path = os.path.join(tmp_path, "serial", "mdoc")
+    threads_output_path = os.path.join(tmp_path, "threads", "mdoc")
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+    mock_issues_load.side_effect = lambda _: copy.deepcopy(sample_issues_without_project_states)
+
+    # Act
+    assert MdocLivingDocumentationGenerator(directory_output_path, ActionConfiguration(source="mocked_source")).generate()
+    serial_generator = MdocLivingDocumentationGenerator(
+        serial_output_path, ActionConfiguration(source="mocked_source", archive_format="tar.gz")
+    )
+    assert serial_generator.generate()
+    threads_generator = MdocLivingDocumentationGenerator(
+        threads_output_path,
+        ActionConfiguration(source="mocked_source", archive_format="tar.gz", parallel_mode="threads", parallel_workers=4),
+    )
+    assert threads_generator.generate()
+
+    # Assert
+    directory_files = sorted(
+        os.path.relpath(os.path.join(directory, file_name), directory_output_path).replace(os.sep, "/")
+        for directory, _, file_names in os.walk(directory_output_path)
+        for file_name in file_names
+    )
+    assert serial_generator.archive_path == f"{serial_output_path}.tar.gz"
+    assert not os.path.exists(serial_output_path)
+    with tarfile.open(serial_generator.archive_path) as tar:
+        assert tar.getnames() == directory_files
+    with open(serial_generator.archive_path, "rb") as serial, open(threads_generator.archive_path, "rb") as threads:
+        assert serial.read() == threads.read()
+
+
+def test_generate_archive_removes_output_directory_of_earlier_run(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+    mock_issues_load.side_effect = lambda _: copy.deepcopy(sample_issues_without_project_states)
+    assert MdocLivingDocumentationGenerator(output_path, ActionConfiguration(source="mocked_source")).generate()
+    archive_generator = MdocLivingDocumentationGenerator(
+        output_path, ActionConfiguration(source="mocked_source", archive_format="zip")
+    )
+
+    # Act
+    res = archive_generator.generate()
+
+    # Assert
+    assert res
+    assert os.path.isfile(archive_generator.archive_path)
+    assert not os.path.exists(output_path)
+
+
+def test_generate_shards_and_merge_matches_unsharded_output(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+    unsharded_path = os.path.join(tmp_path, "unsharded", "mdoc")
+    merged_path = os.path.join(tmp_path, "merged", "mdoc")
+    configuration = ActionConfiguration(source=source_path, structured_output_enabled=True, report_page_enabled=True)
+    assert MdocLivingDocumentationGenerator(unsharded_path, configuration).generate()
+
+    # Act - every shard runs separately, their outputs are downloaded into one directory and merged
+    for shard_index in range(3):
+        shard_path = os.path.join(tmp_path, f"shard_{shard_index}", "mdoc")
+        shard_configuration = configuration._replace(shard_index=shard_index, shard_count=3, streaming_enabled=shard_index == 1)
+        assert MdocLivingDocumentationGenerator(shard_path, shard_configuration).generate()
+        shutil.copytree(shard_path, merged_path, dirs_exist_ok=True)
+    merge_generator = MdocLivingDocumentationGenerator(merged_path, configuration._replace(shard_count=3, shard_merge_enabled=True))
+    res = merge_generator.generate()
+
+    # Assert
+    assert res
+    assert _read_tree(merged_path) == _read_tree(unsharded_path)
+
+
+@pytest.mark.parametrize("streaming_enabled", [False, True], ids=["loaded", "streamed"])
+def test_generate_shards_and_merge_with_path_collisions(tmp_path, sample_issues_without_project_states, streaming_enabled):
+    # Arrange - the same User Story and Feature in many repositories collide in the flat output across the shards
+    for repository_index in range(8):
+        for key in ("org/repo/1", "org/repo/3"):
+            issue = copy.deepcopy(sample_issues_without_project_states.get_issue(key))
+            issue.repository_id = f"org/repo-{repository_index}"
+            sample_issues_without_project_states.add_issue(f"{issue.repository_id}/{issue.issue_number}", issue)
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+    unsharded_path = os.path.join(tmp_path, "unsharded", "mdoc")
+    merged_path = os.path.join(tmp_path, "merged", "mdoc")
+    configuration = ActionConfiguration(source=source_path, report_page_enabled=True, streaming_enabled=streaming_enabled)
+    assert MdocLivingDocumentationGenerator(unsharded_path, configuration).generate()
+
+    # Act
+    for shard_index in range(3):
+        shard_path = os.path.join(tmp_path, f"shard_{shard_index}", "mdoc")
+        shard_configuration = configuration._replace(shard_index=shard_index, shard_count=3)
+        assert MdocLivingDocumentationGenerator(shard_path, shard_configuration).generate()
+        shutil.copytree(shard_path, merged_path, dirs_exist_ok=True)
+    merge_generator = MdocLivingDocumentationGenerator(merged_path, configuration._replace(shard_count=3, shard_merge_enabled=True))
+    res = merge_generator.generate()
+
+    # Assert
+    assert res
+    merged_tree = _read_tree(merged_path)
+    assert merged_tree == _read_tree(unsharded_path)
+    assert os.path.join("user_stories", "1_sample_user_story_1_9.md") in merged_tree
+    assert os.path.join("features", "Sample_Feature_1_9", "_index.md") in merged_tree
+
+
+def test_generate_merge_with_missing_shard_fails(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+    output_path = os.path.join(tmp_path, "mdoc")
+    configuration = ActionConfiguration(source=source_path, shard_count=2)
+    assert MdocLivingDocumentationGenerator(output_path, configuration).generate()
+    mock_log_error = mocker.patch("living_doc_generator.living_doc_generator.logger.error")
+
+    # Act
+    res = MdocLivingDocumentationGenerator(output_path, configuration._replace(shard_merge_enabled=True)).generate()
+
+    # Assert
+    assert not res
+    mock_log_error.assert_called_once_with("Shard merge - outputs of the shards are incomplete, merge aborted.")
+    assert not os.path.exists(os.path.join(output_path, "features", "_index.md"))
+
+
+def test_generate_release_filtering_loaded_and_streamed(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    issues = sample_issues_without_project_states
+    for key in ("org/repo/1", "org/repo/3", "org/repo/5"):
+        issues.issues[key].state = "CLOSED"
+    issues.issues["org/repo/1"].labels = ["Documented"]
+    issues.issues["org/repo/3"].labels = ["documented"]
+    source_path = os.path.join(tmp_path, "source.json")
+    issues.save_to_json(source_path)
+    configuration = ActionConfiguration(source=source_path, release_filtering_enabled=True, release_labels=("Documented",))
+    loaded_generator = MdocLivingDocumentationGenerator(os.path.join(tmp_path, "loaded", "mdoc"), configuration)
+    streamed_generator = MdocLivingDocumentationGenerator(
+        os.path.join(tmp_path, "streamed", "mdoc"), configuration._replace(streaming_enabled=True)
+    )
+
+    # Act
+    assert loaded_generator.generate()
+    assert streamed_generator.generate()
+
+    # Assert
+    loaded_tree = _read_tree(os.path.join(tmp_path, "loaded", "mdoc"))
+    assert loaded_tree == _read_tree(os.path.join(tmp_path, "streamed", "mdoc"))
+    assert "user_stories/1_sample_user_story_1.md" in loaded_tree
+    assert "user_stories/2_sample_user_story_2.md" not in loaded_tree
+    assert "features/Sample_Feature_1/_index.md" in loaded_tree
+    assert "features/Sample_Feature_2/_index.md" not in loaded_tree
+    assert not any(path.endswith("sample_functionality_1.md") for path in loaded_tree)
+    for generator in (loaded_generator, streamed_generator):
+        assert generator.instrumentation.get_counter("release_kept") == 2
+        assert generator.instrumentation.get_counter("release_dropped") == 4
+
+
+def test_generate_issue_filter_loaded_and_streamed(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    issues = sample_issues_without_project_states
+    issues.issues["org/repo/1"].labels = ["Documented"]
+    issues.issues["org/repo/3"].labels = ["documented"]
+    source_path = os.path.join(tmp_path, "source.json")
+    issues.save_to_json(source_path)
+    configuration = ActionConfiguration(
+        source=source_path, issue_filter='labels contains "documented" or type == "FunctionalityIssue"'
+    )
+    loaded_generator = MdocLivingDocumentationGenerator(os.path.join(tmp_path, "loaded", "mdoc"), configuration)
+    streamed_generator = MdocLivingDocumentationGenerator(
+        os.path.join(tmp_path, "streamed", "mdoc"), configuration._replace(streaming_enabled=True)
+    )
+
+    # Act
+    assert loaded_generator.generate()
+    assert streamed_generator.generate()
+
+    # Assert
+    loaded_tree = _read_tree(os.path.join(tmp_path, "loaded", "mdoc"))
+    assert loaded_tree == _read_tree(os.path.join(tmp_path, "streamed", "mdoc"))
+    assert "user_stories/1_sample_user_story_1.md" in loaded_tree
+    assert "user_stories/2_sample_user_story_2.md" not in loaded_tree
+    assert "features/Sample_Feature_1/_index.md" in loaded_tree
+    assert "features/Sample_Feature_2/_index.md" not in loaded_tree
+    for generator in (loaded_generator, streamed_generator):
+        assert generator.instrumentation.get_counter("filter_kept") == 4
+        assert generator.instrumentation.get_counter("filter_dropped") == 2
+        assert generator.instrumentation.get_counter("release_kept") == 0
+
+
+def test_generate_streaming(mocker, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    source_path = os.path.join(tmp_path, "source.json")
+    sample_issues_without_project_states.save_to_json(source_path)
+    configuration = ActionConfiguration(source=source_path, streaming_enabled=True)
+    mock_issues_load = mocker.patch("living_doc_utilities.model.issues.Issues.load_from_json")
+
+    # Act
+    res = MdocLivingDocumentationGenerator(output_path, configuration).generate()
+
+    # Assert
+    assert res
+    mock_issues_load.assert_not_called()
+    assert os.path.isfile(os.path.join(output_path, "user_stories", "_index.md"))
+    assert os.path.isfile(os.path.join(output_path, "features", "Sample_Feature_1", "5_sample_functionality_1.md"))
+
+
+def test_generate_streaming_malformed_source(mocker, tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    with open(os.path.join(output_path, "_index.md"), "w", encoding="utf-8") as f:
+        f.write("previous run")
+    source_path = os.path.join(tmp_path, "source.json")
+    with open(source_path, "w", encoding="utf-8") as f:
+        f.write('{"org/repo/1": {"type": "UserStoryIssue", "title": ')
+    configuration = ActionConfiguration(source=source_path, streaming_enabled=True)
+    mock_logger_error = mocker.patch("living_doc_generator.issue_loader.logger.error")
+
+    # Act
+    res = MdocLivingDocumentationGenerator(output_path, configuration).generate()
+
+    # Assert
+    assert not res
+    mock_logger_error.assert_called_once()
+    assert mock_logger_error.call_args[0][0] == "Failed to parse JSON from %s: %s"
+    assert os.listdir(output_path) == ["_index.md"]
+    assert not os.path.exists(os.path.join(tmp_path, "mdoc.staging"))
+
+
+# _prepare_output_directory
 
 
-def test_clean_output_directory_correct_behaviour(mocker):
+def test_prepare_output_directory_keeps_files_and_removes_manifest(tmp_path):
     # Arrange
-    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator("/path/to/output")
-    mock_rmtree = mocker.patch("shutil.rmtree")
-    mock_makedirs = mocker.patch("os.makedirs")
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    previous_page = os.path.join(output_path, "_index.md")
+    manifest_path = os.path.join(tmp_path, "mdoc_manifest.json")
+    for file_path in (previous_page, manifest_path):
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("previous run")
+    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(output_path, ActionConfiguration())
 
     # Act
-    generator._clean_output_directory()
+    generator._prepare_output_directory()
 
     # Assert
-    mock_rmtree.assert_called_once()
-    mock_makedirs.assert_called_once()
+    assert os.path.isfile(previous_page)
+    assert not os.path.exists(manifest_path)
+    assert os.path.isdir(os.path.join(tmp_path, "mdoc.staging"))
 
 
 # _generate_living_documents
@@ -73,7 +400,7 @@ def test_clean_output_directory_correct_behaviour(mocker):
 
 def test_generate_living_documents_correct_behaviour(mocker, tmp_path, sample_issues_with_project_states, mdoc_exporter):
     # Arrange
-    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(str(tmp_path))
+    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(str(tmp_path), ActionConfiguration())
     mock_logger_info = mocker.patch("living_doc_generator.living_doc_generator.logger.info")
     mock_logger_error = mocker.patch("living_doc_generator.living_doc_generator.logger.error")
     mocker.patch("living_doc_generator.mdoc_exporter.MdocExporter.export", return_value=True)
@@ -89,7 +416,7 @@ def test_generate_living_documents_correct_behaviour(mocker, tmp_path, sample_is
 
 def test_generate_living_documents_fail(mocker, tmp_path, sample_issues_with_project_states, mdoc_exporter):
     # Arrange
-    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(str(tmp_path))
+    generator: MdocLivingDocumentationGenerator = MdocLivingDocumentationGenerator(str(tmp_path), ActionConfiguration())
     mock_logger_info = mocker.patch("living_doc_generator.living_doc_generator.logger.info")
     mock_logger_error = mocker.patch("living_doc_generator.living_doc_generator.logger.error")
     mocker.patch("living_doc_generator.mdoc_exporter.MdocExporter.export", return_value=False)
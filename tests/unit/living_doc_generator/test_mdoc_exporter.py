@@ -1,6 +1,14 @@
+import copy
+import json
 import os.path
 import pytest
 
+from action_inputs import ActionConfiguration
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.error_report import ReportRow
+from living_doc_generator.feature_index import FeatureIndex
+from living_doc_generator.issue_partition import IssuePartition
+from living_doc_generator.issue_record import IssueRecord
 from living_doc_generator.mdoc_exporter import MdocExporter
 from living_doc_utilities.model.feature_issue import FeatureIssue
 from living_doc_utilities.model.functionality_issue import FunctionalityIssue
@@ -10,7 +18,7 @@ from living_doc_utilities.model.user_story_issue import UserStoryIssue
 
 def test_generate_issue_summary_table_not_linked_to_project(sample_issues_without_project_states):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
 
     # Act
     result = exporter._generate_issue_summary_table(sample_issues_without_project_states.issues["org/repo/1"])
@@ -21,7 +29,7 @@ def test_generate_issue_summary_table_not_linked_to_project(sample_issues_withou
 
 def test_generate_issue_summary_table_linked_to_project(sample_issues_with_project_states):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
     exporter.project_statuses_included = True
     sample_issues_with_project_states.get_issue("org/repo/2").linked_to_project = False
 
@@ -45,11 +53,10 @@ def test_generate_issue_summary_table_linked_to_project(sample_issues_with_proje
 ])
 def test_generate_index_directory_path(mocker, structured, repo_id, expected_path):
     # Arrange
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=structured)
     mocker.patch("living_doc_generator.mdoc_exporter.make_absolute_path", return_value="abs_out")
-    mocker.patch("os.makedirs")  # Prevent actual directory creation
 
-    exporter = MdocExporter("output")
+    exporter = MdocExporter("output", ActionConfiguration(structured_output_enabled=structured))
+    mock_ensure = mocker.patch.object(exporter._directory_planner, "ensure")  # Prevent actual directory creation
     group_name = "group"
 
     # Act
@@ -57,6 +64,7 @@ def test_generate_index_directory_path(mocker, structured, repo_id, expected_pat
 
     # Assert
     assert result == expected_path
+    mock_ensure.assert_called_once_with(expected_path)
 
 
 # _load_all_templates
@@ -64,26 +72,26 @@ def test_generate_index_directory_path(mocker, structured, repo_id, expected_pat
 
 def test_load_all_templates_success(mocker):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
     mocker.patch("living_doc_generator.mdoc_exporter.load_template", return_value="template_content")
     # Act
     result = exporter._load_all_templates()
     # Assert
     assert result is True
-    assert exporter._us_issue_page_detail_template == "template_content"
-    assert exporter._feat_issue_page_detail_template == "template_content"
-    assert exporter._func_issue_page_detail_template == "template_content"
-    assert exporter._us_index_no_struct_template_file == "template_content"
-    assert exporter._feat_index_no_struct_template_file == "template_content"
+    assert exporter._us_issue_page_detail_template.source == "template_content"
+    assert exporter._feat_issue_page_detail_template.source == "template_content"
+    assert exporter._func_issue_page_detail_template.source == "template_content"
+    assert exporter._us_index_no_struct_template_file.source == "template_content"
+    assert exporter._feat_index_no_struct_template_file.source == "template_content"
     assert exporter._us_index_root_level_template_page == "template_content"
     assert exporter._feat_index_root_level_template_page == "template_content"
-    assert exporter._index_org_level_template == "template_content"
-    assert exporter._report_page_template == "template_content"
+    assert exporter._index_org_level_template.source == "template_content"
+    assert exporter._report_page_template.source == "template_content"
 
 
 def test_load_all_templates_failure(mocker):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
     # First template returns None, simulating a load failure
     mocker.patch("living_doc_generator.mdoc_exporter.load_template", side_effect=[None] + ["template"]*8)
     mock_logger_error = mocker.patch("living_doc_generator.mdoc_exporter.logger.error")
@@ -94,13 +102,45 @@ def test_load_all_templates_failure(mocker):
     mock_logger_error.assert_called_once_with("MDoc page generation - failed to load all templates.")
 
 
+def test_load_all_templates_unknown_placeholder(mocker):
+    # Arrange
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
+    mocker.patch("living_doc_generator.mdoc_exporter.load_template", side_effect=["{title} {author}"] + ["template"] * 8)
+    mock_logger_error = mocker.patch("living_doc_generator.mdoc_exporter.logger.error")
+
+    # Act
+    result = exporter._load_all_templates()
+
+    # Assert
+    assert result is False
+    assert "is not valid" in mock_logger_error.call_args_list[0][0][0]
+    assert "{author}" in mock_logger_error.call_args_list[0][0][2]
+    mock_logger_error.assert_called_with("MDoc page generation - failed to load all templates.")
+
+
+@pytest.mark.parametrize("structured_output_enabled", [False, True], ids=["flat", "structured"])
+def test_load_all_templates_data_level_name_only_structured(mocker, structured_output_enabled):
+    # Arrange
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=structured_output_enabled))
+    templates = ["template"] * 9
+    templates[3] = "{data_level_name} {issue_overview_table}"
+    templates[5] = "Root level page {with braces}"
+    mocker.patch("living_doc_generator.mdoc_exporter.load_template", side_effect=templates)
+    mocker.patch("living_doc_generator.mdoc_exporter.logger.error")
+
+    # Act
+    result = exporter._load_all_templates()
+
+    # Assert - the root-level page is written as it is, so it is not checked
+    assert result is structured_output_enabled
+
+
 # _update_error_page
 
 
 def test_update_error_page_adds_errors(mocker):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_report_page_generation_enabled", return_value=True)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(report_page_enabled=True))
     issue = mocker.Mock()
     issue.errors = {"TypeError": "Something went wrong."}
     issue.repository_id = "org/repo"
@@ -112,8 +152,22 @@ def test_update_error_page_adds_errors(mocker):
     exporter._update_error_page(issue, group)
 
     # Assert
-    assert group in exporter._report_page_content
-    assert "| TypeError | [org/repo#42](https://github.com/org/repo/issues/42) | Something went wrong. |" in exporter._report_page_content[group]
+    assert exporter._report_rows[group] == [
+        ReportRow("TypeError", "org/repo", 42, "https://github.com/org/repo/issues/42", "Something went wrong.")
+    ]
+
+
+def test_update_error_page_disabled(mocker):
+    # Arrange
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
+    issue = mocker.Mock()
+    issue.errors = {"TypeError": "Something went wrong."}
+
+    # Act
+    exporter._update_error_page(issue, "user_stories")
+
+    # Assert
+    assert exporter._report_rows == {}
 
 
 # _generate_directory_path_us
@@ -121,8 +175,7 @@ def test_update_error_page_adds_errors(mocker):
 
 def test_generate_directory_path_us_structured(mocker):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=True)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=True))
 
     group_name = "user_stories"
     repo_id = "org/repo"
@@ -137,7 +190,7 @@ def test_generate_directory_path_us_structured(mocker):
 
 def test_generate_directory_path_us_not_structured(mocker):
     # Arrange
-    exporter = MdocExporter("/mocked/output/path")
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration())
 
     group_name = "user_stories"
     repo_id = "org/repo"
@@ -154,8 +207,7 @@ def test_generate_directory_path_us_not_structured(mocker):
 
 
 def test_generate_directory_path_feat_structured(mocker):
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=True)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=True))
 
     parent_path = "features"
     repo_id = "org/repo"
@@ -168,8 +220,7 @@ def test_generate_directory_path_feat_structured(mocker):
 
 
 def test_generate_directory_path_feat_not_structured(mocker):
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=False)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=False))
 
     parent_path = "features"
     repo_id = "org/repo"
@@ -185,8 +236,7 @@ def test_generate_directory_path_feat_not_structured(mocker):
 
 
 def test_generate_directory_path_func_structured(mocker):
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=True)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=True))
 
     parent_path = "functionalities"
     repo_id = "org/repo"
@@ -199,8 +249,7 @@ def test_generate_directory_path_func_structured(mocker):
 
 
 def test_generate_directory_path_func_not_structured(mocker):
-    exporter = MdocExporter("/mocked/output/path")
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_structured_output_enabled", return_value=False)
+    exporter = MdocExporter("/mocked/output/path", ActionConfiguration(structured_output_enabled=False))
 
     parent_path = "functionalities"
     repo_id = "org/repo"
@@ -212,43 +261,13 @@ def test_generate_directory_path_func_not_structured(mocker):
     assert result == expected_path
 
 
-# _generate_mdoc_line
-
-
-def test_generate_mdoc_line_linked_and_not_linked(mdoc_exporter, sample_issues_without_project_states):
-    mdoc_exporter.project_statuses_included = True
-
-    # Linked to project
-    issue = sample_issues_without_project_states.issues["org/repo/1"]
-    issue.linked_to_project = True
-    result_linked = mdoc_exporter._generate_mdoc_line(issue)
-    assert "| org | repo | [#1 - Sample User Story 1]" in result_linked
-    assert "🟢" in result_linked
-
-    # Not linked to project
-    issue.linked_to_project = False
-    result_not_linked = mdoc_exporter._generate_mdoc_line(issue)
-    assert "| org | repo | [#1 - Sample User Story 1]" in result_not_linked
-    assert "🔴" in result_not_linked
-
-
-def test_generate_mdoc_line_no_project_data(mdoc_exporter, sample_issues_without_project_states):
-    # Linked to project
-    issue = sample_issues_without_project_states.issues["org/repo/1"]
-    issue.linked_to_project = False
-    result_not_linked = mdoc_exporter._generate_mdoc_line(issue)
-    assert "| org | repo | [#1 - Sample User Story 1]" in result_not_linked
-    assert "🟢" not in result_not_linked
-    assert "🔴" not in result_not_linked
-
-
 # _generate_sub_level_index_page
 
 
 def test_generate_sub_level_index_page(tmp_path, mdoc_exporter, sample_issues_without_project_states):
     # Arrange
-    mock_template = "title: Sub Level Index\n{{organization_name}}"
-    repository_id = "org/repo"
+    mock_template = CompiledTemplate("title: Sub Level Index\n{{organization_name}}")
+    organization_name = "org"
     group_name = "user_stories"
     output_dir = os.path.join(tmp_path, "user_stories", "org")
     os.makedirs(output_dir)
@@ -257,7 +276,7 @@ def test_generate_sub_level_index_page(tmp_path, mdoc_exporter, sample_issues_wi
 
     # Act
     mdoc_exporter._generate_sub_level_index_page(
-        mock_template, repository_id, group_name
+        mock_template, organization_name, group_name
     )
 
     # Assert
@@ -273,11 +292,11 @@ def test_generate_sub_level_index_page(tmp_path, mdoc_exporter, sample_issues_wi
 
 def test_generate_index_page_creates_file(tmp_path, mdoc_exporter, sample_issues_without_project_states):
     # Arrange
-    mock_template = "title: User Stories\n{issue_overview_table}"
+    mock_template = CompiledTemplate("title: User Stories\n{issue_overview_table}")
     group_name = "user_stories"
     issues = [
-        sample_issues_without_project_states.issues["org/repo/1"],
-        sample_issues_without_project_states.issues["org/repo/2"],
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/1"]),
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/2"]),
     ]
     mdoc_exporter._output_path = str(tmp_path)
     output_file = os.path.join(tmp_path, group_name, "_index.md")
@@ -296,12 +315,12 @@ def test_generate_index_page_creates_file(tmp_path, mdoc_exporter, sample_issues
 
 def test_generate_index_page_creates_file_structured(tmp_path, mdoc_exporter, sample_issues_without_project_states, mocker):
     # Arrange
-    mocker.patch("action_inputs.ActionInputs.is_structured_output_enabled", return_value=True)
-    mock_template = "title: User Stories\n{issue_overview_table}"
+    mdoc_exporter._configuration = ActionConfiguration(structured_output_enabled=True)
+    mock_template = CompiledTemplate("title: User Stories\n{issue_overview_table}")
     group_name = "user_stories"
     issues = [
-        sample_issues_without_project_states.issues["org/repo/1"],
-        sample_issues_without_project_states.issues["org/repo/2"],
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/1"]),
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/2"]),
     ]
     mdoc_exporter._output_path = str(tmp_path)
     output_file = os.path.join(tmp_path, group_name, "org", "repo", "_index.md")
@@ -321,7 +340,7 @@ def test_generate_index_page_creates_file_structured(tmp_path, mdoc_exporter, sa
 def test_generate_index_page_creates_file_no_issues(tmp_path, mdoc_exporter, mocker):
     # Arrange
     mock_logger_info = mocker.patch("living_doc_generator.mdoc_exporter.logger.info")
-    mock_template = "title: User Stories\n{issue_overview_table}"
+    mock_template = CompiledTemplate("title: User Stories\n{issue_overview_table}")
     group_name = "user_stories"
     issues = []
     mdoc_exporter._output_path = str(tmp_path)
@@ -340,29 +359,82 @@ def test_generate_index_page_creates_file_no_issues(tmp_path, mdoc_exporter, moc
     )
 
 
+def test_generate_index_page_paginated(tmp_path, mdoc_exporter, sample_issues_without_project_states):
+    # Arrange
+    mdoc_exporter._configuration = ActionConfiguration(index_sort_columns=("number",), index_page_size=1)
+    mock_template = CompiledTemplate(
+        "title: User Stories{index_page_title_suffix}\n{issue_overview_table}{index_page_navigation}"
+    )
+    group_name = "user_stories"
+    issues = [
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/2"]),
+        IssueRecord.from_issue(sample_issues_without_project_states.issues["org/repo/1"]),
+    ]
+    mdoc_exporter._output_path = str(tmp_path)
+
+    # Act
+    mdoc_exporter._generate_index_page(mock_template, group_name, issues)
+
+    # Assert
+    with open(os.path.join(tmp_path, group_name, "_index.md"), "r", encoding="utf-8") as f:
+        first_page = f.read()
+    with open(os.path.join(tmp_path, group_name, "_index_2.md"), "r", encoding="utf-8") as f:
+        second_page = f.read()
+    assert "[#1 - Sample User Story 1]" in first_page and "[#2 - " not in first_page
+    assert "[#2 - Sample User Story 2]" in second_page and "[#1 - " not in second_page
+    assert first_page.startswith("title: User Stories (1/2)\n")
+    assert "Pages: **1** | [2](./_index_2/) | [Next »](./_index_2/)" in first_page
+    assert second_page.startswith("title: User Stories (2/2)\n")
+    assert "Pages: [« Previous](../) | [1](../) | **2**" in second_page
+
+
 # _generate_structured_index_pages
 
 
 def test_generate_structured_index_pages_creates_files(tmp_path, mdoc_exporter, sample_issues_without_project_states, mocker):
     # Arrange
-    mocker.patch("action_inputs.ActionInputs.is_structured_output_enabled", return_value=True)
+    mdoc_exporter._configuration = ActionConfiguration(structured_output_enabled=True)
     group_name = "user_stories"
     mdoc_exporter._output_path = str(tmp_path)
     mocker.patch.object(mdoc_exporter, "_generate_sub_level_index_page")
+    sample_issues_without_project_states.issues["org/repo/2"].repository_id = "org/other-repo"
+    sample_issues_without_project_states.issues["org/repo/3"].repository_id = "other-org/repo"
 
     # Act
-    mdoc_exporter._generate_structured_index_pages(sample_issues_without_project_states, group_name)
+    mdoc_exporter._generate_structured_index_pages(
+        IssuePartition.from_issues(sample_issues_without_project_states), group_name
+    )
 
     # Assert
-    # Check that sub-level index pages are generated for each unique repository
+    # Check that sub-level index pages are generated once for each unique organization
     calls = mdoc_exporter._generate_sub_level_index_page.call_args_list
-    repo_ids = set(issue.repository_id for issue in sample_issues_without_project_states.issues.values())
-    assert len(calls) == len(repo_ids)
-    for call in calls:
-        args, kwargs = call
-        # args: (index_template, repository_id, group_name)
-        assert args[1] in repo_ids
-        assert args[2] == group_name
+    # args: (index_template, organization_name, group_name)
+    assert [call.args[1:] for call in calls] == [("org", group_name), ("other-org", group_name)]
+
+
+def test_generate_index_page_structured_per_repository(tmp_path, mdoc_exporter, sample_issues_without_project_states):
+    # Arrange
+    mdoc_exporter._configuration = ActionConfiguration(structured_output_enabled=True)
+    mdoc_exporter._output_path = str(tmp_path)
+    mock_template = CompiledTemplate("{data_level_name}\n{issue_overview_table}")
+    issues = sample_issues_without_project_states.issues
+    issues["org/repo/2"].repository_id = "other-org/other-repo"
+    group_issues = [IssueRecord.from_issue(issues["org/repo/1"]), IssueRecord.from_issue(issues["org/repo/2"])]
+
+    # Act
+    mdoc_exporter._generate_index_page(mock_template, "user_stories", group_issues)
+
+    # Assert
+    with open(os.path.join(tmp_path, "user_stories", "org", "repo", "_index.md"), "r", encoding="utf-8") as f:
+        repo_page = f.read()
+    with open(
+        os.path.join(tmp_path, "user_stories", "other-org", "other-repo", "_index.md"), "r", encoding="utf-8"
+    ) as f:
+        other_repo_page = f.read()
+    assert repo_page.startswith("repo\n")
+    assert "[#1 - " in repo_page and "[#2 - " not in repo_page
+    assert other_repo_page.startswith("other-repo\n")
+    assert "[#2 - " in other_repo_page and "[#1 - " not in other_repo_page
 
 
 # generate_page_filename
@@ -407,10 +479,10 @@ def test_generate_page_filename_with_real_feature_issue(mdoc_exporter):
     assert filename == "_index.md"
 
 
-# _generate_md_issue_page_for_func
+# _prepare_md_issue_page_for_func
 
 
-def test_generate_md_issue_page_for_func(mdoc_exporter, tmp_path, mocker):
+def test_prepare_md_issue_page_for_func(mdoc_exporter, tmp_path, mocker):
     # Arrange
     issue = FunctionalityIssue()
     issue.issue_number = 7
@@ -421,7 +493,7 @@ def test_generate_md_issue_page_for_func(mdoc_exporter, tmp_path, mocker):
     issue.html_url = "https://github.com/org/repo/issues/7"
 
     # Mock the template to include all replacements
-    mock_template = "{title}\n{date}\n{issue_content}"
+    mock_template = CompiledTemplate("{title}\n{date}\n{issue_content}")
     mocker.patch.object(mdoc_exporter, "_func_issue_page_detail_template", mock_template)
 
     mdoc_exporter._output_path = str(tmp_path)
@@ -429,7 +501,7 @@ def test_generate_md_issue_page_for_func(mdoc_exporter, tmp_path, mocker):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
     # Act
-    mdoc_exporter._generate_md_issue_page_for_func(issue)
+    mdoc_exporter._generate_pages([mdoc_exporter._prepare_page_job(issue, FeatureIndex())])
 
     # Assert
     md_file_path = os.path.join(mdoc_exporter._output_path, "features", "no_feature", "7_sample_functionality.md")
@@ -440,10 +512,25 @@ def test_generate_md_issue_page_for_func(mdoc_exporter, tmp_path, mocker):
     assert "This is a sample functionality issue body." in content
 
 
-# _generate_md_issue_page_for_feat
+def test_prepare_md_issue_page_for_func_in_feature_directory(mdoc_exporter, tmp_path, sample_issues_without_project_states):
+    # Arrange
+    mdoc_exporter._output_path = str(tmp_path)
+    assert mdoc_exporter._load_all_templates()
+    for key in ("org/repo/1", "org/repo/2", "org/repo/4", "org/repo/6"):
+        sample_issues_without_project_states.issues.pop(key)
 
+    # Act
+    mdoc_exporter._generate_page_per_issue(IssuePartition.from_issues(sample_issues_without_project_states))
 
-def test_generate_md_issue_page_for_feat(mdoc_exporter, tmp_path, mocker):
+    # Assert
+    feature_directory = os.path.join(tmp_path, "features", "Sample_Feature_1")
+    assert sorted(os.listdir(feature_directory)) == ["5_sample_functionality_1.md", "_index.md"]
+
+
+# _prepare_md_issue_page_for_feat
+
+
+def test_prepare_md_issue_page_for_feat(mdoc_exporter, tmp_path, mocker):
     # Arrange
     issue = FeatureIssue()
     issue.issue_number = 10
@@ -454,7 +541,7 @@ def test_generate_md_issue_page_for_feat(mdoc_exporter, tmp_path, mocker):
     issue.html_url = "https://github.com/org/repo/issues/10"
 
     # Mock the template to include all replacements
-    mock_template = "{title}\n{date}\n{issue_content}"
+    mock_template = CompiledTemplate("{title}\n{date}\n{issue_content}")
     mocker.patch.object(mdoc_exporter, "_feat_issue_page_detail_template", mock_template)
 
     mdoc_exporter._output_path = str(tmp_path)
@@ -462,7 +549,9 @@ def test_generate_md_issue_page_for_feat(mdoc_exporter, tmp_path, mocker):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
     # Act
-    mdoc_exporter._generate_md_issue_page_for_feat(issue)
+    feature_index = FeatureIndex()
+    feature_index.add_feature(issue)
+    mdoc_exporter._generate_pages([mdoc_exporter._prepare_page_job(issue, feature_index)])
 
     # Assert
     assert os.path.exists(output_file)
@@ -472,10 +561,10 @@ def test_generate_md_issue_page_for_feat(mdoc_exporter, tmp_path, mocker):
     assert "This is a sample feature issue body." in content
 
 
-# _generate_md_issue_page_for_us
+# _prepare_md_issue_page_for_us
 
 
-def test_generate_md_issue_page_for_us(mdoc_exporter, tmp_path, mocker):
+def test_prepare_md_issue_page_for_us(mdoc_exporter, tmp_path, mocker):
     # Arrange
     issue = UserStoryIssue()
     issue.issue_number = 15
@@ -486,7 +575,7 @@ def test_generate_md_issue_page_for_us(mdoc_exporter, tmp_path, mocker):
     issue.html_url = "https://github.com/org/repo/issues/15"
 
     # Mock the template to include all replacements
-    mock_template = "{title}\n{date}\n{issue_content}"
+    mock_template = CompiledTemplate("{title}\n{date}\n{issue_content}")
     mocker.patch.object(mdoc_exporter, "_us_issue_page_detail_template", mock_template)
 
     mdoc_exporter._output_path = str(tmp_path)
@@ -494,7 +583,7 @@ def test_generate_md_issue_page_for_us(mdoc_exporter, tmp_path, mocker):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
     # Act
-    mdoc_exporter._generate_md_issue_page_for_us(issue)
+    mdoc_exporter._generate_pages([mdoc_exporter._prepare_page_job(issue, FeatureIndex())])
 
     # Assert
     assert os.path.exists(output_file)
@@ -509,11 +598,11 @@ def test_generate_md_issue_page_for_us(mdoc_exporter, tmp_path, mocker):
 
 def test_generate_output_structure_with_prepared_issues_not_structured(mdoc_exporter, tmp_path, sample_issues_without_project_states, mocker):
     # Arrange
-    mocker.patch("action_inputs.ActionInputs.is_structured_output_enabled", return_value=False)
+    mdoc_exporter._configuration = ActionConfiguration(structured_output_enabled=False)
     mdoc_exporter._output_path = str(tmp_path)
 
     # Act
-    mdoc_exporter._generate_output_structure(sample_issues_without_project_states)
+    mdoc_exporter._generate_output_structure(IssuePartition.from_issues(sample_issues_without_project_states))
 
     # Assert
     expected_us_path = os.path.join(tmp_path, "user_stories")
@@ -523,11 +612,11 @@ def test_generate_output_structure_with_prepared_issues_not_structured(mdoc_expo
 
 def test_generate_output_structure_with_prepared_issues_structured(mdoc_exporter, tmp_path, sample_issues_without_project_states, mocker):
     # Arrange
-    mocker.patch("action_inputs.ActionInputs.is_structured_output_enabled", return_value=True)
+    mdoc_exporter._configuration = ActionConfiguration(structured_output_enabled=True)
     mdoc_exporter._output_path = str(tmp_path)
 
     # Act
-    mdoc_exporter._generate_output_structure(sample_issues_without_project_states)
+    mdoc_exporter._generate_output_structure(IssuePartition.from_issues(sample_issues_without_project_states))
 
     # Assert
     assert os.path.exists(os.path.join(tmp_path, "user_stories", "_index.md"))
@@ -544,27 +633,118 @@ def test_generate_output_structure_with_prepared_issues_structured(mdoc_exporter
 def test_generate_page_per_issue(mdoc_exporter, tmp_path, sample_issues_without_project_states, mocker):
     # Arrange
     mdoc_exporter._output_path = str(tmp_path)
-    mocker.patch.object(mdoc_exporter, "_generate_md_issue_page_for_us")
+    mocker.patch.object(mdoc_exporter, "_prepare_md_issue_page_for_us", return_value="us_job")
     mocker.patch.object(mdoc_exporter, "_update_error_page")
-    mocker.patch.object(mdoc_exporter, "_generate_md_issue_page_for_feat")
-    mocker.patch.object(mdoc_exporter, "_generate_md_issue_page_for_func")
+    mocker.patch.object(mdoc_exporter, "_prepare_md_issue_page_for_feat", return_value="feat_job")
+    mocker.patch.object(mdoc_exporter, "_prepare_md_issue_page_for_func", return_value="func_job")
+    mock_generate_pages = mocker.patch("living_doc_generator.mdoc_exporter.generate_pages")
 
     sample_issues_without_project_states.issues.pop("org/repo/2")
     sample_issues_without_project_states.issues.pop("org/repo/4")
     sample_issues_without_project_states.issues.pop("org/repo/6")
 
     # Act
-    mdoc_exporter._generate_page_per_issue(sample_issues_without_project_states)
+    mdoc_exporter._generate_page_per_issue(IssuePartition.from_issues(sample_issues_without_project_states))
 
     # Assert
-    assert mdoc_exporter._generate_md_issue_page_for_us.call_count == 1
-    assert mdoc_exporter._generate_md_issue_page_for_feat.call_count == 1
-    assert mdoc_exporter._generate_md_issue_page_for_func.call_count == 1
+    assert mdoc_exporter._prepare_md_issue_page_for_us.call_count == 1
+    assert mdoc_exporter._prepare_md_issue_page_for_feat.call_count == 1
+    assert mdoc_exporter._prepare_md_issue_page_for_func.call_count == 1
     assert mdoc_exporter._update_error_page.call_count == 3
 
-    assert mdoc_exporter._generate_md_issue_page_for_us.call_args[0][0].issue_number == 1
-    assert mdoc_exporter._generate_md_issue_page_for_feat.call_args[0][0].issue_number == 3
-    assert mdoc_exporter._generate_md_issue_page_for_func.call_args[0][0].issue_number == 5
+    assert mdoc_exporter._prepare_md_issue_page_for_us.call_args[0][0].issue_number == 1
+    assert mdoc_exporter._prepare_md_issue_page_for_feat.call_args[0][0].issue_number == 3
+    assert mdoc_exporter._prepare_md_issue_page_for_func.call_args[0][0].issue_number == 5
+    mock_generate_pages.assert_called_once_with(
+        ["us_job", "feat_job", "func_job"],
+        "off",
+        None,
+        mdoc_exporter._directory_planner,
+        mdoc_exporter._instrumentation,
+        mdoc_exporter._page_writer,
+    )
+
+
+def test_generate_page_per_issue_parallel_matches_serial(tmp_path, sample_issues_with_errors_without_project_states, mocker):
+    # Arrange
+    serial_exporter = MdocExporter(
+        os.path.join(tmp_path, "serial"), ActionConfiguration(report_page_enabled=True, parallel_mode="off")
+    )
+    parallel_exporter = MdocExporter(
+        os.path.join(tmp_path, "parallel"), ActionConfiguration(report_page_enabled=True, parallel_mode="threads")
+    )
+    for exporter in (serial_exporter, parallel_exporter):
+        assert exporter._load_all_templates()
+
+    # Act
+    serial_exporter._generate_page_per_issue(IssuePartition.from_issues(sample_issues_with_errors_without_project_states))
+    parallel_exporter._generate_page_per_issue(
+        IssuePartition.from_issues(sample_issues_with_errors_without_project_states)
+    )
+
+    # Assert
+    def read_tree(root):
+        tree = {}
+        for dir_path, _, file_names in os.walk(root):
+            for file_name in file_names:
+                with open(os.path.join(dir_path, file_name), "rb") as f:
+                    tree[os.path.relpath(os.path.join(dir_path, file_name), root)] = f.read()
+        return tree
+
+    serial_tree = read_tree(os.path.join(tmp_path, "serial"))
+    assert len(serial_tree) == 6
+    assert serial_tree == read_tree(os.path.join(tmp_path, "parallel"))
+    assert serial_exporter._report_rows == parallel_exporter._report_rows
+
+
+def test_export_streamed_issues_matches_loaded_issues(tmp_path, sample_issues_with_errors_without_project_states, mocker):
+    # Arrange
+    mocker.patch("living_doc_generator.mdoc_exporter.STREAM_BATCH_SIZE", 2)
+    configuration = ActionConfiguration(report_page_enabled=True)
+    issues = sample_issues_with_errors_without_project_states
+    loaded_root = os.path.join(tmp_path, "loaded")
+    streamed_root = os.path.join(tmp_path, "streamed")
+    feature_index = FeatureIndex()
+    for issue in issues.issues.values():
+        if isinstance(issue, FeatureIssue):
+            feature_index.add_feature(issue)
+    # The loaded export releases the issues after their pages are generated
+    issue_items = list(issues.issues.items())
+
+    # Act
+    assert MdocExporter(loaded_root, configuration).export(issues=issues)
+    assert MdocExporter(streamed_root, configuration).export(
+        issue_stream=iter(issue_items), feature_index=feature_index
+    )
+
+    # Assert
+    def read_tree(root):
+        tree = {}
+        for dir_path, _, file_names in os.walk(root):
+            for file_name in file_names:
+                with open(os.path.join(dir_path, file_name), "rb") as f:
+                    tree[os.path.relpath(os.path.join(dir_path, file_name), root)] = f.read()
+        return tree
+
+    loaded_tree = read_tree(loaded_root)
+    assert "user_stories/report_page.md" in loaded_tree
+    assert loaded_tree == read_tree(streamed_root)
+
+
+def test_export_streamed_issues_shares_page_pool_across_batches(tmp_path, sample_issues_without_project_states, mocker):
+    # Arrange
+    mocker.patch("living_doc_generator.mdoc_exporter.STREAM_BATCH_SIZE", 2)
+    mock_page_pool = mocker.patch("living_doc_generator.mdoc_exporter.PagePool")
+    configuration = ActionConfiguration(parallel_mode="threads", parallel_workers=2)
+
+    # Act
+    assert MdocExporter(str(tmp_path), configuration).export(
+        issue_stream=iter(sample_issues_without_project_states.issues.items()), feature_index=FeatureIndex()
+    )
+
+    # Assert
+    mock_page_pool.assert_called_once_with("threads", 2)
+    assert mock_page_pool.return_value.generate.call_count == 4
 
 
 # _generate_report_page
@@ -573,14 +753,12 @@ def test_generate_page_per_issue(mdoc_exporter, tmp_path, sample_issues_without_
 def test_generate_report_page(mdoc_exporter, tmp_path, mocker):
     # Arrange
     mdoc_exporter._output_path = str(tmp_path)
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_report_page_generation_enabled", return_value=True)
-    mocker.patch.object(mdoc_exporter, "_report_page_template", "{date}\n{livdoc_report_page_content}\n{group}")
-    mdoc_exporter._report_page_content = {
-        "User Story": (
-            "| Error Type | Issue | Description |\n"
-            "|------------|-------|-------------|\n"
-            "| SomeError  | [org/repo#1](https://github.com/org/repo/issues/1) | Fake some error. |\n"
-        )
+    mdoc_exporter._configuration = ActionConfiguration(report_page_enabled=True)
+    mocker.patch.object(
+        mdoc_exporter, "_report_page_template", CompiledTemplate("{date}\n{livdoc_report_page_content}\n{group}")
+    )
+    mdoc_exporter._report_rows = {
+        "User Story": [ReportRow("SomeError", "org/repo", 1, "https://github.com/org/repo/issues/1", "Fake some error.")]
     }
     report_file_path = os.path.join(tmp_path, "user_stories", "report_page.md")
     os.makedirs(os.path.dirname(report_file_path), exist_ok=True)
@@ -593,8 +771,138 @@ def test_generate_report_page(mdoc_exporter, tmp_path, mocker):
     with open(report_file_path, "r", encoding="utf-8") as f:
         content = f.read()
     assert "User Story" in content
-    assert "| SomeError  | [org/repo#1](https://github.com/org/repo/issues/1) | Fake some error. |" in content
+    assert "| SomeError | [org/repo#1](https://github.com/org/repo/issues/1) | Fake some error. |" in content
+
+
+# _generate_report_json
+
+
+def test_generate_report_json(mdoc_exporter, tmp_path):
+    # Arrange
+    mdoc_exporter._output_path = str(tmp_path)
+    mdoc_exporter._report_rows = {
+        "User Story": [
+            ReportRow("SomeError", "org/repo", 1, "https://github.com/org/repo/issues/1", "Fake some error."),
+            ReportRow("SomeError", "org/repo", 2, "https://github.com/org/repo/issues/2", "Fake some error."),
+        ],
+        "Feature": [ReportRow("LabelError", "org/repo", 3, "https://github.com/org/repo/issues/3", "Two labels.")],
+    }
+
+    # Act
+    mdoc_exporter._generate_report_json()
+
+    # Assert
+    with open(os.path.join(tmp_path, "report.json"), "r", encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["error_count"] == 3
+    assert report["groups"]["User Story"]["error_types"] == {"SomeError": 2}
+    assert report["groups"]["Feature"]["errors"][0] == {
+        "error_type": "LabelError",
+        "repository_id": "org/repo",
+        "issue_number": 3,
+        "html_url": "https://github.com/org/repo/issues/3",
+        "message": "Two labels.",
+    }
+
+
+# _generate_search_index
+
+
+def test_export_search_index(tmp_path, sample_issues_with_errors_without_project_states):
+    # Arrange
+    configuration = ActionConfiguration(search_index_enabled=True)
+    issues = sample_issues_with_errors_without_project_states
+    issues.issues["org/repo/1"].labels = ["Payments"]
+    feature_index = FeatureIndex()
+    for issue in issues.issues.values():
+        if isinstance(issue, FeatureIssue):
+            feature_index.add_feature(issue)
+    # The loaded export releases the issues after their pages are generated
+    issue_items = list(issues.issues.items())
+
+    # Act
+    assert MdocExporter(os.path.join(tmp_path, "loaded"), configuration).export(issues=issues)
+    assert MdocExporter(os.path.join(tmp_path, "streamed"), configuration).export(
+        issue_stream=iter(issue_items), feature_index=feature_index
+    )
+
+    # Assert
+    with open(os.path.join(tmp_path, "loaded", "search_index.json"), "r", encoding="utf-8") as f:
+        loaded_content = f.read()
+    with open(os.path.join(tmp_path, "streamed", "search_index.json"), "r", encoding="utf-8") as f:
+        assert f.read() == loaded_content
 
+    search_index = json.loads(loaded_content)
+    assert len(search_index["documents"]) == 6
+    for document in search_index["documents"]:
+        assert os.path.isfile(os.path.join(tmp_path, "loaded", document["path"]))
+    payments_documents = [search_index["documents"][i]["title"] for i in search_index["index"]["payments"]]
+    assert payments_documents == ["Sample User Story 1"]
+
+
+def test_export_path_collisions(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    configuration = ActionConfiguration(report_page_enabled=True)
+    issues = sample_issues_without_project_states
+    user_story = issues.issues.pop("org/repo/2")
+    user_story.repository_id, user_story.issue_number, user_story.title = "org/other", 1, "Sample User Story 1"
+    issues.issues["org/other/1"] = user_story
+    issues.issues["org/repo/4"].title = "Sample Feature: 1"
+    feature_index = FeatureIndex()
+    for issue in issues.issues.values():
+        if isinstance(issue, FeatureIssue):
+            feature_index.add_feature(issue)
+    # The loaded export releases the issues after their pages are generated
+    issue_items = list(issues.issues.items())
+
+    # Act
+    loaded_exporter = MdocExporter(os.path.join(tmp_path, "loaded"), configuration)
+    assert loaded_exporter.export(issues=issues)
+    assert MdocExporter(os.path.join(tmp_path, "streamed"), configuration).export(
+        issue_stream=iter(issue_items), feature_index=feature_index
+    )
+
+    # Assert
+    for output in ("loaded", "streamed"):
+        output_path = os.path.join(tmp_path, output)
+        assert os.path.isfile(os.path.join(output_path, "user_stories", "1_sample_user_story_1.md"))
+        assert os.path.isfile(os.path.join(output_path, "user_stories", "1_sample_user_story_1_2.md"))
+        assert os.path.isfile(os.path.join(output_path, "features", "Sample_Feature_1", "_index.md"))
+        assert os.path.isfile(os.path.join(output_path, "features", "Sample_Feature_1_2", "_index.md"))
+        assert os.path.isfile(
+            os.path.join(output_path, "features", "Sample_Feature_1_2", "6_sample_functionality_2.md")
+        )
+    with open(os.path.join(tmp_path, "loaded", "features", "report_page.md"), "r", encoding="utf-8") as f:
+        feature_report = f.read()
+    assert (
+        "| PathCollisionError | [org/repo#4](https://github.com/org/repo/issues/4) | Path 'features/Sample_Feature_1'"
+        " is already used by issue org/repo/3, the output of this issue is written to 'features/Sample_Feature_1_2'. |"
+    ) in feature_report
+    with open(os.path.join(tmp_path, "loaded", "user_stories", "report_page.md"), "r", encoding="utf-8") as f:
+        assert "[org/other#1](https://github.com/org/other/issues/1)" in f.read()
+    assert loaded_exporter._instrumentation.get_counter("path_collisions") == 2
+
+
+
+def test_export_feature_directory_names(tmp_path, sample_issues_without_project_states):
+    # Arrange
+    issues = sample_issues_without_project_states
+    issues.issues["org/repo/3"].title = "???"
+    issues.issues["org/repo/4"].title = "SAMPLE FEATURE 1"
+    issues.issues["org/repo/7"] = copy.deepcopy(issues.issues["org/repo/4"])
+    issues.issues["org/repo/7"].issue_number, issues.issues["org/repo/7"].title = 7, "Sample Feature 1"
+    output_path = os.path.join(tmp_path, "mdoc")
+
+    # Act
+    assert MdocExporter(output_path, ActionConfiguration()).export(issues=issues)
+
+    # Assert
+    features_path = os.path.join(output_path, "features")
+    assert sorted(os.listdir(features_path)) == ["SAMPLE_FEATURE_1", "Sample_Feature_1_2", "_index.md", "feature_3"]
+    assert os.path.isfile(os.path.join(features_path, "feature_3", "_index.md"))
+    assert os.path.isfile(os.path.join(features_path, "feature_3", "5_sample_functionality_1.md"))
+    with open(os.path.join(features_path, "_index.md"), "r", encoding="utf-8") as f:
+        assert f.read().startswith("---\ntitle: Features\n")
 
 # export
 
@@ -602,11 +910,12 @@ def test_generate_report_page(mdoc_exporter, tmp_path, mocker):
 def test_export(mdoc_exporter, tmp_path, sample_issues_with_errors_without_project_states, mocker):
     # Arrange
     mdoc_exporter._output_path = str(tmp_path)
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_report_page_generation_enabled", return_value=True)
+    mdoc_exporter._configuration = ActionConfiguration(report_page_enabled=True)
     mock_load_all_templates = mocker.patch.object(mdoc_exporter, "_load_all_templates", return_value=True)
     mock_generate_page_per_issue = mocker.patch.object(mdoc_exporter, "_generate_page_per_issue")
     mock_generate_output_structure = mocker.patch.object(mdoc_exporter, "_generate_output_structure")
     mock_generate_report_page = mocker.patch.object(mdoc_exporter, "_generate_report_page")
+    issues_count = sample_issues_with_errors_without_project_states.count()
 
     # Act
     result = mdoc_exporter.export(issues = sample_issues_with_errors_without_project_states)
@@ -614,15 +923,17 @@ def test_export(mdoc_exporter, tmp_path, sample_issues_with_errors_without_proje
     # Assert
     assert result is True
     mock_load_all_templates.assert_called_once()
-    mock_generate_output_structure.assert_called_once_with(sample_issues_with_errors_without_project_states)
-    mock_generate_page_per_issue.assert_called_once_with(sample_issues_with_errors_without_project_states)
+    partition = mock_generate_page_per_issue.call_args[0][0]
+    assert partition.issues_count == issues_count
+    assert sample_issues_with_errors_without_project_states.count() == 0
+    mock_generate_output_structure.assert_called_once_with(partition)
     mock_generate_report_page.assert_called_once()
 
 
 def test_export_load_template_fails(mdoc_exporter, tmp_path, sample_issues_with_errors_without_project_states, mocker):
     # Arrange
     mdoc_exporter._output_path = str(tmp_path)
-    mocker.patch("living_doc_generator.mdoc_exporter.ActionInputs.is_report_page_generation_enabled", return_value=True)
+    mdoc_exporter._configuration = ActionConfiguration(report_page_enabled=True)
     mock_load_all_templates = mocker.patch.object(mdoc_exporter, "_load_all_templates", return_value=False)
     mock_generate_page_per_issue = mocker.patch.object(mdoc_exporter, "_generate_page_per_issue")
     mock_generate_output_structure = mocker.patch.object(mdoc_exporter, "_generate_output_structure")
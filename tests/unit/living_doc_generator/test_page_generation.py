@@ -0,0 +1,118 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.page_generation import PageJob, PagePool, generate_pages, render_page
+
+
+def _read_tree(root):
+    tree = {}
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            with open(file_path, "rb") as f:
+                tree[os.path.relpath(file_path, root)] = f.read()
+    return tree
+
+
+def _make_jobs(root):
+    # Many pages share the same feature directory to exercise concurrent directory creation
+    return [
+        PageJob(
+            os.path.join(root, "features", f"feature_{i % 3}"),
+            f"{i}_page.md",
+            CompiledTemplate("{title}\n{issue_content}"),
+            {"title": f"Title {i}", "issue_content": f"Body {i}"},
+        )
+        for i in range(30)
+    ]
+
+
+# render_page
+
+
+def test_render_page():
+    # Arrange
+    job = PageJob(
+        "dir", "file.md", CompiledTemplate("# {title}\n{issue_content}"), {"title": "T", "issue_content": "Body"}
+    )
+
+    # Act
+    content = render_page(job)
+
+    # Assert
+    assert content == "# T\nBody"
+
+
+# generate_pages
+
+
+@pytest.mark.parametrize("mode", ["threads", "processes"])
+def test_generate_pages_parallel_identical_to_serial(tmp_path, mode):
+    # Arrange
+    serial_root = os.path.join(tmp_path, "serial")
+    parallel_root = os.path.join(tmp_path, "parallel")
+
+    # Act
+    generate_pages(_make_jobs(serial_root), "off")
+    generate_pages(_make_jobs(parallel_root), mode, 4)
+
+    # Assert
+    serial_tree = _read_tree(serial_root)
+    assert len(serial_tree) == 30
+    assert serial_tree == _read_tree(parallel_root)
+
+
+def test_generate_pages_reraises_worker_error(tmp_path):
+    # Arrange
+    jobs = [PageJob(str(tmp_path), "broken.md", CompiledTemplate("{unknown}"), {})]
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        generate_pages(jobs, "threads", 2)
+
+
+def test_generate_pages_unsupported_mode(tmp_path):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unsupported parallel mode"):
+        generate_pages([], "fibers")
+
+
+# PagePool
+
+
+@pytest.mark.parametrize("mode", ["threads", "processes"])
+def test_page_pool_shares_workers_across_batches(tmp_path, mocker, mode):
+    # Arrange
+    serial_root = os.path.join(tmp_path, "serial")
+    pooled_root = os.path.join(tmp_path, "pooled")
+    generate_pages(_make_jobs(serial_root), "off")
+    spy_thread_pool = mocker.spy(ThreadPoolExecutor, "__init__")
+    jobs = _make_jobs(pooled_root)
+
+    # Act
+    with PagePool(mode, 2) as page_pool:
+        for batch_start in range(0, len(jobs), 7):
+            page_pool.generate(jobs[batch_start : batch_start + 7])
+
+    # Assert
+    assert spy_thread_pool.call_count == 1
+    assert _read_tree(pooled_root) == _read_tree(serial_root)
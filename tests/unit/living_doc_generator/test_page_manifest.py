@@ -0,0 +1,127 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+
+from living_doc_generator.compiled_template import CompiledTemplate
+from living_doc_generator.page_generation import PageJob
+from living_doc_generator.page_manifest import PageManifest, compute_page_digest
+
+
+# compute_page_digest
+
+
+def test_compute_page_digest_ignores_date():
+    # Arrange
+    job_1 = PageJob("dir", "page.md", CompiledTemplate("{title} {date}"), {"title": "T", "date": "2025-01-01"})
+    job_2 = PageJob("dir", "page.md", CompiledTemplate("{title} {date}"), {"title": "T", "date": "2025-02-02"})
+
+    # Act & Assert
+    assert compute_page_digest(job_1) == compute_page_digest(job_2)
+
+
+def test_compute_page_digest_includes_template_and_content():
+    # Arrange
+    job = PageJob("dir", "page.md", CompiledTemplate("{title}"), {"title": "T"})
+    job_other_template = PageJob("dir", "page.md", CompiledTemplate("# {title}"), {"title": "T"})
+    job_other_content = PageJob("dir", "page.md", CompiledTemplate("{title}"), {"title": "Other"})
+
+    # Act & Assert
+    assert compute_page_digest(job) != compute_page_digest(job_other_template)
+    assert compute_page_digest(job) != compute_page_digest(job_other_content)
+
+
+# load
+
+
+def test_load_missing_manifest(tmp_path):
+    # Act
+    manifest = PageManifest.load(os.path.join(tmp_path, "missing.json"), str(tmp_path))
+
+    # Assert
+    assert not manifest.has_previous_run
+
+
+def test_load_invalid_manifest(tmp_path, mocker):
+    # Arrange
+    mock_logger_warning = mocker.patch("living_doc_generator.page_manifest.logger.warning")
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    # Act
+    manifest = PageManifest.load(manifest_path, str(tmp_path))
+
+    # Assert
+    assert not manifest.has_previous_run
+    mock_logger_warning.assert_called_once()
+
+
+# register_page
+
+
+def test_register_page_unchanged_and_changed(tmp_path):
+    # Arrange
+    page_path = os.path.join(tmp_path, "user_stories", "1_story.md")
+    os.makedirs(os.path.dirname(page_path))
+    with open(page_path, "w", encoding="utf-8") as f:
+        f.write("content")
+    manifest = PageManifest(str(tmp_path), {"org/repo/1": {"path": "user_stories/1_story.md", "hash": "abc"}})
+
+    # Act & Assert
+    assert not manifest.register_page("org/repo/1", page_path, "abc")
+    assert manifest.register_page("org/repo/1", page_path, "def")
+    assert manifest.register_page("org/repo/2", os.path.join(tmp_path, "user_stories", "2_story.md"), "abc")
+    assert manifest.unchanged_pages_count == 1
+    assert manifest.changed_pages_count == 2
+
+
+def test_register_page_missing_file_is_changed(tmp_path):
+    # Arrange
+    manifest = PageManifest(str(tmp_path), {"org/repo/1": {"path": "user_stories/1_story.md", "hash": "abc"}})
+
+    # Act & Assert
+    assert manifest.register_page("org/repo/1", os.path.join(tmp_path, "user_stories", "1_story.md"), "abc")
+
+
+# remove_orphaned_files & save
+
+
+def test_remove_orphaned_files_and_save(tmp_path):
+    # Arrange
+    kept_path = os.path.join(tmp_path, "features", "kept", "_index.md")
+    orphan_path = os.path.join(tmp_path, "features", "removed", "_index.md")
+    for path in (kept_path, orphan_path):
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("content")
+    manifest = PageManifest(str(tmp_path), previous_files=["features/kept/_index.md", "features/removed/_index.md"])
+    manifest.register_page("org/repo/1", kept_path, "abc")
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+
+    # Act
+    removed_count = manifest.remove_orphaned_files()
+    manifest.save(manifest_path)
+
+    # Assert
+    assert removed_count == 1
+    assert os.path.exists(kept_path)
+    assert not os.path.exists(os.path.dirname(orphan_path))
+    assert os.path.exists(os.path.join(tmp_path, "features"))
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["pages"] == {"org/repo/1": {"path": "features/kept/_index.md", "hash": "abc"}}
+    assert data["files"] == ["features/kept/_index.md"]
@@ -0,0 +1,115 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+from living_doc_generator.path_namer import PathCollision, PathNamer
+
+
+# sanitize
+
+
+def test_sanitize_memoized(mocker):
+    # Arrange
+    path_namer = PathNamer()
+    mock_sanitize = mocker.patch("living_doc_generator.path_namer.sanitize_filename", return_value="Feature_1")
+
+    # Act
+    names = [path_namer.sanitize("Feature: 1") for _ in range(3)]
+
+    # Assert
+    assert names == ["Feature_1"] * 3
+    mock_sanitize.assert_called_once_with("Feature: 1")
+
+
+# claim
+
+
+def test_claim_without_collision():
+    # Arrange
+    path_namer = PathNamer()
+
+    # Act
+    first = path_namer.claim("out", "1_login", ".md", "org/a/1")
+    second = path_namer.claim("out", "2_login", ".md", "org/a/2")
+    other_directory = path_namer.claim("other", "1_login", ".md", "org/b/1")
+
+    # Assert
+    assert (first, second, other_directory) == ("1_login.md", "2_login.md", "1_login.md")
+    assert path_namer.pop_collision("org/b/1") is None
+
+
+def test_claim_collision_resolved_with_number_suffix():
+    # Arrange
+    path_namer = PathNamer()
+    path_namer.claim("out", "Feature", "", "org/a/1")
+
+    # Act
+    second = path_namer.claim("out", "Feature", "", "org/a/2")
+    third = path_namer.claim("out", "Feature", "", "org/a/3")
+    repeated = path_namer.claim("out", "Feature", "", "org/a/2")
+
+    # Assert
+    assert (second, third, repeated) == ("Feature_2", "Feature_3", "Feature_2")
+    collision = path_namer.pop_collision("org/a/2")
+    assert collision == PathCollision(
+        os.path.join("out", "Feature"), os.path.join("out", "Feature_2"), "org/a/2", "org/a/1"
+    )
+    assert path_namer.pop_collision("org/a/2") is None
+
+
+def test_claim_suffix_keeps_extension():
+    # Arrange
+    path_namer = PathNamer()
+    path_namer.claim("out", "1_v1.2", ".md", "org/a/1")
+
+    # Act
+    actual = path_namer.claim("out", "1_v1.2", ".md", "org/b/1")
+
+    # Assert
+    assert actual == "1_v1.2_2.md"
+
+
+def test_claim_collision_ignores_case():
+    # Arrange
+    path_namer = PathNamer()
+    path_namer.claim("out", "Login", "", "org/a/1")
+
+    # Act
+    actual = path_namer.claim("out", "LOGIN", "", "org/a/2")
+
+    # Assert
+    assert actual == "LOGIN_2"
+    assert path_namer.pop_collision("org/a/2") == PathCollision(
+        os.path.join("out", "LOGIN"), os.path.join("out", "LOGIN_2"), "org/a/2", "org/a/1"
+    )
+
+
+# PathCollision.describe
+
+
+def test_path_collision_describe():
+    # Arrange
+    collision = PathCollision(
+        os.path.join("out", "features", "A"), os.path.join("out", "features", "A_2"), "org/a/2", "org/a/1"
+    )
+
+    # Act
+    actual = collision.describe("out")
+
+    # Assert
+    assert actual == (
+        "Path 'features/A' is already used by issue org/a/1, the output of this issue is written to 'features/A_2'."
+    )
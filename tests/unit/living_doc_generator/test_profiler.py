@@ -0,0 +1,88 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import pstats
+import tracemalloc
+
+from living_doc_generator.instrumentation import Instrumentation
+from living_doc_generator.profiler import Profiler
+
+
+def _build_pages(count: int) -> list[str]:
+    return [f"page {index}" * 10 for index in range(count)]
+
+
+# profile
+
+
+def test_profile_cpu_mode_writes_only_stats(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    profiler = Profiler("cpu", output_path)
+
+    # Act
+    with profiler.profile():
+        _build_pages(100)
+
+    # Assert
+    assert profiler.stats_path == f"{output_path}_profile.pstats"
+    assert profiler.memory_profile_path is None
+    stats = pstats.Stats(profiler.stats_path)
+    assert any(function_name == "_build_pages" for _, _, function_name in stats.stats)
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_full_mode_writes_memory_profile_per_stage(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    profiler = Profiler("full", output_path, top_allocations=3)
+    instrumentation = Instrumentation()
+    instrumentation.add_span_listener(profiler.take_snapshot)
+
+    # Act
+    with profiler.profile():
+        with instrumentation.span("load"):
+            pages = _build_pages(1000)
+        with instrumentation.span("index"):
+            pages.extend(_build_pages(10))
+
+    # Assert
+    assert os.path.isfile(profiler.stats_path)
+    with open(profiler.memory_profile_path, "r", encoding="utf-8") as f:
+        memory_profile = f.read()
+    assert [line.split(":")[0] for line in memory_profile.splitlines() if line.startswith("Stage")] == [
+        "Stage 'start'",
+        "Stage 'load'",
+        "Stage 'index'",
+        "Stage 'end'",
+    ]
+    assert "Top 3 allocations added since 'start':" in memory_profile
+    assert "Top 3 allocations at the end of the run:" in memory_profile
+    assert not tracemalloc.is_tracing()
+
+
+# take_snapshot
+
+
+def test_take_snapshot_without_tracing_does_nothing(tmp_path):
+    # Arrange
+    profiler = Profiler("cpu", os.path.join(tmp_path, "mdoc"))
+
+    # Act
+    profiler.take_snapshot("load")
+
+    # Assert
+    assert profiler._stage_snapshots == []
@@ -0,0 +1,75 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_generator.release_filter import ReleaseFilter
+
+
+# is_release_issue
+
+
+@pytest.mark.parametrize("release_labels,state,labels,expected", [
+    ((), "closed", [], True),
+    ((), "CLOSED", None, True),
+    ((), "open", [], False),
+    ((), None, [], False),
+    (("Documented",), "closed", ["bug", "documented"], True),
+    (("Documented",), "closed", ["bug"], False),
+    (("Documented",), "open", ["Documented"], False),
+])
+def test_is_release_issue(release_labels, state, labels, expected):
+    # Arrange
+    release_filter = ReleaseFilter(release_labels)
+
+    # Act
+    actual = release_filter.is_release_issue(state, labels)
+
+    # Assert
+    assert actual == expected
+
+
+# matches / accepts
+
+
+def test_matches_does_not_count_and_accepts_counts():
+    # Arrange
+    release_filter = ReleaseFilter()
+    closed_data = {"type": "UserStoryIssue", "state": "closed"}
+    open_data = {"type": "UserStoryIssue", "state": "open"}
+
+    # Act
+    assert release_filter.matches(closed_data)
+    assert release_filter.accepts(closed_data)
+    assert not release_filter.accepts(open_data)
+
+    # Assert
+    assert (release_filter.kept_count, release_filter.dropped_count) == (1, 1)
+
+
+# select
+
+
+def test_select(sample_issues_without_project_states):
+    # Arrange
+    release_filter = ReleaseFilter()
+    sample_issues_without_project_states.issues["org/repo/2"].state = "closed"
+
+    # Act
+    selected = list(release_filter.select(sample_issues_without_project_states.issues.items()))
+
+    # Assert
+    assert [key for key, _ in selected] == ["org/repo/2"]
+    assert (release_filter.kept_count, release_filter.dropped_count) == (1, 5)
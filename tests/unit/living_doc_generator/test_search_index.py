@@ -0,0 +1,76 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from living_doc_generator.search_index import SearchIndex, tokenize
+
+
+# tokenize
+
+
+def test_tokenize():
+    # Act
+    tokens = tokenize("Login via SSO, a login-page " + "x" * 41)
+
+    # Assert
+    assert tokens == {"login", "via", "sso", "page"}
+
+
+def test_tokenize_empty():
+    # Act & Assert
+    assert tokenize(None) == set()
+    assert tokenize("") == set()
+
+
+# add_document
+
+
+def test_add_document():
+    # Arrange
+    search_index = SearchIndex()
+
+    # Act
+    first_id = search_index.add_document("features/login/_index.md", "Login", ["Security"], "Login via SSO.")
+    second_id = search_index.add_document("user_stories/1_logout.md", "Logout", [], None)
+
+    # Assert
+    assert (first_id, second_id) == (0, 1)
+    assert len(search_index) == 2
+    assert search_index.to_dict() == {
+        "version": 1,
+        "documents": [
+            {"path": "features/login/_index.md", "title": "Login"},
+            {"path": "user_stories/1_logout.md", "title": "Logout"},
+        ],
+        "index": {"login": [0], "logout": [1], "security": [0], "sso": [0], "via": [0]},
+    }
+
+
+# to_json
+
+
+def test_to_json_is_compact():
+    # Arrange
+    search_index = SearchIndex()
+    search_index.add_document("user_stories/1_café.md", "Café", [], None)
+
+    # Act
+    content = search_index.to_json()
+
+    # Assert
+    assert " " not in content
+    assert "Café" in content
+    assert json.loads(content)["index"] == {"café": [0]}
@@ -0,0 +1,176 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import shutil
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.user_story_issue import UserStoryIssue
+
+from living_doc_generator.sharding import (
+    check_shard_manifests,
+    get_shard_index,
+    get_shard_key,
+    remove_shard_manifests,
+    select_shard_issues,
+    write_shard_manifest,
+)
+
+
+def _write_file(file_path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+# get_shard_key
+
+
+def test_get_shard_key_functionality_shares_key_of_feature():
+    # Arrange
+    feature = FeatureIssue()
+    feature.repository_id = "org/repo"
+    feature.issue_number = 3
+    functionality = FunctionalityIssue()
+    functionality.repository_id = "org/repo"
+    functionality.issue_number = 5
+    functionality.body = "Body.\n### Associated Feature\n- #3\n"
+    orphan = FunctionalityIssue()
+    orphan.repository_id = "org/repo"
+    orphan.issue_number = 7
+    orphan.body = "No feature."
+
+    # Act & Assert
+    assert get_shard_key(feature) == "org/repo/3"
+    assert get_shard_key(functionality) == "org/repo/3"
+    assert get_shard_key(orphan) == "org/repo/7"
+
+
+# get_shard_index
+
+
+def test_get_shard_index_is_stable():
+    # Arrange
+    issue = UserStoryIssue()
+    issue.repository_id = "org/repo"
+    issue.issue_number = 1
+
+    # Act
+    actual = [get_shard_index(issue, shard_count) for shard_count in (1, 2, 4, 16)]
+
+    # Assert - the CRC32 of "org/repo/1" is 0x82A67C2E
+    assert actual == [0, 0x82A67C2E % 2, 0x82A67C2E % 4, 0x82A67C2E % 16]
+
+
+# select_shard_issues
+
+
+def test_select_shard_issues_partitions_all_issues(sample_issues_without_project_states):
+    # Arrange
+    issues = list(sample_issues_without_project_states.issues.items())
+
+    # Act
+    shards = [list(select_shard_issues(issues, shard_index, 3)) for shard_index in range(3)]
+
+    # Assert
+    assert sorted(key for shard in shards for key, _ in shard) == sorted(key for key, _ in issues)
+    for shard in shards:
+        shard_keys = [key for key, _ in shard]
+        assert ("org/repo/3" in shard_keys) == ("org/repo/5" in shard_keys)
+        assert ("org/repo/4" in shard_keys) == ("org/repo/6" in shard_keys)
+
+
+# check_shard_manifests
+
+
+def test_check_shard_manifests_complete(tmp_path):
+    # Arrange - the shard outputs are downloaded into the merged output directory
+    merged_path = os.path.join(tmp_path, "merged")
+    for shard_index in range(2):
+        shard_path = os.path.join(tmp_path, f"shard_{shard_index}")
+        _write_file(os.path.join(shard_path, "features", f"{shard_index}.md"), "Page")
+        write_shard_manifest(shard_path, shard_index, 2, "digest")
+        shutil.copytree(shard_path, merged_path, dirs_exist_ok=True)
+
+    # Act
+    actual = check_shard_manifests(merged_path, 2, "digest")
+
+    # Assert
+    assert actual
+    with open(os.path.join(merged_path, "_shard_1_of_2.json"), "r", encoding="utf-8") as f:
+        assert json.load(f)["files"] == ["features/1.md"]
+
+
+def test_check_shard_manifests_incomplete(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("living_doc_generator.sharding.logger.error")
+    _write_file(os.path.join(tmp_path, "features", "0.md"), "Page")
+    write_shard_manifest(str(tmp_path), 0, 3, "digest")
+    _write_file(os.path.join(tmp_path, "features", "1.md"), "Page")
+    write_shard_manifest(str(tmp_path), 1, 3, "other digest")
+    os.remove(os.path.join(tmp_path, "features", "0.md"))
+
+    # Act
+    actual = check_shard_manifests(str(tmp_path), 3, "digest")
+
+    # Assert
+    assert not actual
+    assert [call.args[0] for call in mock_log_error.call_args_list] == [
+        "Shard %d/%d - %d files are missing, e.g. '%s'.",
+        "Shard %d/%d - output was generated from a different source.",
+        "Shard %d/%d - manifest '%s' not found or unreadable.",
+    ]
+
+
+def test_check_shard_manifests_overlapping(mocker, tmp_path):
+    # Arrange - both shards wrote the same page, the download of the second one overwrote the first one
+    mock_log_error = mocker.patch("living_doc_generator.sharding.logger.error")
+    merged_path = os.path.join(tmp_path, "merged")
+    for shard_index in range(2):
+        shard_path = os.path.join(tmp_path, f"shard_{shard_index}")
+        _write_file(os.path.join(shard_path, "features", "Export_PDF", "_index.md"), f"Page {shard_index}")
+        write_shard_manifest(shard_path, shard_index, 2, "digest")
+        shutil.copytree(shard_path, merged_path, dirs_exist_ok=True)
+
+    # Act
+    actual = check_shard_manifests(merged_path, 2, "digest")
+
+    # Assert
+    assert not actual
+    mock_log_error.assert_called_once_with(
+        "Shard %d/%d - %d files are also listed by another shard, e.g. '%s' by shard %d.",
+        1,
+        2,
+        1,
+        "features/Export_PDF/_index.md",
+        0,
+    )
+
+
+# remove_shard_manifests
+
+
+def test_remove_shard_manifests(tmp_path):
+    # Arrange
+    for shard_index in range(2):
+        write_shard_manifest(str(tmp_path), shard_index, 2, "digest")
+
+    # Act
+    remove_shard_manifests(str(tmp_path), 2)
+
+    # Assert
+    assert os.listdir(tmp_path) == []
@@ -15,7 +15,9 @@
 #
 import os
 
-from action_inputs import ActionInputs
+import pytest
+
+from action_inputs import ActionConfiguration, ActionInputs
 
 
 # Check Action Inputs default values
@@ -29,6 +31,17 @@ def test_report_page_default():
     assert not actual
 
 
+def test_report_json_default(monkeypatch):
+    # Arrange
+    monkeypatch.delenv("INPUT_REPORT_JSON", raising=False)
+
+    # Act
+    actual = ActionInputs.is_report_json_generation_enabled()
+
+    # Assert
+    assert not actual
+
+
 def test_get_source_returns_env_value(monkeypatch):
     # Arrange
     monkeypatch.setenv("INPUT_SOURCE", "my_source.json")
@@ -57,6 +70,116 @@ def test_structured_output_default():
     assert not actual
 
 
+def test_parallel_mode_default(monkeypatch):
+    # Arrange
+    monkeypatch.delenv("INPUT_PARALLEL_MODE", raising=False)
+
+    # Act
+    actual = ActionInputs.get_parallel_mode()
+
+    # Assert
+    assert actual == "off"
+
+
+def test_get_parallel_mode_normalized(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_PARALLEL_MODE", " Threads ")
+
+    # Act
+    actual = ActionInputs.get_parallel_mode()
+
+    # Assert
+    assert actual == "threads"
+
+
+def test_get_parallel_workers(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_PARALLEL_WORKERS", "8")
+
+    # Act
+    actual = ActionInputs.get_parallel_workers()
+
+    # Assert
+    assert actual == 8
+
+
+def test_get_parallel_workers_invalid(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_PARALLEL_WORKERS", "many")
+
+    # Act
+    actual = ActionInputs.get_parallel_workers()
+
+    # Assert
+    assert actual == -1
+
+
+def test_get_profiling_mode_default(monkeypatch):
+    # Arrange
+    monkeypatch.delenv("INPUT_PROFILING", raising=False)
+
+    # Act
+    actual = ActionInputs.get_profiling_mode()
+
+    # Assert
+    assert actual == "off"
+
+
+def test_get_profiling_mode_normalized(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_PROFILING", " FULL ")
+
+    # Act
+    actual = ActionInputs.get_profiling_mode()
+
+    # Assert
+    assert actual == "full"
+
+
+def test_get_archive_format_normalized(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_ARCHIVE", " TAR.GZ ")
+
+    # Act
+    actual = ActionInputs.get_archive_format()
+
+    # Assert
+    assert actual == "tar.gz"
+
+
+def test_get_release_labels(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_RELEASE_LABELS", " DocumentedFeature, ,DocumentedUserStory ")
+
+    # Act
+    actual = ActionInputs.get_release_labels()
+
+    # Assert
+    assert actual == ("DocumentedFeature", "DocumentedUserStory")
+
+
+def test_get_issue_filter(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_ISSUE_FILTER", ' state == "open" ')
+
+    # Act
+    actual = ActionInputs.get_issue_filter()
+
+    # Assert
+    assert actual == 'state == "open"'
+
+
+def test_get_index_sort_columns_normalized(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_INDEX_SORT", " Repository, NUMBER ,, ")
+
+    # Act
+    actual = ActionInputs.get_index_sort_columns()
+
+    # Assert
+    assert actual == ("repository", "number")
+
+
 # _validate
 
 
@@ -129,3 +252,174 @@ def test_validate_source_not_found(mocker):
         any_order=False,
     )
     mock_log_debug.assert_not_called()
+
+
+def test_validate_parallel_inputs_invalid(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_parallel_mode", return_value="fibers")
+    mocker.patch("action_inputs.ActionInputs.get_parallel_workers", return_value=-1)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_has_calls(
+        [
+            mocker.call(
+                "Parallel mode '%s' is not supported. Supported modes: %s.", "fibers", "off, threads, processes"
+            ),
+            mocker.call("Parallel workers input must be a non-negative integer."),
+            mocker.call("User configuration validation failed."),
+        ],
+        any_order=False,
+    )
+
+
+def test_validate_profiling_mode_invalid(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_profiling_mode", return_value="gpu")
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_has_calls(
+        [
+            mocker.call("Profiling mode '%s' is not supported. Supported modes: %s.", "gpu", "off, cpu, full"),
+            mocker.call("User configuration validation failed."),
+        ],
+        any_order=False,
+    )
+
+
+def test_validate_archive_with_incremental_generation(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_archive_format", return_value="zip")
+    mocker.patch("action_inputs.ActionInputs.is_incremental_generation_enabled", return_value=True)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_has_calls(
+        [
+            mocker.call("Incremental generation cannot be combined with the archive output."),
+            mocker.call("User configuration validation failed."),
+        ],
+        any_order=False,
+    )
+
+
+def test_validate_shard_index_out_of_range(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_shard_count", return_value=4)
+    mocker.patch("action_inputs.ActionInputs.get_shard_index", return_value=4)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call("Shard index input must be an integer from 0 to %d.", 3)
+
+
+def test_validate_shard_merge_without_shards(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.is_shard_merge_enabled", return_value=True)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call("Shard merge requires the shard count greater than 1.")
+
+
+def test_validate_index_inputs_invalid(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_index_sort_columns", return_value=("number", "state"))
+    mocker.patch("action_inputs.ActionInputs.get_index_page_size", return_value=-1)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "Index sort columns '%s' are not supported. Supported columns: %s.",
+        "state",
+        "organization, repository, number, title",
+    )
+    mock_log_error.assert_any_call("Index page size input must be a non-negative integer.")
+
+
+def test_validate_issue_filter_invalid(mocker, tmp_path):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{}")
+    mocker.patch("action_inputs.ActionInputs.get_source", return_value=str(source_file))
+    mocker.patch("action_inputs.ActionInputs.get_issue_filter", return_value='milestone == "v1"')
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    assert mock_log_error.call_args_list[0].args[0] == "Issue filter input is not valid: %s"
+    assert "Unknown field 'milestone'" in str(mock_log_error.call_args_list[0].args[1])
+
+
+# get_configuration
+
+
+def test_get_configuration(monkeypatch):
+    # Arrange
+    for name in ("RELEASE", "INCREMENTAL", "STREAMING", "VERBOSE_LOGGING"):
+        monkeypatch.delenv(f"INPUT_{name}", raising=False)
+    monkeypatch.setenv("INPUT_SOURCE", "/path/to/source.json")
+    monkeypatch.setenv("INPUT_STRUCTURED_OUTPUT", "true")
+    monkeypatch.setenv("INPUT_REPORT_PAGE", "TRUE")
+    monkeypatch.setenv("INPUT_PARALLEL_MODE", " Threads ")
+    monkeypatch.setenv("INPUT_PARALLEL_WORKERS", "4")
+
+    # Act
+    configuration = ActionInputs.get_configuration()
+
+    # Assert
+    assert configuration == ActionConfiguration(
+        source="/path/to/source.json",
+        structured_output_enabled=True,
+        report_page_enabled=True,
+        parallel_mode="threads",
+        parallel_workers=4,
+    )
+    with pytest.raises(AttributeError):
+        configuration.structured_output_enabled = False
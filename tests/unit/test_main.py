@@ -14,9 +14,39 @@
 # limitations under the License.
 #
 import os
+import subprocess
+import sys
 
+from living_doc_generator.instrumentation import Instrumentation
 from main import run
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules which must not be loaded before there is something to generate
+HEAVY_MODULES = (
+    "living_doc_generator.living_doc_generator",
+    "living_doc_generator.mdoc_exporter",
+    "living_doc_utilities.model.issues",
+    "multiprocessing",
+    "ijson",
+)
+
+def _run_python(code: str, cwd: str, **env: str) -> subprocess.CompletedProcess:
+    process_env = {**os.environ, "PYTHONPATH": PROJECT_ROOT, **env}
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=cwd, env=process_env, capture_output=True, text=True
+    )
+
+
+def _imported_modules(importtime_output: str) -> dict[str, int]:
+    modules: dict[str, int] = {}
+    for line in importtime_output.splitlines():
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            _, cumulative, name = line[len("import time:") :].split("|")
+            if cumulative.strip().isdigit():
+                modules[name.strip()] = int(cumulative)
+    return modules
+
 
 # run
 
@@ -24,9 +54,11 @@ from main import run
 def test_run_correct_behaviour(mocker):
     # Arrange
     mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=True)
-    mock_generator = mocker.patch("main.MdocLivingDocumentationGenerator")
+    mock_generator = mocker.patch("living_doc_generator.living_doc_generator.MdocLivingDocumentationGenerator")
     mock_generator.return_value.generate.return_value = True
+    mock_generator.return_value.instrumentation = Instrumentation()
     mocker.patch("main.make_absolute_path", return_value="/unit/test/output/path")
+    mocker.patch("main.set_action_output")
 
     mock_log_info = mocker.patch("logging.getLogger").return_value.info
     mocker.patch.dict(
@@ -57,7 +89,10 @@ def test_run_correct_behaviour(mocker):
 def test_validate_user_configuration_failed(mocker):
     # Arrange
     mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=False)
+    mock_generator = mocker.patch("living_doc_generator.living_doc_generator.MdocLivingDocumentationGenerator")
+    mock_generator.return_value.instrumentation = Instrumentation()
     mocker.patch("main.make_absolute_path", return_value="/unit/test/output/path")
+    mocker.patch("main.set_action_output")
 
     mock_logger = mocker.Mock()
     mocker.patch("logging.getLogger", return_value=mock_logger)
@@ -76,9 +111,11 @@ def test_validate_user_configuration_failed(mocker):
 def test_generate_failed(mocker):
     # Arrange
     mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=True)
-    mock_generator = mocker.patch("main.MdocLivingDocumentationGenerator")
+    mock_generator = mocker.patch("living_doc_generator.living_doc_generator.MdocLivingDocumentationGenerator")
     mock_generator.return_value.generate.return_value = False
+    mock_generator.return_value.instrumentation = Instrumentation()
     mocker.patch("main.make_absolute_path", return_value="/unit/test/output/path")
+    mocker.patch("main.set_action_output")
 
     mock_logger = mocker.Mock()
     mocker.patch("logging.getLogger", return_value=mock_logger)
@@ -94,3 +131,94 @@ def test_generate_failed(mocker):
     mock_logger.info.assert_any_call("Living Documentation generator - mdoc - ending.")
     mock_logger.error.assert_any_call("Living Documentation generator - mdoc - generation failed.")
     mock_exit.assert_called_once_with(1)
+
+
+def test_run_with_profiling(mocker, tmp_path):
+    # Arrange
+    mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=True)
+    mock_generator = mocker.patch("living_doc_generator.living_doc_generator.MdocLivingDocumentationGenerator")
+    mock_generator.return_value.generate.return_value = True
+    mock_generator.return_value.instrumentation = Instrumentation()
+    mock_generator.return_value.timing_report_path = "/unit/test/output/path_timing.json"
+    mocker.patch("main.make_absolute_path", return_value=os.path.join(tmp_path, "mdoc"))
+    mock_set_action_output = mocker.patch("main.set_action_output")
+    mocker.patch.dict(os.environ, {"INPUT_PROFILING": "full"})
+
+    # Act
+    run()
+
+    # Assert
+    mock_generator.return_value.generate.assert_called_once()
+    mock_set_action_output.assert_any_call("profile-path", os.path.join(tmp_path, "mdoc_profile.pstats"))
+    mock_set_action_output.assert_any_call("memory-profile-path", os.path.join(tmp_path, "mdoc_memory_profile.txt"))
+    assert os.path.isfile(os.path.join(tmp_path, "mdoc_profile.pstats"))
+    assert os.path.isfile(os.path.join(tmp_path, "mdoc_memory_profile.txt"))
+
+
+def test_run_with_archive_sets_archive_path(mocker):
+    # Arrange
+    mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=True)
+    mock_generator = mocker.patch("living_doc_generator.living_doc_generator.MdocLivingDocumentationGenerator")
+    mock_generator.return_value.generate.return_value = True
+    mock_generator.return_value.instrumentation = Instrumentation()
+    mock_generator.return_value.archive_path = "/unit/test/output/path.zip"
+    mocker.patch("main.make_absolute_path", return_value="/unit/test/output/path")
+    mock_set_action_output = mocker.patch("main.set_action_output")
+
+    # Act
+    run()
+
+    # Assert
+    mock_set_action_output.assert_any_call("archive-path", "/unit/test/output/path.zip")
+
+
+def test_run_empty_source_generates_output(mocker, tmp_path):
+    # Arrange
+    source_file = tmp_path / "source.json"
+    source_file.write_text("{ }")
+    output_path = os.path.join(tmp_path, "mdoc")
+    mocker.patch("action_inputs.ActionInputs.validate_user_configuration", return_value=True)
+    mocker.patch("main.make_absolute_path", return_value=output_path)
+    mock_set_action_output = mocker.patch("main.set_action_output")
+    mock_exit = mocker.patch("sys.exit")
+    mocker.patch.dict(os.environ, {"INPUT_SOURCE": str(source_file)})
+
+    # Act
+    run()
+
+    # Assert
+    mock_exit.assert_not_called()
+    mock_set_action_output.assert_any_call("output-path", output_path)
+    mock_set_action_output.assert_any_call("timing-report-path", f"{output_path}_timing.json")
+    mock_set_action_output.assert_any_call("pages-count", "0")
+    mock_set_action_output.assert_any_call("errors-count", "0")
+    assert os.path.isfile(f"{output_path}_timing.json")
+
+
+# startup
+
+
+def test_import_main_skips_heavy_modules(tmp_path):
+    # Act
+    result = _run_python("import main", str(tmp_path))
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    modules = _imported_modules(result.stderr)
+    assert [module for module in HEAVY_MODULES if module in modules] == []
+
+
+def test_run_validation_failure_exits_before_loading_generator(tmp_path):
+    # Arrange
+    source_path = os.path.join(tmp_path, "source.json")
+    code = "import main\ntry:\n    main.run()\nexcept SystemExit:\n    pass"
+
+    # Act
+    result = _run_python(
+        code, str(tmp_path), INPUT_SOURCE=source_path, GITHUB_OUTPUT=os.path.join(tmp_path, "github_output.txt")
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    modules = _imported_modules(result.stderr)
+    assert [module for module in HEAVY_MODULES if module in modules] == []
@@ -0,0 +1,143 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import gzip
+import os
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from utils.archive_writer import ArchiveWriter
+
+
+def _write_pages(archive_writer: ArchiveWriter, output_path: str, relative_paths: list[str]) -> None:
+    for relative_path in relative_paths:
+        archive_writer.write(os.path.join(output_path, *relative_path.split("/")), f"Page {relative_path}")
+
+
+# __init__
+
+
+def test_init_unsupported_format(tmp_path):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unsupported archive format: 'rar'."):
+        ArchiveWriter(os.path.join(tmp_path, "mdoc"), "rar")
+
+
+# write
+
+
+def test_write_keeps_output_directory_untouched(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    archive_writer = ArchiveWriter(output_path, "zip")
+
+    # Act
+    written_bytes = archive_writer.write(os.path.join(output_path, "features", "_index.md"), "Page 🟢")
+
+    # Assert
+    assert written_bytes == len("Page 🟢".encode("utf-8"))
+    assert archive_writer.written_count == 1
+    assert not os.path.exists(output_path)
+
+
+# save
+
+
+def test_save_tar_gz_entries_are_sorted_with_fixed_metadata(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    archive_path = os.path.join(tmp_path, "mdoc.tar.gz")
+    archive_writer = ArchiveWriter(output_path, "tar.gz")
+    _write_pages(archive_writer, output_path, ["user_stories/_index.md", "features/_index.md", "_index.md"])
+
+    # Act
+    archive_writer.save(archive_path)
+
+    # Assert
+    with tarfile.open(archive_path) as tar:
+        members = tar.getmembers()
+        assert [member.name for member in members] == ["_index.md", "features/_index.md", "user_stories/_index.md"]
+        assert {(member.mtime, member.mode, member.uid, member.gid) for member in members} == {(315532800, 0o644, 0, 0)}
+        assert tar.extractfile("features/_index.md").read() == b"Page features/_index.md"
+    with gzip.open(archive_path) as gz:
+        gz.read()
+        assert gz.mtime == 315532800
+
+
+def test_save_zip_entries_are_sorted_with_fixed_metadata(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    archive_path = os.path.join(tmp_path, "mdoc.zip")
+    archive_writer = ArchiveWriter(output_path, "zip")
+    _write_pages(archive_writer, output_path, ["user_stories/_index.md", "_index.md"])
+
+    # Act
+    archive_writer.save(archive_path)
+
+    # Assert
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.namelist() == ["_index.md", "user_stories/_index.md"]
+        assert {info.date_time for info in archive.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert archive.read("_index.md") == b"Page _index.md"
+
+
+@pytest.mark.parametrize("archive_format", ["tar.gz", "zip"])
+def test_save_rewritten_entry_keeps_latest_content(tmp_path, archive_format):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    archive_path = os.path.join(tmp_path, f"mdoc.{archive_format}")
+    archive_writer = ArchiveWriter(output_path, archive_format)
+    _write_pages(archive_writer, output_path, ["b.md", "a.md"])
+    archive_writer.write(os.path.join(output_path, "b.md"), "Rewritten page")
+
+    # Act
+    archive_writer.save(archive_path)
+
+    # Assert
+    if archive_format == "zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            assert [(name, archive.read(name)) for name in archive.namelist()] == [
+                ("a.md", b"Page a.md"),
+                ("b.md", b"Rewritten page"),
+            ]
+    else:
+        with tarfile.open(archive_path) as tar:
+            assert [(name, tar.extractfile(name).read()) for name in tar.getnames()] == [
+                ("a.md", b"Page a.md"),
+                ("b.md", b"Rewritten page"),
+            ]
+
+
+@pytest.mark.parametrize("archive_format", ["tar.gz", "zip"])
+def test_save_is_reproducible(mocker, tmp_path, archive_format):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    first_writer = ArchiveWriter(output_path, archive_format)
+    _write_pages(first_writer, output_path, ["a.md", "b/c.md", "b/d.md"])
+    second_writer = ArchiveWriter(output_path, archive_format)
+    _write_pages(second_writer, output_path, ["b/d.md", "a.md", "b/c.md"])
+    first_writer.save(os.path.join(tmp_path, f"first.{archive_format}"))
+    mocker.patch("time.time", return_value=time.time() + 3600)
+
+    # Act
+    second_writer.save(os.path.join(tmp_path, f"second.{archive_format}"))
+
+    # Assert
+    with open(os.path.join(tmp_path, f"first.{archive_format}"), "rb") as first:
+        with open(os.path.join(tmp_path, f"second.{archive_format}"), "rb") as second:
+            assert first.read() == second.read()
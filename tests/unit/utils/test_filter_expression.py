@@ -0,0 +1,90 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from utils.filter_expression import compile_filter_expression
+
+ISSUE_DATA = {
+    "type": "FeatureIssue",
+    "repository_id": "My-Org/repo-a",
+    "title": "Export of the reports",
+    "issue_number": 42,
+    "state": "OPEN",
+    "labels": ["DocumentedFeature", "backend"],
+    "updated_at": "2025-03-01T10:00:00Z",
+}
+
+
+# compile_filter_expression
+
+
+@pytest.mark.parametrize("expression,expected", [
+    ('state == "open"', True),
+    ("state != 'open'", False),
+    ('organization == "my-org"', True),
+    ('repository in ["repo-b", "REPO-A"]', True),
+    ('labels contains "documentedfeature"', True),
+    ('labels contains "frontend"', False),
+    ('title contains "report"', True),
+    ("issue_number >= 42 and issue_number < 100", True),
+    ('updated_at >= "2025-01-01"', True),
+    ('closed_at < "2025-01-01"', False),
+    ('issue_number > "10"', False),
+    ('not state == "open" or type == "FeatureIssue"', True),
+    ('state == "closed" or (organization == "my-org" and not labels contains "backend")', False),
+    ('state == "closed" AND organization == "my-org" OR issue_number == 42', True),
+])
+def test_compile_filter_expression(expression, expected):
+    # Arrange
+    predicate = compile_filter_expression(expression)
+
+    # Act
+    actual = predicate(ISSUE_DATA)
+
+    # Assert
+    assert actual == expected
+
+
+def test_compile_filter_expression_escaped_quote():
+    # Arrange
+    predicate = compile_filter_expression(r'title == "say \"hi\""')
+
+    # Act
+    actual = predicate({"title": 'Say "Hi"'})
+
+    # Assert
+    assert actual
+
+
+@pytest.mark.parametrize("expression,message", [
+    ("", "The filter expression is empty."),
+    ('milestone == "v1"', "Unknown field 'milestone'"),
+    ('state = "open"', "Unexpected character '='"),
+    ('state "open"', "Unknown operator 'open'"),
+    ('state in "open"', "Operator 'in' expects a list"),
+    ('(state == "open"', "Missing ')'"),
+    ('state in ["open", "closed"', "Missing ']'"),
+    ('state == "open" organization', "Unexpected 'organization'"),
+    ("state == open", "Unexpected 'open'"),
+    ("state ==", "The filter expression ended, a value expected."),
+])
+def test_compile_filter_expression_invalid(expression, message):
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        compile_filter_expression(expression)
+
+    # Assert
+    assert message in str(exc_info.value)
@@ -0,0 +1,197 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import subprocess
+
+from utils.output_staging import OutputStaging, StagingPageWriter
+
+
+def _write_file(file_path: str, content: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+# prepare
+
+
+def test_prepare_removes_leftovers_of_interrupted_run(tmp_path):
+    # Arrange
+    output_staging = OutputStaging(os.path.join(tmp_path, "mdoc"))
+    os.makedirs(output_staging.output_path)
+    os.makedirs(os.path.join(output_staging.staging_path, "features"))
+    os.makedirs(output_staging.previous_path)
+
+    # Act
+    output_staging.prepare()
+
+    # Assert
+    assert os.listdir(output_staging.staging_path) == []
+    assert not os.path.exists(output_staging.previous_path)
+    assert os.path.isdir(output_staging.output_path)
+
+
+def test_prepare_restores_previous_output_of_interrupted_swap(tmp_path):
+    # Arrange - the run stopped after moving the output aside and before moving the staged output in
+    output_staging = OutputStaging(os.path.join(tmp_path, "mdoc"))
+    os.makedirs(os.path.join(output_staging.staging_path, "features"))
+    os.makedirs(output_staging.previous_path)
+    _write_file(os.path.join(output_staging.previous_path, "_index.md"), "Previous page")
+
+    # Act
+    output_staging.prepare()
+
+    # Assert
+    assert os.listdir(output_staging.output_path) == ["_index.md"]
+    assert os.listdir(output_staging.staging_path) == []
+    assert not os.path.exists(output_staging.previous_path)
+
+
+# commit
+
+
+def test_commit_swaps_staged_output_and_removes_previous(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    _write_file(os.path.join(output_path, "stale.md"), "Stale page")
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    _write_file(os.path.join(output_staging.staging_path, "_index.md"), "New page")
+
+    # Act
+    output_staging.commit()
+    output_staging.wait_for_cleanup()
+
+    # Assert
+    assert os.listdir(output_path) == ["_index.md"]
+    assert not os.path.exists(output_staging.staging_path)
+    assert not os.path.exists(output_staging.previous_path)
+
+
+def test_commit_removes_previous_in_own_session(mocker, tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    mock_popen = mocker.patch("utils.output_staging.subprocess.Popen", wraps=subprocess.Popen)
+
+    # Act
+    output_staging.commit()
+    output_staging.wait_for_cleanup()
+
+    # Assert
+    assert mock_popen.call_args.args[0][-1] == output_staging.previous_path
+    assert mock_popen.call_args.kwargs["start_new_session"]
+    assert not os.path.exists(output_staging.previous_path)
+
+
+def test_commit_removes_previous_when_process_fails_to_start(mocker, tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    mocker.patch("utils.output_staging.subprocess.Popen", side_effect=OSError("No interpreter"))
+
+    # Act
+    output_staging.commit()
+
+    # Assert
+    assert os.path.isdir(output_path)
+    assert not os.path.exists(output_staging.previous_path)
+
+
+def test_commit_without_previous_output(tmp_path):
+    # Arrange
+    output_staging = OutputStaging(os.path.join(tmp_path, "mdoc"))
+    output_staging.prepare()
+
+    # Act
+    output_staging.commit()
+    output_staging.wait_for_cleanup()
+
+    # Assert
+    assert os.path.isdir(output_staging.output_path)
+    assert not os.path.exists(output_staging.staging_path)
+
+
+# discard
+
+
+def test_discard_keeps_previous_output(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    _write_file(os.path.join(output_path, "_index.md"), "Previous page")
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    _write_file(os.path.join(output_staging.staging_path, "_index.md"), "Partial page")
+
+    # Act
+    output_staging.discard()
+
+    # Assert
+    with open(os.path.join(output_path, "_index.md"), "r", encoding="utf-8") as f:
+        assert f.read() == "Previous page"
+    assert not os.path.exists(output_staging.staging_path)
+
+
+# StagingPageWriter.write
+
+
+def test_staging_write_links_identical_file(tmp_path):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    current_page = os.path.join(output_path, "_index.md")
+    _write_file(current_page, "Page content")
+    os.utime(current_page, ns=(10**9, 10**9))
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    page_writer = StagingPageWriter(output_staging)
+    staged_page = os.path.join(output_staging.staging_path, "_index.md")
+
+    # Act
+    written_bytes = page_writer.write(staged_page, "Page content")
+
+    # Assert
+    assert written_bytes == 0
+    assert page_writer.skipped_count == 1
+    assert os.path.samefile(current_page, staged_page)
+    assert os.stat(staged_page).st_mtime_ns == 10**9
+
+
+def test_staging_write_changed_file(tmp_path, mocker):
+    # Arrange
+    output_path = os.path.join(tmp_path, "mdoc")
+    os.makedirs(output_path)
+    _write_file(os.path.join(output_path, "_index.md"), "Old content")
+    output_staging = OutputStaging(output_path)
+    output_staging.prepare()
+    page_writer = StagingPageWriter(output_staging)
+    staged_page = os.path.join(output_staging.staging_path, "_index.md")
+    spy_link = mocker.spy(os, "link")
+
+    # Act
+    written_bytes = page_writer.write(staged_page, "New content")
+
+    # Assert
+    assert written_bytes == len("New content")
+    assert page_writer.written_count == 1
+    spy_link.assert_not_called()
+    with open(staged_page, "r", encoding="utf-8") as f:
+        assert f.read() == "New content"
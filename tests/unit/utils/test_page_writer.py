@@ -0,0 +1,91 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import builtins
+import os
+
+from utils.page_writer import PageWriter
+
+
+def _write_file(file_path: str, content: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+# write
+
+
+def test_write_new_file(tmp_path):
+    # Arrange
+    page_writer = PageWriter()
+    file_path = os.path.join(tmp_path, "page.md")
+
+    # Act
+    written_bytes = page_writer.write(file_path, "Page 🟢")
+
+    # Assert
+    assert written_bytes == len("Page 🟢".encode("utf-8"))
+    assert page_writer.written_count == 1
+    assert page_writer.skipped_count == 0
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert f.read() == "Page 🟢"
+
+
+def test_write_identical_content_is_skipped(tmp_path):
+    # Arrange
+    page_writer = PageWriter()
+    file_path = os.path.join(tmp_path, "page.md")
+    _write_file(file_path, "Page content")
+    os.utime(file_path, ns=(10**9, 10**9))
+
+    # Act
+    written_bytes = page_writer.write(file_path, "Page content")
+
+    # Assert
+    assert written_bytes == 0
+    assert page_writer.skipped_count == 1
+    assert os.stat(file_path).st_mtime_ns == 10**9
+
+
+def test_write_same_size_different_content(tmp_path):
+    # Arrange
+    page_writer = PageWriter()
+    file_path = os.path.join(tmp_path, "page.md")
+    _write_file(file_path, "Page content A")
+
+    # Act
+    written_bytes = page_writer.write(file_path, "Page content B")
+
+    # Assert
+    assert written_bytes == len("Page content B")
+    assert page_writer.written_count == 1
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert f.read() == "Page content B"
+
+
+def test_write_different_size_does_not_read_file(tmp_path, mocker):
+    # Arrange
+    page_writer = PageWriter()
+    file_path = os.path.join(tmp_path, "page.md")
+    _write_file(file_path, "Short")
+    spy_open = mocker.spy(builtins, "open")
+
+    # Act
+    page_writer.write(file_path, "Much longer content")
+
+    # Assert
+    assert [call.args[1] for call in spy_open.call_args_list] == ["wb"]
+    assert page_writer.written_count == 1
+
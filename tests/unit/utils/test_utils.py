@@ -17,6 +17,7 @@ import os
 
 import pytest
 
+from utils.page_writer import PageWriter
 from utils.utils import make_issue_key, sanitize_filename, generate_root_level_index_page, load_template, \
     make_absolute_path
 
@@ -47,6 +48,8 @@ def test_make_issue_key():
             "filename   with   spaces.txt",
             "filename_with_spaces.txt",
         ),  # Reduce consecutive spaces to a single space and replace spaces with '_'
+        ("Export: PDF (v2) . . report", "Export_PDF_v2_._._report"),  # Runs left after removing characters
+        ("plain_name.md", "plain_name.md"),
     ],
 )
 def test_sanitize_filename(filename_example, expected_filename):
@@ -70,22 +73,33 @@ def test_make_absolute_path_with_absolute_path():
 # generate_root_level_index_page
 
 
-def test_generate_root_level_index_page(mocker):
+def test_generate_root_level_index_page(tmp_path):
     # Arrange
     index_root_level_page = "Root Level Template Content"
-    output_path = "/base/output"
-
-    mocker.patch("os.path.exists", return_value=False)  # Pretend the directory doesn't exist
-    mocker.patch("os.makedirs")  # Prevent actual directory creation
-    mock_open = mocker.patch("builtins.open", mocker.mock_open())   # Mock file open/write
+    output_path = os.path.join(tmp_path, "output")
 
     # Act
+    written_bytes = generate_root_level_index_page(index_root_level_page, output_path)
+
+    # Assert
+    assert written_bytes == len(index_root_level_page)
+    with open(os.path.join(output_path, "_index.md"), "r", encoding="utf-8") as f:
+        assert f.read() == index_root_level_page
+
+
+def test_generate_root_level_index_page_identical_content_skipped(tmp_path):
+    # Arrange
+    index_root_level_page = "Root Level Template Content"
+    output_path = str(tmp_path)
     generate_root_level_index_page(index_root_level_page, output_path)
+    page_writer = PageWriter()
+
+    # Act
+    written_bytes = generate_root_level_index_page(index_root_level_page, output_path, page_writer)
 
     # Assert
-    mock_open.assert_called_with("/base/output/_index.md", "w", encoding="utf-8")
-    handle = mock_open()
-    handle.write.assert_called_with(index_root_level_page)
+    assert written_bytes == 0
+    assert page_writer.skipped_count == 1
 
 
 # load_template
@@ -0,0 +1,146 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the ArchiveWriter class, which collects the output files into a single reproducible
+archive instead of writing them into the output directory.
+"""
+
+import calendar
+import gzip
+import io
+import logging
+import os
+import tarfile
+import tempfile
+import zipfile
+
+from typing import IO, Optional
+
+from utils.constants import ARCHIVE_ENTRY_DATE_TIME, ARCHIVE_FORMAT_TAR_GZ, ARCHIVE_FORMAT_ZIP
+from utils.page_writer import PageWriter
+
+logger = logging.getLogger(__name__)
+
+# Permissions and modification time (seconds since epoch) of every archive entry
+ARCHIVE_ENTRY_MODE = 0o644
+ARCHIVE_ENTRY_MTIME = calendar.timegm(ARCHIVE_ENTRY_DATE_TIME)
+
+
+class ArchiveWriter(PageWriter):
+    """
+    A class representing the writer of all output files into a single archive. The entries are appended
+    to a temporary spool file as they are produced, only their names and positions are kept in memory.
+    When the archive is saved, they are copied from the spool ordered by their path, with a fixed timestamp,
+    owner and permissions, so the same pages always produce a byte-identical archive.
+    """
+
+    writes_to_disk = False
+
+    def __init__(self, root_path: str, archive_format: str):
+        super().__init__()
+        if archive_format not in (ARCHIVE_FORMAT_TAR_GZ, ARCHIVE_FORMAT_ZIP):
+            raise ValueError(f"Unsupported archive format: '{archive_format}'.")
+
+        self._root_path: str = os.path.abspath(root_path)
+        self._archive_format: str = archive_format
+        # Position and size of the latest content of every entry in the spool file
+        self._entries: dict[str, tuple[int, int]] = {}
+        self._spool: Optional[IO[bytes]] = None
+
+    def write(self, file_path: str, content: str) -> int:
+        """
+        Add the content as an archive entry. The entry name is the path relative to the output directory.
+
+        @param file_path: The path to the file in the output directory.
+        @param content: The file content.
+        @return: The number of added bytes.
+        """
+        data = content.encode("utf-8")
+        entry_name = os.path.relpath(os.path.abspath(file_path), self._root_path).replace(os.sep, "/")
+        with self._lock:
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile()
+            self._entries[entry_name] = (self._spool.seek(0, os.SEEK_END), len(data))
+            self._spool.write(data)
+            self.written_count += 1
+
+        return len(data)
+
+    def save(self, archive_path: str) -> None:
+        """
+        Write all collected entries into the archive file.
+
+        @param archive_path: The path to the archive file.
+        @return: None
+        """
+        entry_names = sorted(self._entries)
+        if self._archive_format == ARCHIVE_FORMAT_ZIP:
+            self._save_zip(archive_path, entry_names)
+        else:
+            self._save_tar_gz(archive_path, entry_names)
+
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        self._entries = {}
+        logger.info("Archive '%s' with %d entries saved.", archive_path, len(entry_names))
+
+    def _read_entry(self, entry_name: str) -> bytes:
+        """
+        Read the latest content of the entry from the spool file.
+
+        @param entry_name: The entry name.
+        @return: The entry content.
+        """
+        position, size = self._entries[entry_name]
+        assert self._spool is not None
+        self._spool.seek(position)
+        return self._spool.read(size)
+
+    def _save_tar_gz(self, archive_path: str, entry_names: list[str]) -> None:
+        """
+        Write the entries into a gzipped tar archive. The gzip header carries no file name and a fixed time.
+
+        @param archive_path: The path to the archive file.
+        @param entry_names: The ordered entry names.
+        @return: None
+        """
+        with open(archive_path, "wb") as f, gzip.GzipFile("", "wb", fileobj=f, mtime=ARCHIVE_ENTRY_MTIME) as gz:
+            with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+                for entry_name in entry_names:
+                    data = self._read_entry(entry_name)
+                    tar_info = tarfile.TarInfo(entry_name)
+                    tar_info.size = len(data)
+                    tar_info.mtime = ARCHIVE_ENTRY_MTIME
+                    tar_info.mode = ARCHIVE_ENTRY_MODE
+                    tar.addfile(tar_info, io.BytesIO(data))
+
+    def _save_zip(self, archive_path: str, entry_names: list[str]) -> None:
+        """
+        Write the entries into a deflated zip archive.
+
+        @param archive_path: The path to the archive file.
+        @param entry_names: The ordered entry names.
+        @return: None
+        """
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for entry_name in entry_names:
+                zip_info = zipfile.ZipInfo(entry_name, date_time=ARCHIVE_ENTRY_DATE_TIME)
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+                zip_info.create_system = 3  # Unix, so the permissions below are used on every platform
+                zip_info.external_attr = ARCHIVE_ENTRY_MODE << 16
+                archive.writestr(zip_info, self._read_entry(entry_name))
@@ -21,14 +21,100 @@ This module centralises all constants used across the project.
 # General Action inputs
 GITHUB_TOKEN = "GITHUB_TOKEN"
 REPORT_PAGE = "REPORT_PAGE"
+REPORT_JSON = "REPORT_JSON"
 VERBOSE_LOGGING = "VERBOSE_LOGGING"
 RELEASE = "RELEASE"
 SOURCE = "SOURCE"
 STRUCTURED_OUTPUT = "STRUCTURED_OUTPUT"
+PARALLEL_MODE = "PARALLEL_MODE"
+PARALLEL_WORKERS = "PARALLEL_WORKERS"
+INCREMENTAL = "INCREMENTAL"
+STREAMING = "STREAMING"
+PROFILING = "PROFILING"
+ARCHIVE = "ARCHIVE"
+SHARD_INDEX = "SHARD_INDEX"
+SHARD_COUNT = "SHARD_COUNT"
+SHARD_MERGE = "SHARD_MERGE"
+INDEX_SORT = "INDEX_SORT"
+INDEX_PAGE_SIZE = "INDEX_PAGE_SIZE"
+SEARCH_INDEX = "SEARCH_INDEX"
+RELEASE_LABELS = "RELEASE_LABELS"
+ISSUE_FILTER = "ISSUE_FILTER"
+
+# Parallel page generation modes
+PARALLEL_MODE_OFF = "off"
+PARALLEL_MODE_THREADS = "threads"
+PARALLEL_MODE_PROCESSES = "processes"
+SUPPORTED_PARALLEL_MODES = (PARALLEL_MODE_OFF, PARALLEL_MODE_THREADS, PARALLEL_MODE_PROCESSES)
+
+# Profiling modes
+PROFILING_MODE_OFF = "off"
+PROFILING_MODE_CPU = "cpu"
+PROFILING_MODE_FULL = "full"
+SUPPORTED_PROFILING_MODES = (PROFILING_MODE_OFF, PROFILING_MODE_CPU, PROFILING_MODE_FULL)
+
+# Archive output formats
+ARCHIVE_FORMAT_OFF = "off"
+ARCHIVE_FORMAT_TAR_GZ = "tar.gz"
+ARCHIVE_FORMAT_ZIP = "zip"
+SUPPORTED_ARCHIVE_FORMATS = (ARCHIVE_FORMAT_OFF, ARCHIVE_FORMAT_TAR_GZ, ARCHIVE_FORMAT_ZIP)
+
+# Columns the rows of the index page tables can be sorted by
+INDEX_SORT_COLUMN_ORGANIZATION = "organization"
+INDEX_SORT_COLUMN_REPOSITORY = "repository"
+INDEX_SORT_COLUMN_NUMBER = "number"
+INDEX_SORT_COLUMN_TITLE = "title"
+SUPPORTED_INDEX_SORT_COLUMNS = (
+    INDEX_SORT_COLUMN_ORGANIZATION,
+    INDEX_SORT_COLUMN_REPOSITORY,
+    INDEX_SORT_COLUMN_NUMBER,
+    INDEX_SORT_COLUMN_TITLE,
+)
+
+# Number of the pages linked on each side of the current page in the index page navigation
+INDEX_NAVIGATION_WINDOW = 2
+
+# Fixed modification time of every archive entry, the earliest date a zip archive can hold
+ARCHIVE_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Number of the largest allocations listed in the memory profile for every stage
+PROFILING_TOP_ALLOCATIONS = 20
 
 # Regime output paths
 GENERATOR_OUTPUT_PATH = "generator"
 
+# File name of the machine-readable report stored in the output directory
+REPORT_JSON_FILENAME = "report.json"
+
+# Error type of the report rows of the issues whose output path was already used by another issue
+PATH_COLLISION_ERROR_TYPE = "PathCollisionError"
+
+# State of the issues kept by the release filter
+RELEASE_ISSUE_STATE = "closed"
+
+# Search index
+SEARCH_INDEX_FILENAME = "search_index.json"
+SEARCH_INDEX_MIN_TOKEN_LENGTH = 2
+SEARCH_INDEX_MAX_TOKEN_LENGTH = 40
+
+# Suffix of the page manifest file stored next to the output directory
+PAGE_MANIFEST_SUFFIX = "_manifest.json"
+
+# Suffixes of the staging directory of a full run and of the previous output removed after the swap,
+# both stored next to the output directory
+STAGING_OUTPUT_SUFFIX = ".staging"
+PREVIOUS_OUTPUT_SUFFIX = ".previous"
+
+# File name of the shard manifest stored in the output directory of every shard until the merge step
+SHARD_MANIFEST_FILENAME = "_shard_{index}_of_{count}.json"
+
+# Suffix of the timing report file stored next to the output directory
+TIMING_REPORT_SUFFIX = "_timing.json"
+
+# Suffixes of the profiling files stored next to the output directory
+PROFILE_STATS_SUFFIX = "_profile.pstats"
+MEMORY_PROFILE_SUFFIX = "_memory_profile.txt"
+
 # GitHub API constants
 ISSUES_PER_PAGE_LIMIT = 100
 ISSUE_STATE_ALL = "all"
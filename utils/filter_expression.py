@@ -0,0 +1,263 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the compiler of the issue filter expressions. An expression is compiled once into
+a predicate over the raw issue data (the issue value of the source JSON), e.g.:
+
+    organization in ["org-a", "org-b"] and labels contains "DocumentedFeature" and not state == "closed"
+    updated_at >= "2024-01-01" or (repository_id == "org/repo" and issue_number < 100)
+
+Strings are compared case-insensitively, dates are compared as their ISO 8601 strings.
+"""
+
+import re
+
+from typing import Any, Callable, Mapping, Optional
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+# Fields of the raw issue data, the organization and repository names are derived from the repository id
+SOURCE_FIELDS = (
+    "type",
+    "repository_id",
+    "title",
+    "issue_number",
+    "state",
+    "labels",
+    "created_at",
+    "updated_at",
+    "closed_at",
+)
+DERIVED_FIELDS = ("organization", "repository")
+FIELDS = SOURCE_FIELDS + DERIVED_FIELDS
+
+COMPARISON_OPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in", "contains")
+KEYWORDS = ("and", "or", "not") + COMPARISON_OPERATORS
+
+TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<number>-?\d+(?:\.\d+)?)
+        |(?P<symbol>==|!=|<=|>=|<|>|\(|\)|\[|\]|,)
+        |(?P<word>[A-Za-z_]\w*)
+    )""",
+    re.VERBOSE,
+)
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+def _tokenize(expression: str) -> list[tuple[str, Any]]:
+    """
+    Split the expression into the (kind, value) tokens.
+
+    @param expression: The filter expression.
+    @return: The tokens.
+    @raises ValueError: If the expression holds an unexpected character.
+    """
+    tokens: list[tuple[str, Any]] = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            raise ValueError(f"Unexpected character '{expression[position:].lstrip()[0]}' in the filter expression.")
+
+        kind = match.lastgroup or ""
+        text = match.group(kind)
+        if kind == "string":
+            tokens.append((kind, ESCAPE_PATTERN.sub(r"\1", text[1:-1])))
+        elif kind == "number":
+            tokens.append((kind, float(text) if "." in text else int(text)))
+        elif kind == "word" and text.lower() in KEYWORDS:
+            tokens.append(("symbol", text.lower()))
+        else:
+            tokens.append((kind, text))
+        position = match.end()
+
+    return tokens
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Normalize the value for a case-insensitive comparison.
+
+    @param value: The compared value.
+    @return: The lowercase string, the list of the normalized items or the value as is.
+    """
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+
+    return value
+
+
+def _get_field(issue_data: Mapping[str, Any], field: str) -> Any:
+    """
+    Get the normalized value of the field from the raw issue data.
+
+    @param issue_data: The raw issue data.
+    @param field: The field name.
+    @return: The normalized value, None if the issue has no value.
+    """
+    if field in DERIVED_FIELDS:
+        repository_id = issue_data.get("repository_id") or ""
+        if "/" not in repository_id:
+            return None
+        organization_name, repository_name = repository_id.split("/", 1)
+        return _normalize(organization_name if field == "organization" else repository_name)
+
+    return _normalize(issue_data.get(field))
+
+
+def _compare(operator: str, left: Any, right: Any) -> bool:
+    """
+    Compare the normalized field value with the normalized literal.
+
+    @param operator: The comparison operator.
+    @param left: The field value.
+    @param right: The literal value.
+    @return: The comparison result, False if the values cannot be compared.
+    """
+    result = False
+    if operator == "==":
+        result = left == right
+    elif operator == "!=":
+        result = left != right
+    elif operator == "in":
+        result = left is not None and left in right
+    elif operator == "contains":
+        result = isinstance(left, (list, str)) and isinstance(right, str) and right in left
+    elif left is not None and isinstance(left, str) == isinstance(right, str):
+        try:
+            result = {"<": left < right, "<=": left <= right, ">": left > right, ">=": left >= right}[operator]
+        except TypeError:
+            result = False
+
+    return result
+
+
+# pylint: disable=too-few-public-methods
+class _Parser:
+    """
+    The recursive descent parser of the filter expression, building the predicate while parsing:
+
+        expression := term ("or" term)*
+        term       := factor ("and" factor)*
+        factor     := "not" factor | "(" expression ")" | FIELD OPERATOR literal
+        literal    := STRING | NUMBER | "[" (STRING | NUMBER) ("," (STRING | NUMBER))* "]"
+    """
+
+    def __init__(self, tokens: list[tuple[str, Any]]):
+        self._tokens = tokens
+        self._position = 0
+
+    def parse(self) -> Predicate:
+        predicate = self._parse_expression()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected '{self._peek()[1]}' in the filter expression.")  # type: ignore[index]
+        return predicate
+
+    def _peek(self) -> Optional[tuple[str, Any]]:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _next(self, expected: str) -> tuple[str, Any]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"The filter expression ended, {expected} expected.")
+        self._position += 1
+        return token
+
+    def _accept(self, symbol: str) -> bool:
+        if self._peek() == ("symbol", symbol):
+            self._position += 1
+            return True
+        return False
+
+    def _parse_expression(self) -> Predicate:
+        predicates = [self._parse_term()]
+        while self._accept("or"):
+            predicates.append(self._parse_term())
+
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda issue_data: any(predicate(issue_data) for predicate in predicates)
+
+    def _parse_term(self) -> Predicate:
+        predicates = [self._parse_factor()]
+        while self._accept("and"):
+            predicates.append(self._parse_factor())
+
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda issue_data: all(predicate(issue_data) for predicate in predicates)
+
+    def _parse_factor(self) -> Predicate:
+        if self._accept("not"):
+            negated = self._parse_factor()
+            return lambda issue_data: not negated(issue_data)
+
+        if self._accept("("):
+            predicate = self._parse_expression()
+            if not self._accept(")"):
+                raise ValueError("Missing ')' in the filter expression.")
+            return predicate
+
+        kind, field = self._next("a field")
+        if kind != "word" or field not in FIELDS:
+            raise ValueError(f"Unknown field '{field}', expected one of: {', '.join(FIELDS)}.")
+
+        _, operator = self._next("an operator")
+        if operator not in COMPARISON_OPERATORS:
+            raise ValueError(f"Unknown operator '{operator}', expected one of: {', '.join(COMPARISON_OPERATORS)}.")
+
+        literal = _normalize(self._parse_literal())
+        if operator == "in" and not isinstance(literal, list):
+            raise ValueError('Operator \'in\' expects a list, e.g. ["a", "b"].')
+
+        return lambda issue_data: _compare(operator, _get_field(issue_data, field), literal)
+
+    def _parse_literal(self) -> Any:
+        if not self._accept("["):
+            return self._parse_scalar()
+
+        items = [self._parse_scalar()]
+        while self._accept(","):
+            items.append(self._parse_scalar())
+        if not self._accept("]"):
+            raise ValueError("Missing ']' in the filter expression.")
+        return items
+
+    def _parse_scalar(self) -> Any:
+        kind, value = self._next("a value")
+        if kind not in ("string", "number"):
+            raise ValueError(f"Unexpected '{value}', a quoted string or a number expected.")
+        return value
+
+
+def compile_filter_expression(expression: str) -> Predicate:
+    """
+    Compile the filter expression into a predicate over the raw issue data.
+
+    @param expression: The filter expression.
+    @return: The predicate returning True for the issues kept by the filter.
+    @raises ValueError: If the expression is not valid.
+    """
+    if not expression.strip():
+        raise ValueError("The filter expression is empty.")
+
+    return _Parser(_tokenize(expression)).parse()
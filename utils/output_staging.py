@@ -0,0 +1,157 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the OutputStaging class, which lets a full run generate into a staging directory
+swapped in place of the output directory only when the run succeeds, and the StagingPageWriter class
+writing into it.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+from typing import Optional
+
+from utils.constants import PREVIOUS_OUTPUT_SUFFIX, STAGING_OUTPUT_SUFFIX
+from utils.page_writer import PageWriter
+
+logger = logging.getLogger(__name__)
+
+# Removes the directory given as the first argument, run by a detached interpreter
+REMOVE_DIRECTORY_SCRIPT = "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)"
+
+
+class OutputStaging:
+    """
+    A class representing the staging directory of the output directory. It is a sibling of the output
+    directory, so both are on the same filesystem and the swap is a rename. The previous output is removed
+    by a detached process after the swap, readers never see a partially written output directory.
+    """
+
+    def __init__(self, output_path: str):
+        output_base_path = os.path.abspath(output_path).rstrip(os.sep)
+        self.output_path: str = output_base_path
+        self.staging_path: str = f"{output_base_path}{STAGING_OUTPUT_SUFFIX}"
+        self.previous_path: str = f"{output_base_path}{PREVIOUS_OUTPUT_SUFFIX}"
+        self._cleanup_process: Optional[subprocess.Popen] = None
+
+    def prepare(self) -> None:
+        """
+        Create an empty staging directory. Leftovers of an interrupted run, or of a removal which did not
+        finish, are removed first. A run interrupted in the middle of the swap leaves the previous output
+        moved aside without the output directory, the previous output is moved back as the only good copy.
+
+        @return: None
+        """
+        if not os.path.exists(self.output_path) and os.path.isdir(self.previous_path):
+            logger.warning("Restoring the output '%s' moved aside by an interrupted run.", self.output_path)
+            os.rename(self.previous_path, self.output_path)
+
+        for leftover_path in (self.staging_path, self.previous_path):
+            if os.path.exists(leftover_path):
+                logger.warning("Removing '%s' left by an interrupted run.", leftover_path)
+                shutil.rmtree(leftover_path, ignore_errors=True)
+
+        os.makedirs(self.staging_path)
+
+    def commit(self) -> None:
+        """
+        Swap the staging directory in place of the output directory. The previous output is moved aside
+        and removed by a process in its own session, so the run does not wait for the removal and does not
+        stop it when it ends. Whatever the process does not remove is removed by the next run.
+
+        @return: None
+        """
+        if not os.path.isdir(self.output_path):
+            os.rename(self.staging_path, self.output_path)
+            return
+
+        os.rename(self.output_path, self.previous_path)
+        os.rename(self.staging_path, self.output_path)
+
+        try:
+            self._cleanup_process = subprocess.Popen(  # pylint: disable=consider-using-with
+                [sys.executable, "-c", REMOVE_DIRECTORY_SCRIPT, self.previous_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError as e:
+            logger.warning("Previous output could not be removed in the background, removing it now: %s", str(e))
+            shutil.rmtree(self.previous_path, ignore_errors=True)
+            return
+
+        logger.debug("Staged output swapped in, previous output is removed in the background.")
+
+    def discard(self) -> None:
+        """
+        Remove the staging directory and keep the output directory of the previous run.
+
+        @return: None
+        """
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+        logger.debug("Staged output discarded, previous output kept.")
+
+    def wait_for_cleanup(self) -> None:
+        """
+        Wait until the previous output is removed.
+
+        @return: None
+        """
+        if self._cleanup_process is not None:
+            self._cleanup_process.wait()
+
+
+# pylint: disable=too-few-public-methods
+class StagingPageWriter(PageWriter):
+    """
+    A class representing the writer of the output files into the staging directory. A file identical
+    to its counterpart in the current output directory is hard-linked instead of written, so its
+    modification time is kept.
+    """
+
+    def __init__(self, output_staging: OutputStaging):
+        super().__init__()
+        self._output_staging: OutputStaging = output_staging
+
+    def write(self, file_path: str, content: str) -> int:
+        """
+        Write the content into the staged file, or link the identical file of the current output.
+
+        @param file_path: The path to the file in the staging directory, its directory must already exist.
+        @param content: The file content.
+        @return: The number of written bytes, 0 if the identical file was linked.
+        """
+        data = content.encode("utf-8")
+        relative_path = os.path.relpath(os.path.abspath(file_path), self._output_staging.staging_path)
+        current_path = os.path.join(self._output_staging.output_path, relative_path)
+
+        skipped = self._is_identical(current_path, data)
+        if skipped:
+            try:
+                os.link(current_path, file_path)
+            except OSError:
+                # The filesystem does not support hard links
+                shutil.copy2(current_path, file_path)
+        else:
+            with open(file_path, "wb") as f:
+                f.write(data)
+
+        return self._record_write(skipped, len(data))
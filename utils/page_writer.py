@@ -0,0 +1,90 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the PageWriter class, which writes the output files and skips the files
+whose existing content is identical, so their modification time is kept.
+"""
+
+import os
+import threading
+
+
+# pylint: disable=too-few-public-methods
+class PageWriter:
+    """
+    A class representing the writer of all output files. Writing is thread-safe.
+    """
+
+    # The files are written into the output directory, so its directories must exist
+    writes_to_disk: bool = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.written_count: int = 0
+        self.skipped_count: int = 0
+
+    def write(self, file_path: str, content: str) -> int:
+        """
+        Write the content into the file, unless the file already holds the identical bytes.
+
+        @param file_path: The path to the file, its directory must already exist.
+        @param content: The file content.
+        @return: The number of written bytes, 0 if the write was skipped.
+        """
+        data = content.encode("utf-8")
+        skipped = self._is_identical(file_path, data)
+        if not skipped:
+            with open(file_path, "wb") as f:
+                f.write(data)
+
+        return self._record_write(skipped, len(data))
+
+    def _record_write(self, skipped: bool, size: int) -> int:
+        """
+        Count the written or skipped file.
+
+        @param skipped: True if the write was skipped, False otherwise.
+        @param size: The size of the file content in bytes.
+        @return: The number of written bytes, 0 if the write was skipped.
+        """
+        with self._lock:
+            if skipped:
+                self.skipped_count += 1
+            else:
+                self.written_count += 1
+
+        return 0 if skipped else size
+
+    @staticmethod
+    def _is_identical(file_path: str, data: bytes) -> bool:
+        """
+        Check whether the file holds exactly the provided bytes. The size is compared first,
+        so only files of the same size are read.
+
+        @param file_path: The path to the file.
+        @param data: The new file content.
+        @return: True if the file exists with the identical content, False otherwise.
+        """
+        try:
+            if os.stat(file_path).st_size != len(data):
+                return False
+
+            with open(file_path, "rb") as f:
+                return f.read() == data
+        except FileNotFoundError:
+            return False
@@ -23,8 +23,13 @@ import re
 import logging
 from typing import Optional
 
+from utils.page_writer import PageWriter
+
 logger = logging.getLogger(__name__)
 
+INVALID_FILENAME_CHARACTERS = str.maketrans("", "", '<>:"/|?*#{}()`')
+FILENAME_RUN_PATTERN = re.compile(r"\.{2,}| {2,}")
+
 
 def make_issue_key(organization_name: str, repository_name: str, issue_number: int) -> str:
     """
@@ -45,16 +50,13 @@ def sanitize_filename(filename: str) -> str:
     @param filename: The filename to sanitize.
     @return: The sanitized filename
     """
-    # Remove invalid characters for Windows filenames
-    sanitized_name = re.sub(r'[<>:"/|?*#{}()`]', "", filename)
-    # Reduce consecutive periods
-    sanitized_name = re.sub(r"\.{2,}", ".", sanitized_name)
-    # Reduce consecutive spaces to a single space
-    sanitized_name = re.sub(r" {2,}", " ", sanitized_name)
+    # Remove invalid characters for Windows filenames, in a single pass
+    sanitized_name = filename.translate(INVALID_FILENAME_CHARACTERS)
+    # Reduce consecutive periods and consecutive spaces, most names have none, so the pattern is rarely run
+    if ".." in sanitized_name or "  " in sanitized_name:
+        sanitized_name = FILENAME_RUN_PATTERN.sub(lambda match: match.group()[0], sanitized_name)
     # Replace space with '_'
-    sanitized_name = sanitized_name.replace(" ", "_")
-
-    return sanitized_name
+    return sanitized_name.replace(" ", "_")
 
 
 def make_absolute_path(path: str) -> str:
@@ -71,19 +73,22 @@ def make_absolute_path(path: str) -> str:
     return os.path.abspath(path)
 
 
-def generate_root_level_index_page(index_root_level_page: str, output_path: str) -> None:
+def generate_root_level_index_page(
+    index_root_level_page: str, output_path: str, page_writer: Optional[PageWriter] = None
+) -> int:
     """
     Generate the root-level index page for the output living documentation.
 
     @param index_root_level_page: The content of the root-level index page.
     @param output_path: The path to the output directory.
-    @return: None
+    @param page_writer: The writer of the output files, a new one if None.
+    @return: The number of written bytes, 0 if the existing page is identical.
     """
-    if not os.path.exists(output_path):
+    writer: PageWriter = page_writer if page_writer is not None else PageWriter()
+    if writer.writes_to_disk and not os.path.exists(output_path):
         os.makedirs(output_path)
 
-    with open(os.path.join(output_path, "_index.md"), "w", encoding="utf-8") as f:
-        f.write(index_root_level_page)
+    return writer.write(os.path.join(output_path, "_index.md"), index_root_level_page)
 
 
 def load_template(file_path: str, error_message: str) -> Optional[str]: